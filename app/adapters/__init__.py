@@ -12,15 +12,20 @@ S3 storage, Redis Streams event bus).
 
 from .jwt_token import JWTTokenAdapter
 from .noop_event_bus import NoopEventBus
+from .buffered_event_bus import BufferedEventBus
+from .system_clock import SystemClock
 from .policy_evaluator import HexIamBitmaskEvaluator
 from .access_control import EdgeAccessControl, HybridAccessControl, PDPAccessControl
 from .auth import HEXIAMAuthenticator
 from .persistence import PostgresStorage, MemoryStorage
 from .authz import ClaimsAuthorizer
+from .revocation import MemoryRevocationStore, RedisRevocationStore, PostgresRevocationStore
 
 __all__ = [
     "JWTTokenAdapter",
     "NoopEventBus",
+    "BufferedEventBus",
+    "SystemClock",
     "HEXIAMAuthenticator",
     "HybridAccessControl",
     "HexIamBitmaskEvaluator",
@@ -29,4 +34,7 @@ __all__ = [
     "ClaimsAuthorizer",
     "EdgeAccessControl",
     "PDPAccessControl",
+    "MemoryRevocationStore",
+    "RedisRevocationStore",
+    "PostgresRevocationStore",
 ]
@@ -1,8 +1,10 @@
+from .caching import CachingAccessControl
 from .edge import EdgeAccessControl
 from .hybrid import HybridAccessControl
 from .pdp import PDPAccessControl
 
 __all__ = [
+    "CachingAccessControl",
     "EdgeAccessControl",
     "HybridAccessControl",
     "PDPAccessControl",
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Mapping, Optional
+
+from app.adapters.access_control.decision_cache import DecisionCache, decision_key
+from app.adapters.access_control.shared_cache import CacheStats, RedisDecisionStore
+from app.ports.access_control import AccessControlPort, ResourceCtx
+from app.ports.authn import Principal
+
+
+class CachingAccessControl(AccessControlPort):
+    """
+    Memoizes allowed decisions of any :class:`AccessControlPort`.
+
+    A hit skips token verification and policy evaluation entirely.  Only
+    successful results are cached (denials propagate and are re-checked
+    next time); entries never outlive the token's ``exp`` and concurrent
+    misses for one key share a single call to ``inner``.
+
+    With a ``shared`` Redis tier, local misses are looked up there before
+    calling ``inner``, and every decision ``inner`` makes is written back
+    for the other workers.
+    """
+
+    def __init__(self, inner: AccessControlPort, cache: DecisionCache,
+                 shared: Optional[RedisDecisionStore] = None) -> None:
+        self.inner = inner
+        self.cache = cache
+        self.shared = shared
+        self.stats = CacheStats()
+
+    async def authorize(self, *, bearer_token: str, action: str, resource: Optional[ResourceCtx] = None,
+                        context: Optional[Mapping[str, Any]] = None) -> Principal:
+        key = decision_key(bearer_token, action, resource, context)
+        principal = self.cache.get(key)
+        if principal is not None:
+            self.stats.l1_hits += 1
+            return principal
+        return await self.cache.get_or_load(
+            key, lambda: self._load(bearer_token=bearer_token, action=action, resource=resource, context=context)
+        )
+
+    async def _load(self, *, bearer_token: str, action: str, resource: Optional[ResourceCtx],
+                    context: Optional[Mapping[str, Any]]) -> Principal:
+        if self.shared is None:
+            self.stats.misses += 1
+            return await self.inner.authorize(bearer_token=bearer_token, action=action, resource=resource,
+                                              context=context)
+
+        shared_key = self.shared.key(bearer_token, action, resource, context)
+        principal = await self.shared.get(shared_key)
+        if principal is not None:
+            self.stats.l2_hits += 1
+            return principal
+        self.stats.misses += 1
+        principal = await self.inner.authorize(bearer_token=bearer_token, action=action, resource=resource,
+                                               context=context)
+        await self.shared.set(shared_key, principal)
+        return principal
+
+    def try_authorize_cached(self, *, bearer_token: str, action: str, resource: Optional[ResourceCtx] = None,
+                             context: Optional[Mapping[str, Any]] = None) -> Optional[Principal]:
+        principal = self.cache.get(decision_key(bearer_token, action, resource, context))
+        if principal is not None:
+            self.stats.l1_hits += 1
+        return principal
+
+    async def preheat(self, tokens: Iterable[str], actions: Iterable[str], *, concurrency: int = 8) -> None:
+        await self.inner.preheat(tokens, actions, concurrency=concurrency)
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+        if self.shared is not None:
+            await self.shared.aclose()
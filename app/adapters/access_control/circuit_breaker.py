@@ -0,0 +1,36 @@
+"""
+Consecutive-failure circuit breaker for the HexIAM PDP.
+
+After ``failure_threshold`` consecutive failed PDP calls the breaker opens
+and callers are denied immediately for ``reset_after_s`` seconds instead
+of queueing on a dead upstream and exhausting the connection pool.  Once
+the window has passed, calls are let through again; the first success
+closes the breaker, another failure re-opens it for a further window.
+"""
+from __future__ import annotations
+
+import time
+
+
+class CircuitBreaker:
+    def __init__(self, *, failure_threshold: int = 5, reset_after_s: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_after_s = reset_after_s
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None and time.monotonic() - self._opened_at < self.reset_after_s
+
+    def allow(self) -> bool:
+        return not self.is_open
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
@@ -0,0 +1,133 @@
+"""
+PDP decision cache.
+
+Memoizes allowed :class:`~app.ports.authn.Principal` decisions returned by
+the HexIAM PDP so that repeated (token, action, resource) checks inside a
+short window are served from memory instead of an HTTP round-trip.  Only
+allow decisions are cached; denials always go back to the PDP.
+
+Entries are keyed by a digest of the raw bearer token rather than its
+(unverified) ``jti`` so a forged token can never hit another caller's
+decision.  Entries never outlive the token's own ``exp``.
+
+A decision is *fresh* for ``ttl_s`` and is then kept as *stale* until
+``stale_ttl_s``: stale decisions are never returned by :meth:`get` or
+:meth:`get_or_load`, only by :meth:`get_stale`, which the PDP adapter
+uses when HexIAM is unreachable (stale-if-error).
+
+There is no policy-change invalidation: HexShare never learns of a
+policy change (policies travel inside tokens or stay behind the PDP), so
+a decision is bounded by ``ttl_s`` and by its token's ``exp``.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from typing import Any, Awaitable, Callable, Hashable, Mapping, NamedTuple, Optional
+
+import orjson
+from cachetools import TLRUCache
+
+from app.config import load_hexiam_config
+from app.ports.access_control import ResourceCtx
+from app.ports.authn import Principal
+
+
+def token_digest(bearer_token: str) -> bytes:
+    """blake2b-128 digest of a raw bearer token, used as a compact cache key."""
+    return hashlib.blake2b(bearer_token.encode(), digest_size=16).digest()
+
+
+def _mapping_default(obj: Any) -> Any:
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError
+
+
+def _fingerprint(mapping: Optional[Mapping[str, Any]]) -> Optional[bytes]:
+    # Key-order independent and hashable, whatever the values are
+    if not mapping:
+        return None
+    return orjson.dumps(mapping, option=orjson.OPT_SORT_KEYS, default=_mapping_default)
+
+
+def decision_key(bearer_token: str, action: str, resource: Optional[ResourceCtx],
+                 context: Optional[Mapping[str, Any]]) -> tuple:
+    """Cache key covering every input that can change the decision."""
+    # ResourceCtx hashes itself (once, at construction)
+    return token_digest(bearer_token), action, resource, _fingerprint(context)
+
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    # Every waiter may have been cancelled; don't log the failure as unretrieved.
+    if not future.cancelled():
+        future.exception()
+
+
+class _Entry(NamedTuple):
+    principal: Principal
+    fresh_until: float
+
+
+class DecisionCache:
+    def __init__(self, *, maxsize: int = 10_000, ttl_s: float = 30.0, stale_ttl_s: Optional[float] = None) -> None:
+        self.ttl_s = ttl_s
+        self.stale_ttl_s = ttl_s if stale_ttl_s is None else max(ttl_s, stale_ttl_s)
+        self._entries: TLRUCache = TLRUCache(maxsize=maxsize, ttu=self._ttu, timer=time.time)
+        self._inflight: dict[Hashable, asyncio.Future[Principal]] = {}
+
+    def _ttu(self, _key: Hashable, entry: _Entry, now: float) -> float:
+        expires = now + self.stale_ttl_s
+        if entry.principal.expires_at is not None:
+            return min(expires, entry.principal.expires_at)
+        return expires
+
+    def get(self, key: Hashable) -> Optional[Principal]:
+        entry = self._entries.get(key)
+        if entry is not None and time.time() < entry.fresh_until:
+            return entry.principal
+        return None
+
+    def get_stale(self, key: Hashable) -> Optional[Principal]:
+        """Returns the last allowed decision for ``key``, fresh or stale."""
+        entry = self._entries.get(key)
+        return None if entry is None else entry.principal
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Principal]]) -> Principal:
+        principal = self.get(key)
+        if principal is not None:
+            return principal
+
+        # Single-flight: concurrent misses on the same key share one in-flight
+        # load, including its failure.  The load runs as its own task so that a
+        # cancelled caller does not cancel it for everyone else waiting on it.
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._load(key, loader))
+            inflight.add_done_callback(_retrieve_exception)
+            self._inflight[key] = inflight
+        return await asyncio.shield(inflight)
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Principal]]) -> Principal:
+        try:
+            principal = await loader()
+            self._entries[key] = _Entry(principal, time.time() + self.ttl_s)
+            return principal
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+    def invalidate_jti(self, jti: str) -> None:
+        """Drops every cached decision issued for the token with ``jti``."""
+        revoked = [key for key, entry in list(self._entries.items()) if entry.principal.jti == jti]
+        for key in revoked:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def create_decision_cache() -> DecisionCache:
+    config = load_hexiam_config()
+    return DecisionCache(ttl_s=config.pdp_cache_ttl_s, stale_ttl_s=config.pdp_stale_ttl_s)
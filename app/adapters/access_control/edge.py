@@ -7,6 +7,10 @@ from app.ports.authn import AuthenticatorPort, Principal
 from app.ports.authz import AuthorizerPort
 
 
+class EdgeMissingPolicy(AccessDenied):
+    """The token verified locally but carries no embedded policy to evaluate."""
+
+
 class EdgeAccessControl(AccessControlPort):
     def __init__(self, authenticator: AuthenticatorPort, authorizer: AuthorizerPort) -> None:
         self.authenticator = authenticator
@@ -14,7 +18,9 @@ class EdgeAccessControl(AccessControlPort):
 
     async def authorize(self, *, bearer_token: str, action: str, resource: Optional[ResourceCtx] = None,
                         context: Optional[Mapping[str, Any]] = None) -> Principal:
-        principal = await self.authenticator.authenticate(bearer_token)
+        principal = self.authenticator.authenticate(bearer_token)
+        if not principal.policy:
+            raise EdgeMissingPolicy("edge_missing_policy")
         await self.authorizer.authorize(
             principal,
             action=action,
@@ -25,5 +31,5 @@ class EdgeAccessControl(AccessControlPort):
 
 
 @AccessControlFactory.register("edge")
-def create_edge_access_control(authenticator: AuthenticatorPort, authorizer: AuthorizerPort) -> AccessControlPort:
+def create_edge_access_control(*, authenticator: AuthenticatorPort, authorizer: AuthorizerPort, **_) -> AccessControlPort:
     return EdgeAccessControl(authenticator, authorizer)
\ No newline at end of file
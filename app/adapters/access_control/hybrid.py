@@ -1,12 +1,20 @@
 from __future__ import annotations
-from typing import Mapping, Optional
+from typing import Iterable, Mapping, Optional
 
-from app.adapters.access_control.edge import EdgeAccessControl
+import httpx
+import jwt
+from cachetools import TTLCache
+
+from app.adapters.access_control.decision_cache import token_digest
+from app.adapters.access_control.edge import EdgeAccessControl, EdgeMissingPolicy
 from app.adapters.access_control.pdp import create_pdp_access_control
 from app.infra.factories import AccessControlFactory
 from app.ports.access_control import AccessControlPort, AccessDenied, ResourceCtx
 from app.ports.authn import Principal, AuthenticatorPort
-from app.ports.authz import AuthorizerPort
+from app.ports.authz import AuthorizationError, AuthorizerPort
+
+# Edge failures that warrant a PDP retry; anything else is a bug and propagates.
+_EDGE_FALLBACK_ERRORS = (AccessDenied, AuthorizationError, jwt.PyJWTError, httpx.HTTPError)
 
 
 class HybridAccessControl(AccessControlPort):
@@ -14,23 +22,45 @@ class HybridAccessControl(AccessControlPort):
     Strategy:
     - Try EDGE
     - If token missing embedded policy OR edge fails -> fallback PDP
+    - Tokens seen without an embedded policy go straight to PDP afterwards
     """
 
-    def __init__(self, *, edge: AccessControlPort, pdp: AccessControlPort) -> None:
+    def __init__(self, *, edge: AccessControlPort, pdp: AccessControlPort, policyless_ttl_s: float = 300.0) -> None:
         self.edge = edge
         self.pdp = pdp
+        # token digest -> True when the edge path found no embedded policy
+        self._policyless: TTLCache[bytes, bool] = TTLCache(maxsize=10_000, ttl=policyless_ttl_s)
 
     async def authorize(self, *, bearer_token: str, action: str, resource: Optional[ResourceCtx] = None,
                         context: Optional[Mapping[str, object]] = None) -> Principal:
-        try:
-            principal = await self.edge.authorize(bearer_token=bearer_token, action=action, resource=resource,
-                                                  context=context)
-            if not principal.policy:
-                raise AccessDenied("edge_missing_policy")
-            return principal
-        except Exception:
-            return await self.pdp.authorize(bearer_token=bearer_token, action=action, resource=resource,
-                                            context=context)
+        key = token_digest(bearer_token)
+        if key not in self._policyless:
+            try:
+                principal = await self.edge.authorize(bearer_token=bearer_token, action=action, resource=resource,
+                                                      context=context)
+                if not principal.policy:
+                    raise EdgeMissingPolicy("edge_missing_policy")
+                return principal
+            except EdgeMissingPolicy:
+                self._policyless[key] = True
+            except _EDGE_FALLBACK_ERRORS:
+                pass
+        return await self.pdp.authorize(bearer_token=bearer_token, action=action, resource=resource,
+                                        context=context)
+
+    def try_authorize_cached(self, *, bearer_token: str, action: str, resource: Optional[ResourceCtx] = None,
+                             context: Optional[Mapping[str, object]] = None) -> Optional[Principal]:
+        # Only the PDP side caches; a PDP allow is authoritative for either path
+        return self.pdp.try_authorize_cached(bearer_token=bearer_token, action=action, resource=resource,
+                                             context=context)
+
+    async def preheat(self, tokens: Iterable[str], actions: Iterable[str], *, concurrency: int = 8) -> None:
+        # Edge decisions are local and cheap; only the PDP side has a cache worth warming.
+        await self.pdp.preheat(tokens, actions, concurrency=concurrency)
+
+    async def aclose(self) -> None:
+        await self.edge.aclose()
+        await self.pdp.aclose()
 
 
 @AccessControlFactory.register("hybrid")
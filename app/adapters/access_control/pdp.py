@@ -1,14 +1,42 @@
 from __future__ import annotations
 
-import os
-from typing import Any, Mapping, Optional
+import asyncio
+import logging
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Optional
 
 import httpx
+import orjson
 
+from app.adapters.access_control.circuit_breaker import CircuitBreaker
+from app.adapters.access_control.decision_cache import DecisionCache, create_decision_cache, decision_key
+from app.config import load_hexiam_config
 from app.infra.factories import AccessControlFactory
 from app.ports.access_control import AccessControlPort, AccessDenied, ResourceCtx
 from app.ports.authn import Principal
 
+logger = logging.getLogger(__name__)
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Shared read-only stand-in for missing attrs/context, and its pre-encoded form.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+_EMPTY_JSON = orjson.Fragment(b"{}")
+
+
+def _json_default(obj: Any) -> Any:
+    # orjson serializes dicts natively; other mappings (e.g. MappingProxyType)
+    # are copied only when they actually reach the encoder.
+    if obj is _EMPTY:
+        return _EMPTY_JSON
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError
+
+
+class PDPUnavailable(AccessDenied):
+    """The PDP is down (5xx) or its circuit breaker is open; no decision was made."""
+
 
 class PDPAccessControl(AccessControlPort):
     def __init__(
@@ -18,77 +46,146 @@ class PDPAccessControl(AccessControlPort):
         client_id: str,
         client_secret: str,
         timeout_s: float = 5.0,
+        http_client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[DecisionCache] = None,
+        breaker: Optional[CircuitBreaker] = None,
     ) -> None:
         self.iam_url = iam_url.rstrip("/")
         self.client_id = client_id
         self.client_secret = client_secret
         self.timeout_s = timeout_s
+        self.cache = cache
+        self.breaker = breaker or CircuitBreaker()
+        # Absolute so a shared client (no base_url) can be injected
+        self._decide_url = f"{self.iam_url}/pdp/decide"
+
+        # One pooled keep-alive client for the adapter's lifetime; an injected
+        # client is owned (and closed) by whoever created it.
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.AsyncClient(
+            base_url=self.iam_url,
+            timeout=self.timeout_s,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        )
 
     async def authorize(self, *, bearer_token: str, action: str, resource: Optional[ResourceCtx] = None,
                         context: Optional[Mapping[str, Any]] = None) -> Principal:
         """
         Calls HexIAM PDP. HexIAM verifies token + evaluates policy.
+        Allowed decisions are served from the decision cache when one is configured.
+        """
+        if self.cache is None:
+            return await self._decide(bearer_token=bearer_token, action=action, resource=resource, context=context)
+
+        key = decision_key(bearer_token, action, resource, context)
+        try:
+            return await self.cache.get_or_load(
+                key,
+                lambda: self._decide(bearer_token=bearer_token, action=action, resource=resource, context=context),
+            )
+        except (httpx.HTTPError, PDPUnavailable) as exc:
+            # Stale-if-error: during a HexIAM outage, fall back to the last
+            # allowed decision for this exact input, if it is still held.
+            principal = self.cache.get_stale(key)
+            if principal is None:
+                raise
+            logger.warning("PDP unavailable (%r); serving stale decision for %s", exc, action)
+            return principal
+
+    def try_authorize_cached(self, *, bearer_token: str, action: str, resource: Optional[ResourceCtx] = None,
+                             context: Optional[Mapping[str, Any]] = None) -> Optional[Principal]:
+        if self.cache is None:
+            return None
+        return self.cache.get(decision_key(bearer_token, action, resource, context))
+
+    async def preheat(self, tokens: Iterable[str], actions: Iterable[str], *, concurrency: int = 8) -> None:
         """
-        url = f"{self.iam_url}/pdp/decide"
+        Loads a decision for every (token, action) pair into the decision cache
+        so the first real request does not pay the PDP round-trip.  At most
+        ``concurrency`` PDP calls are in flight; denials and errors are counted
+        and otherwise ignored.
+        """
+        if self.cache is None:
+            return
+
+        semaphore = asyncio.Semaphore(concurrency)
+        actions = tuple(actions)
+
+        async def warm(token: str, action: str) -> None:
+            async with semaphore:
+                await self.authorize(bearer_token=token, action=action)
 
+        results = await asyncio.gather(
+            *(warm(token, action) for token in tokens for action in actions),
+            return_exceptions=True,
+        )
+        failed = sum(isinstance(r, BaseException) for r in results)
+        logger.info("PDP preheat: %d decisions cached, %d failed", len(results) - failed, failed)
+
+    async def _decide(self, *, bearer_token: str, action: str, resource: Optional[ResourceCtx],
+                      context: Optional[Mapping[str, Any]]) -> Principal:
         payload = {
             "token": bearer_token,
             "permission": action,
             "resource": None if resource is None else {
                 "type": resource.type,
                 "id": resource.id,
-                "attrs": dict(resource.attrs or {}),
+                "attrs": dict(resource.attrs) if resource.attrs else _EMPTY,
             },
-            "context": dict(context or {}),
+            "context": context if context else _EMPTY,
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout_s) as client:
-            resp = await client.post(
-                url,
-                json=payload,
+        if not self.breaker.allow():
+            raise PDPUnavailable("pdp_unavailable")
+
+        try:
+            resp = await self._client.post(
+                self._decide_url,
+                content=orjson.dumps(payload, default=_json_default),
+                headers=_JSON_HEADERS,
                 # auth=(self.client_id, self.client_secret),  # Basic auth for the PDP client
             )
+        except httpx.HTTPError:
+            self.breaker.record_failure()
+            raise
+
+        if resp.status_code >= 500:
+            self.breaker.record_failure()
+            raise PDPUnavailable(f"PDP error: {resp.status_code}")
+        self.breaker.record_success()
 
         if resp.status_code >= 400:
             raise AccessDenied(f"PDP error: {resp.status_code}")
 
-        data = resp.json()
+        data = orjson.loads(resp.content)
         if not data.get("allow", False):
             raise AccessDenied(data.get("reason", "forbidden"))
 
         p = data.get("principal") or {}
         # Normalize principal coming back from HexIAM
-        return Principal(
-            tenant_id=p.get("tenant_id"),
-            user_id=p.get("user_id"),
-            client_id=p.get("client_id"),
-            token_use=p.get("token_use"),
-            subject=p.get("sub"),
-            scopes=tuple((p.get("scope") or "").split()),
-            roles=(p.get("role"),) if p.get("role") else tuple(),
-            issuer=p.get("iss"),
-            audience=p.get("aud"),
-            issued_at=p.get("iat"),
-            expires_at=p.get("exp"),
-            policy=p.get("policy") or {},
-            jti=p.get("jti"),
-            claims=p.get("claims") or p,
-        )
+        return Principal.from_claims(p, raw_claims=p.get("claims") or p)
 
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self._client.aclose()
 
-def _load_pdp_config():
-    iam_url = os.getenv("HEXIAM_URL", "http://localhost:8000")
-    client_id = os.getenv("HEXSHARE_CLIENT_ID")
-    client_secret = os.getenv("HEXIAM_CLIENT_SECRET")
-    timeout_s = float(os.getenv("HEXIAM_PDP_TIMEOUT_S", 5.0))
-    return {
-        "iam_url": iam_url,
-        "client_id": client_id,
-        "client_secret": client_secret,
-        "timeout_s": timeout_s,
-    }
 
 @AccessControlFactory.register("pdp")
-def create_pdp_access_control(*, iam_url=None, client_id=None, client_secret=None, **_) -> AccessControlPort:
-    config = _load_pdp_config()
-    return PDPAccessControl(**config)
+def create_pdp_access_control(*, iam_url=None, client_id=None, client_secret=None, http_client=None,
+                              decision_cache=None, **_) -> AccessControlPort:
+    config = load_hexiam_config()
+    cache = decision_cache if decision_cache is not None else create_decision_cache()
+    breaker = CircuitBreaker(
+        failure_threshold=config.pdp_breaker_threshold,
+        reset_after_s=config.pdp_breaker_reset_s,
+    )
+    return PDPAccessControl(
+        iam_url=config.iam_url,
+        client_id=config.client_id,
+        client_secret=config.client_secret,
+        timeout_s=config.pdp_timeout_s,
+        http_client=http_client,
+        cache=cache,
+        breaker=breaker,
+    )
@@ -0,0 +1,128 @@
+"""
+Redis tier for authorization decisions.
+
+Sits behind the in-process :class:`DecisionCache` in multi-node
+deployments: a decision resolved on one worker is written to
+``pdp:{sha256}`` so every other worker's cold miss for the same
+(token, action, resource, context) is answered by one Redis ``GET``
+instead of a token verification / PDP round-trip.
+
+Like the local cache it only holds allowed decisions, and an entry lives
+for at most ``min(token exp, ttl_s)``.  Redis is an optimisation only: if
+it is unreachable, lookups miss and writes are dropped.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+
+import orjson
+import redis.asyncio as redis
+
+from app.adapters.access_control.decision_cache import token_digest
+from app.ports.access_control import ResourceCtx
+from app.ports.authn import Principal
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Hit counters for the local (L1) and Redis (L2) decision tiers."""
+
+    l1_hits: int = 0
+    l2_hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.l1_hits + self.l2_hits + self.misses
+
+    @property
+    def l1_hit_rate(self) -> float:
+        return self.l1_hits / self.lookups if self.lookups else 0.0
+
+    @property
+    def l2_hit_rate(self) -> float:
+        # Of the lookups that got past L1
+        past_l1 = self.l2_hits + self.misses
+        return self.l2_hits / past_l1 if past_l1 else 0.0
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError
+
+
+def _encode_principal(principal: Principal) -> bytes:
+    return orjson.dumps(principal, default=_json_default)
+
+
+def _decode_principal(raw: bytes) -> Principal:
+    fields = orjson.loads(raw)
+    fields["roles"] = tuple(fields["roles"])
+    fields["scopes"] = tuple(fields["scopes"])
+    return Principal(**fields)
+
+
+class RedisDecisionStore:
+    def __init__(self, client: redis.Redis, *, key_prefix: str = "pdp:", ttl_s: float = 30.0) -> None:
+        self._redis = client
+        self._key_prefix = key_prefix
+        self.ttl_s = ttl_s
+
+    def key(self, bearer_token: str, action: str, resource: Optional[ResourceCtx],
+            context: Optional[Mapping[str, Any]]) -> str:
+        # Built from field values only: ResourceCtx's own hash is per-process
+        material = orjson.dumps(
+            [
+                token_digest(bearer_token).hex(),
+                action,
+                None if resource is None else [resource.type, resource.id, resource.attrs],
+                context or None,
+            ],
+            option=orjson.OPT_SORT_KEYS,
+            default=_json_default,
+        )
+        return self._key_prefix + hashlib.sha256(material).hexdigest()
+
+    async def get(self, key: str) -> Optional[Principal]:
+        try:
+            raw = await self._redis.get(key)
+        except redis.RedisError:
+            logger.warning("Redis unavailable; skipping shared decision cache", exc_info=True)
+            return None
+        if raw is None:
+            return None
+        try:
+            return _decode_principal(raw)
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            logger.warning("Discarding unreadable shared decision %s", key, exc_info=True)
+            return None
+
+    async def set(self, key: str, principal: Principal) -> None:
+        ttl_s = self.ttl_s
+        if principal.expires_at is not None:
+            ttl_s = min(ttl_s, principal.expires_at - time.time())
+        if ttl_s <= 0:
+            return
+        try:
+            await self._redis.set(key, _encode_principal(principal), px=int(ttl_s * 1000) or 1)
+        except redis.RedisError:
+            logger.warning("Redis unavailable; decision not shared", exc_info=True)
+
+    async def aclose(self) -> None:
+        await self._redis.aclose()
+
+
+def create_redis_decision_store(*, ttl_s: float) -> Optional[RedisDecisionStore]:
+    redis_url = os.getenv("REDIS_URL")
+    if not redis_url:
+        # Single node: the in-process cache is the only tier
+        return None
+    return RedisDecisionStore(redis.Redis.from_url(redis_url), ttl_s=ttl_s)
@@ -1,11 +1,26 @@
-import os
-from typing import Any
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from typing import Any, Optional
 
+import httpx
 import jwt
+from cachetools import TLRUCache
+from cryptography.hazmat.primitives.serialization import load_pem_public_key
 
+from app.adapters.hs256 import HS256Verifier
+from app.config import load_hexiam_config
 from app.infra.factories import AuthenticatorFactory
 from app.ports.authn import AuthenticatorPort, Principal
 
+logger = logging.getLogger(__name__)
+
+_ASYMMETRIC_ALGORITHMS = ["EdDSA", "RS256"]
+# Floor between on-demand JWKS refreshes triggered by unknown kids
+_JWKS_MIN_REFRESH_S = 30.0
+
 
 class HEXIAMAuthenticator(AuthenticatorPort):
 
@@ -16,59 +31,156 @@ class HEXIAMAuthenticator(AuthenticatorPort):
         jwt_secret: str | None = None,
         expected_aud: str | None = None,
         expected_iss_prefix: str | None = None,
+        public_key: str | None = None,
+        jwks_url: str | None = None,
+        jwks_cache_ttl_s: float = 300.0,
+        cache_ttl_s: float = 60.0,
+        cache_maxsize: int = 10_000,
+        http_client: Optional[httpx.AsyncClient] = None,
     ) -> None:
-        self.iam_url = iam_url or os.getenv("HEXIAM_URL", "http://localhost:8000")
-        self.jwt_secret = jwt_secret or os.getenv("HEXIAM_JWT_SECRET")  # shared secret
-        self.expected_aud = expected_aud or os.getenv("HEXSHARE_CLIENT_ID")
-        self.expected_iss_prefix = expected_iss_prefix or os.getenv("HEXIAM_ISS_PREFIX")
+        config = load_hexiam_config()
+        self.iam_url = iam_url or config.iam_url
+        self.jwt_secret = jwt_secret or config.jwt_secret  # shared secret
+        self.expected_aud = expected_aud or config.client_id
+        self.expected_iss_prefix = expected_iss_prefix or config.iss_prefix
+        public_key = public_key or config.public_key
+        self.jwks_url = jwks_url or config.jwks_url
 
-        if not self.jwt_secret:
-            raise RuntimeError("Missing HEXIAM_JWT_SECRET for HS256 verification")
+        if not (self.jwt_secret or public_key or self.jwks_url):
+            raise RuntimeError("Missing HEXIAM_JWT_SECRET, HEXIAM_JWT_PUBLIC_KEY or HEXIAM_JWKS_URL for token verification")
+        self._verifier = HS256Verifier(self.jwt_secret) if self.jwt_secret else None
 
-    def authenticate(self, bearer_token: str) -> Principal:
-        token_payload: dict[str, Any] = self._decode_token(bearer_token)
-
-        scopes_str: str = token_payload.get("scope") or ""
-        roles: tuple = (token_payload.get("role"),) if token_payload.get("role") else tuple()
-        return Principal(
-            tenant_id=token_payload.get("tenant_id"),
-            user_id=token_payload.get("user_id"),
-            client_id=token_payload.get("client_id"),
-            token_use=token_payload.get("token_use"),
-            subject=token_payload.get("sub"),
-            scopes=tuple(scopes_str.split(" ")),
-            roles=roles,
-            issuer=token_payload.get("iss"),
-            audience=token_payload.get("aud"),
-            issued_at=token_payload.get("iat"),
-            expires_at=token_payload.get("exp"),
-            policy=token_payload.get("policy"),
-            jti=token_payload.get("jti"),
-            claims=token_payload
+        # Asymmetric (EdDSA/RS256) verification: the PEM key is parsed once here.
+        # JWKS keys are fetched in start() and refreshed in the background every
+        # jwks_cache_ttl_s, so verification never waits on the network.
+        self._public_key = load_pem_public_key(public_key.replace("\\n", "\n").encode()) if public_key else None
+        self.jwks_refresh_s = jwks_cache_ttl_s
+        self._jwks_keys: dict[Optional[str], Any] = {}
+        self._jwks_fetched_at = float("-inf")
+        self._jwks_task: Optional[asyncio.Task] = None
+        self._jwks_wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._owns_http = http_client is None
+        self._http = http_client
+
+        # Verified principals keyed by token digest; an entry never outlives the token's exp.
+        # Sync dependencies run in FastAPI's threadpool, hence the lock.
+        self.cache_ttl_s = cache_ttl_s
+        self._token_cache: TLRUCache[bytes, Principal] = TLRUCache(
+            maxsize=cache_maxsize, ttu=self._cache_ttu, timer=time.time
         )
+        self._cache_lock = threading.Lock()
+
+    def _cache_ttu(self, _key: bytes, principal: Principal, now: float) -> float:
+        expires = now + self.cache_ttl_s
+        if principal.expires_at is not None:
+            return min(expires, principal.expires_at)
+        return expires
+
+    def authenticate(self, bearer_token: str) -> Principal:
+        key = hashlib.blake2b(bearer_token.encode(), digest_size=16).digest()
+        with self._cache_lock:
+            principal = self._token_cache.get(key)
+        if principal is not None:
+            return principal
+
+        principal = Principal.from_claims(self._decode_token(bearer_token))
+        with self._cache_lock:
+            self._token_cache[key] = principal
+        return principal
+
+    def invalidate(self, jti: str) -> None:
+        with self._cache_lock:
+            stale = [key for key, principal in list(self._token_cache.items()) if principal.jti == jti]
+            for key in stale:
+                self._token_cache.pop(key, None)
+
+    async def start(self) -> None:
+        if not self.jwks_url:
+            return
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=5.0)
+        self._loop = asyncio.get_running_loop()
+        self._jwks_wakeup = asyncio.Event()
+        try:
+            await self.refresh_jwks()
+        except (httpx.HTTPError, jwt.PyJWTError, ValueError):
+            logger.warning("Initial JWKS fetch from %s failed; retrying in background", self.jwks_url, exc_info=True)
+        self._jwks_task = asyncio.create_task(self._refresh_jwks_periodically())
+
+    async def aclose(self) -> None:
+        if self._jwks_task is not None:
+            self._jwks_task.cancel()
+            try:
+                await self._jwks_task
+            except asyncio.CancelledError:
+                pass
+            self._jwks_task = None
+        if self._owns_http and self._http is not None:
+            await self._http.aclose()
+
+    async def refresh_jwks(self) -> None:
+        """Fetches the JWKS and atomically swaps in the new kid -> key map."""
+        resp = await self._http.get(self.jwks_url)
+        resp.raise_for_status()
+        jwk_set = jwt.PyJWKSet.from_dict(resp.json())
+        self._jwks_keys = {jwk.key_id: jwk.key for jwk in jwk_set.keys}
+        self._jwks_fetched_at = time.monotonic()
+
+    async def _refresh_jwks_periodically(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._jwks_wakeup.wait(), timeout=self.jwks_refresh_s)
+            except asyncio.TimeoutError:
+                pass
+            self._jwks_wakeup.clear()
+            try:
+                await self.refresh_jwks()
+            except (httpx.HTTPError, jwt.PyJWTError, ValueError):
+                logger.warning("JWKS refresh from %s failed; keeping previous keys", self.jwks_url, exc_info=True)
+
+    def _request_jwks_refresh(self) -> None:
+        # An unknown kid usually means the IdP rotated keys; wake the refresher
+        # (thread-safe: authenticate may run in the threadpool).
+        if self._loop is None or time.monotonic() - self._jwks_fetched_at < _JWKS_MIN_REFRESH_S:
+            return
+        self._loop.call_soon_threadsafe(self._jwks_wakeup.set)
 
     def _decode_token(self, token: str) -> dict[str, Any]:
+        if self._public_key is not None or self.jwks_url:
+            header = jwt.get_unverified_header(token)
+            if header.get("alg") in _ASYMMETRIC_ALGORITHMS:
+                return self._decode_asymmetric(token, header)
+        if self._verifier is None:
+            raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+        return self._verifier.decode(token, audience=self.expected_aud or None, require=("exp", "iat"))
+
+    def _decode_asymmetric(self, token: str, header: dict[str, Any]) -> dict[str, Any]:
+        if self.jwks_url and (header.get("kid") or self._public_key is None):
+            key = self._jwks_keys.get(header.get("kid"))
+            if key is None:
+                self._request_jwks_refresh()
+                raise jwt.InvalidTokenError(f"Unknown signing key: {header.get('kid')}")
+        else:
+            key = self._public_key
         options = {"require": ["exp", "iat"], "verify_aud": bool(self.expected_aud)}
         return jwt.decode(
-            token, algorithms=["HS256"], options=options, key=self.jwt_secret,
+            token, algorithms=_ASYMMETRIC_ALGORITHMS, options=options, key=key,
             audience=self.expected_aud
         )
 
 
-def _load_hexiam_config():
-    iam_url = os.getenv("HEXIAM_URL", "http://localhost:8000")
-    jwt_secret = os.getenv("HEXIAM_JWT_SECRET")
-    expected_aud = os.getenv("HEXSHARE_CLIENT_ID")
-    expected_iss_prefix = os.getenv("HEXIAM_ISS_PREFIX")
-
-    return {
-        "iam_url": iam_url,
-        "jwt_secret": jwt_secret,
-        "expected_aud": expected_aud,
-        "expected_iss_prefix": expected_iss_prefix
-    }
-
 @AuthenticatorFactory.register("hexiam")
-def create_hexiam_authenticator(**kwargs) -> AuthenticatorPort:
-    config = _load_hexiam_config()
-    return HEXIAMAuthenticator(**config)
\ No newline at end of file
+def create_hexiam_authenticator(*, http_client: Optional[httpx.AsyncClient] = None, **kwargs) -> AuthenticatorPort:
+    config = load_hexiam_config()
+    return HEXIAMAuthenticator(
+        iam_url=config.iam_url,
+        jwt_secret=config.jwt_secret,
+        expected_aud=config.client_id,
+        expected_iss_prefix=config.iss_prefix,
+        public_key=config.public_key,
+        jwks_url=config.jwks_url,
+        jwks_cache_ttl_s=config.jwks_cache_ttl_s,
+        cache_ttl_s=config.authn_cache_ttl_s,
+        http_client=http_client,
+    )
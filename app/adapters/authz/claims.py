@@ -1,22 +1,45 @@
+from typing import Iterable
+
+from cachetools import LRUCache
+
 from app.ports.authn import Principal
 from app.ports.authz import AuthorizerPort, AuthorizationError
-from app.ports.policy_evaluator import PolicyEvaluatorPort
+from app.ports.policy_evaluator import CompiledPolicy, PolicyEvaluatorPort
 
 
 class ClaimsAuthorizer(AuthorizerPort):
-    def __init__(self, evaluator: PolicyEvaluatorPort) -> None:
+    """
+    Authorizes against the policy embedded in the principal's token.  The
+    policy is compiled once per token (keyed by ``jti``/``iat``) and reused
+    for every later check made with it.
+    """
+
+    def __init__(self, evaluator: PolicyEvaluatorPort, *, compiled_cache_size: int = 10_000) -> None:
         self.evaluator = evaluator
+        self._compiled: LRUCache = LRUCache(maxsize=compiled_cache_size)
+
+    def _compiled_policy(self, principal: Principal) -> CompiledPolicy:
+        if not principal.jti:
+            return self.evaluator.compile(principal.policy or {})
+        key = (principal.jti, principal.issued_at)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = self._compiled[key] = self.evaluator.compile(principal.policy or {})
+        return compiled
 
     async def authorize(
             self, principal: Principal, action: str, *,
             resource_id: str | None = None, context=None
     ) -> None:
-        ok = self.evaluator.evaluate(
-            policy=principal.policy or {},
-            action=action,
-            resource=resource_id,
-            context=context,
-        )
+        ok = self._compiled_policy(principal).evaluate(action, resource_id, context)
+        if not ok:
+            raise AuthorizationError("forbidden")
+
+    async def authorize_all(
+            self, principal: Principal, actions: Iterable[str], *,
+            resource_id: str | None = None, context=None
+    ) -> None:
+        ok = self._compiled_policy(principal).evaluate_all(actions, resource_id, context)
         if not ok:
             raise AuthorizationError("forbidden")
 
@@ -0,0 +1,94 @@
+"""
+Buffered event bus adapter.
+
+Wraps another :class:`~app.ports.EventBusPort` so that publishing from
+the request path is a local enqueue.  A background task drains the
+bounded buffer in batches of up to ``max_batch`` events (waiting at most
+``flush_interval_s`` for a batch to fill), groups each batch by tenant
+and hands every group to the wrapped bus's ``publish_batch`` in one call.
+
+When the buffer is full, :meth:`BufferedEventBus.publish_event` drops the
+event with a warning (counted in ``dropped``) rather than blocking or
+failing the request: services publish after their write has committed,
+so an error there would report a failure for a change that succeeded.
+On shutdown the buffer is drained before the wrapped bus is closed.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Dict, Optional, Tuple
+
+from app.domain.events import DomainEvent, event_name
+from app.ports.event_bus_port import EventBusPort
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedEventBus(EventBusPort):
+    def __init__(
+        self,
+        inner: EventBusPort,
+        *,
+        maxsize: int = 10_000,
+        max_batch: int = 500,
+        flush_interval_s: float = 0.05,
+        drain_timeout_s: float = 10.0,
+    ) -> None:
+        self.inner = inner
+        self.max_batch = max_batch
+        self.flush_interval_s = flush_interval_s
+        self.drain_timeout_s = drain_timeout_s
+        self._queue: asyncio.Queue[Tuple[str, DomainEvent]] = asyncio.Queue(maxsize=maxsize)
+        self._task: Optional[asyncio.Task] = None
+        self.dropped = 0
+
+    async def publish_event(self, tenant_id: str, event: DomainEvent) -> None:
+        try:
+            self._queue.put_nowait((tenant_id, event))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning("Event buffer full; dropped %s for tenant %s", event_name(event), tenant_id)
+
+    async def start(self) -> None:
+        await self.inner.start()
+        self._task = asyncio.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        while True:
+            first = await self._queue.get()
+            # Give a small batch a moment to fill; a backlog is flushed at once
+            if self._queue.qsize() < self.max_batch - 1:
+                await asyncio.sleep(self.flush_interval_s)
+            batch = [first]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: list[Tuple[str, DomainEvent]]) -> None:
+        by_tenant: Dict[str, list[DomainEvent]] = {}
+        for tenant_id, event in batch:
+            by_tenant.setdefault(tenant_id, []).append(event)
+        for tenant_id, events in by_tenant.items():
+            try:
+                await self.inner.publish_batch(tenant_id, events)
+            except Exception:
+                logger.exception("Failed to publish %d events for tenant %s", len(events), tenant_id)
+
+    async def aclose(self) -> None:
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=self.drain_timeout_s)
+            except asyncio.TimeoutError:
+                logger.warning("Event buffer not drained on shutdown; %d events dropped", self._queue.qsize())
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.inner.aclose()
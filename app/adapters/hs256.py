@@ -0,0 +1,134 @@
+"""
+Fast-path HS256 JWT signing and verification.
+
+PyJWT's ``jwt.decode`` goes through a generic, algorithm-agnostic pipeline
+that is measurably heavy on the per-request path.  HexShare only ever
+verifies HS256 tokens with a shared secret, so this module implements just
+that: split the compact form, verify the HMAC-SHA256 signature with the
+stdlib (OpenSSL-backed) ``hmac`` module, parse header/payload with
+``orjson`` and validate the registered time/audience claims.
+
+Signing is the mirror image: the fixed header is encoded once, the
+claims are serialised with ``orjson`` and signed with the same keyed HMAC
+state.
+
+Errors are raised as PyJWT exception types so callers keep catching
+``jwt.InvalidTokenError``.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import time
+from typing import Any, Iterable
+
+import orjson
+from jwt.exceptions import (
+    DecodeError,
+    ExpiredSignatureError,
+    ImmatureSignatureError,
+    InvalidAlgorithmError,
+    InvalidAudienceError,
+    InvalidIssuedAtError,
+    InvalidSignatureError,
+    MissingRequiredClaimError,
+)
+
+
+def _b64decode(segment: bytes) -> bytes:
+    return base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# Every token carries the same header; encode it once
+_HEADER_SEGMENT = _b64encode(orjson.dumps({"alg": "HS256", "typ": "JWT"}))
+
+
+def _int_claim(payload: dict[str, Any], claim: str, error: type[Exception], message: str) -> int:
+    try:
+        return int(payload[claim])
+    except (TypeError, ValueError):
+        raise error(message)
+
+
+class HS256Verifier:
+    """Signs, verifies and decodes HS256 JWTs for a single secret."""
+
+    def __init__(self, key: str | bytes, *, leeway: float = 0) -> None:
+        # The key schedule (ipad/opad blocks) is absorbed once; each decode
+        # copies the keyed state instead of re-deriving it from the secret.
+        self._hmac = hmac.new(key.encode() if isinstance(key, str) else key, digestmod=hashlib.sha256)
+        self.leeway = leeway
+
+    def encode(self, payload: dict[str, Any]) -> str:
+        signing_input = _HEADER_SEGMENT + b"." + _b64encode(orjson.dumps(payload))
+        mac = self._hmac.copy()
+        mac.update(signing_input)
+        return (signing_input + b"." + _b64encode(mac.digest())).decode("ascii")
+
+    def decode(
+        self,
+        token: str,
+        *,
+        audience: str | None = None,
+        require: Iterable[str] = (),
+    ) -> dict[str, Any]:
+        try:
+            raw = token.encode("ascii")
+            if raw.count(b".") != 2:
+                raise DecodeError("Not enough segments")
+            signing_input, _, crypto_segment = raw.rpartition(b".")
+            header_segment, _, payload_segment = signing_input.partition(b".")
+            header = orjson.loads(_b64decode(header_segment))
+            payload = orjson.loads(_b64decode(payload_segment))
+            signature = _b64decode(crypto_segment)
+        except ValueError as exc:
+            raise DecodeError(f"Invalid token encoding: {exc}") from exc
+
+        if not isinstance(header, dict) or header.get("alg") != "HS256":
+            raise InvalidAlgorithmError("The specified alg value is not allowed")
+        if not isinstance(payload, dict):
+            raise DecodeError("Invalid payload string: must be a json object")
+
+        mac = self._hmac.copy()
+        mac.update(signing_input)
+        expected = mac.digest()
+        if not hmac.compare_digest(expected, signature):
+            raise InvalidSignatureError("Signature verification failed")
+
+        self._validate_claims(payload, audience=audience, require=require)
+        return payload
+
+    def _validate_claims(self, payload: dict[str, Any], *, audience: str | None, require: Iterable[str]) -> None:
+        for claim in require:
+            if payload.get(claim) is None:
+                raise MissingRequiredClaimError(claim)
+
+        now = time.time()
+        if "iat" in payload:
+            iat = _int_claim(payload, "iat", InvalidIssuedAtError, "Issued At claim (iat) must be an integer.")
+            if iat > now + self.leeway:
+                raise ImmatureSignatureError("The token is not yet valid (iat)")
+        if "nbf" in payload:
+            nbf = _int_claim(payload, "nbf", DecodeError, "Not Before claim (nbf) must be an integer.")
+            if nbf > now + self.leeway:
+                raise ImmatureSignatureError("The token is not yet valid (nbf)")
+        if "exp" in payload:
+            exp = _int_claim(payload, "exp", DecodeError, "Expiration Time claim (exp) must be an integer.")
+            if exp <= now - self.leeway:
+                raise ExpiredSignatureError("Signature has expired")
+
+        if audience is not None:
+            if "aud" not in payload:
+                raise MissingRequiredClaimError("aud")
+            aud = payload["aud"]
+            if isinstance(aud, str):
+                aud = [aud]
+            if not isinstance(aud, list) or not all(isinstance(a, str) for a in aud):
+                raise InvalidAudienceError("Invalid claim format in token")
+            if audience not in aud:
+                raise InvalidAudienceError("Audience doesn't match")
@@ -1,34 +1,56 @@
 """
 JWT token adapter.
 
-This adapter implements :class:`~app.ports.TokenPort` using PyJWT
-for encoding and decoding JSON Web Tokens.  It provides a simple
-in‑memory JTI revocation mechanism suitable for development and
-testing.  In a production deployment, revocations should be stored in
-a shared cache (e.g. Redis) and tokens should be signed using an
+This adapter implements :class:`~app.ports.TokenPort` with the HS256
+fast path in :mod:`app.adapters.hs256`, which signs and verifies JSON
+Web Tokens using ``orjson`` and the stdlib ``hmac`` module.  Revoked JTIs are kept
+in a :class:`~app.ports.revocation_store.RevocationStorePort`; the
+default is a per‑process in‑memory store suitable for development and
+testing, while a Redis store shares revocations across workers.  Links
+with a revocation list index carry it as the ``rli`` claim and are
+revoked by that bit rather than by JTI.  In a
+production deployment tokens should also be signed using an
 asymmetric algorithm with rotation.
 """
 from __future__ import annotations
 
 import os
 import uuid
-from datetime import datetime, timezone
-from typing import Any, Dict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional
 
 import jwt  # type: ignore
 
+from app.adapters.hs256 import HS256Verifier
+from app.adapters.revocation.memory import MemoryRevocationStore
+from app.ports.clock import epoch_seconds
+from app.ports.revocation_store import RevocationStorePort
 from app.ports.token_port import TokenPort
 
 
 class JWTTokenAdapter(TokenPort):
     """PyJWT implementation of the token port."""
 
-    def __init__(self, secret: str | None = None) -> None:
+    def __init__(
+        self,
+        secret: str | None = None,
+        *,
+        revocation_store: RevocationStorePort | None = None,
+        revocation_hooks: Iterable[Callable[[str], None]] = (),
+    ) -> None:
         self._secret = secret or os.environ.get("HEXSHARE_JWT_SECRET", uuid.uuid4().hex)
-        self._revoked_jtis: Dict[str, datetime] = {}
+        self._verifier = HS256Verifier(self._secret)
+        self._revocations = revocation_store or MemoryRevocationStore()
+        # Called with each revoked JTI so downstream caches can drop it
+        self._revocation_hooks = tuple(revocation_hooks)
 
     def generate_jti(self) -> str:
-        return uuid.uuid4().hex
+        # Time-ordered for index locality on share_links.jti; the token's
+        # signature, not the JTI, is what makes a share link unforgeable.
+        return uuid.uuid7().hex
+
+    async def allocate_revocation_index(self, tenant_id: str) -> Optional[int]:
+        return await self._revocations.allocate_revocation_index(tenant_id)
 
     def encode_share_token(
         self,
@@ -40,33 +62,73 @@ class JWTTokenAdapter(TokenPort):
         expires_at: datetime,
         permissions: Dict[str, bool],
         require_email: bool,
+        token_version: int = 0,
+        revocation_index: Optional[int] = None,
     ) -> str:
         payload = {
             "sub": document_id,
             "tid": tenant_id,
             "lid": link_id,
             "jti": jti,
-            "exp": int(expires_at.replace(tzinfo=timezone.utc).timestamp()),
+            "exp": int(epoch_seconds(expires_at)),
             "perms": permissions,
             "require_email": require_email,
+            "ver": token_version,
         }
-        token = jwt.encode(payload, self._secret, algorithm="HS256")
-        return token
+        if revocation_index is not None:
+            payload["rli"] = revocation_index
+        return self._verifier.encode(payload)
 
-    def decode_share_token(self, token: str) -> Dict[str, Any]:
-        payload = jwt.decode(token, self._secret, algorithms=["HS256"])
+    async def decode_share_token(self, token: str) -> Dict[str, Any]:
+        payload = self._verifier.decode(token)
         jti: str = payload.get("jti")
-        # Check revocation list
-        now = datetime.now(timezone.utc)
-        # Clean expired revocations
-        expired = [key for key, exp in self._revoked_jtis.items() if exp <= now]
-        for key in expired:
-            self._revoked_jtis.pop(key, None)
-        if jti in self._revoked_jtis:
+        tenant_id = payload.get("tid") or payload.get("tenant_id")
+        token_version = payload.get("ver", 0)
+        revocation_index = payload.get("rli")
+        # Check the link's revocation bit (or its JTI), then the tenant-wide version
+        if revocation_index is not None:
+            revoked = await self.is_index_revoked(tenant_id, revocation_index)
+        else:
+            revoked = await self.is_revoked(jti)
+        if revoked or token_version < await self.token_version(tenant_id):
             raise jwt.InvalidTokenError("Token has been revoked")
-        return payload
+        # Compact claim names (as written by encode_share_token) win over long ones
+        return {
+            "tenant_id": tenant_id,
+            "document_id": payload.get("sub") or payload.get("document_id"),
+            "link_id": payload.get("lid") or payload.get("link_id"),
+            "jti": jti,
+            "expires_at": payload.get("exp"),
+            "permissions": payload.get("perms", {}),
+            "require_email": payload.get("require_email", False),
+            "email": payload.get("email"),
+            "token_version": token_version,
+            "revocation_index": revocation_index,
+        }
+
+    async def is_revoked(self, jti: str) -> bool:
+        return await self._revocations.is_revoked(jti)
 
-    async def revoke_jti(self, jti: str, expires_at: datetime) -> None:
-        self._revoked_jtis[jti] = expires_at
+    async def is_index_revoked(self, tenant_id: str, index: int) -> bool:
+        return await self._revocations.is_index_revoked(tenant_id, index)
+
+    async def revoke_jti(
+        self,
+        jti: str,
+        expires_at: datetime,
+        *,
+        tenant_id: Optional[str] = None,
+        revocation_index: Optional[int] = None,
+    ) -> None:
+        if revocation_index is not None and tenant_id is not None:
+            await self._revocations.revoke_index(tenant_id, revocation_index)
+        else:
+            await self._revocations.revoke(jti, epoch_seconds(expires_at))
+        for hook in self._revocation_hooks:
+            hook(jti)
 
+    async def token_version(self, tenant_id: str) -> int:
+        return await self._revocations.token_version(tenant_id)
 
+    async def bump_token_version(self, tenant_id: str) -> int:
+        return await self._revocations.bump_token_version(tenant_id)
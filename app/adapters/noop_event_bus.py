@@ -9,12 +9,11 @@ logging system.
 """
 from __future__ import annotations
 
-from typing import Any, Dict
-
+from app.domain.events import DomainEvent
 from app.ports.event_bus_port import EventBusPort
 
 
 class NoopEventBus(EventBusPort):
-    async def publish_event(self, tenant_id: str, event_name: str, payload: Dict[str, Any]) -> None:
+    async def publish_event(self, tenant_id: str, event: DomainEvent) -> None:
         # Intentionally do nothing
         return None
@@ -16,6 +16,7 @@ class HexIAMOIDCClient(OIDCClientPort):
         client_id: str | None = None,
         client_secret: str | None = None,
         timeout_s: float = 10.0,
+        http_client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         self.iam_url = (iam_url or os.getenv("HEXIAM_URL", "")).rstrip("/")
         self.client_id = client_id or os.getenv("HEXSHARE_CLIENT_ID", "")
@@ -25,6 +26,11 @@ class HexIAMOIDCClient(OIDCClientPort):
         if not self.iam_url or not self.client_id:
             raise RuntimeError("Missing HEXIAM_URL or HEXSHARE_CLIENT_ID")
 
+        # Reuse one keep-alive client across token exchanges; an injected
+        # client is owned (and closed) by whoever created it.
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.AsyncClient(timeout=self.timeout_s)
+
     @property
     def authorize_endpoint(self) -> str:
         return f"{self.iam_url}/api/v1/oidc/authorize"
@@ -77,8 +83,7 @@ class HexIAMOIDCClient(OIDCClientPort):
             basic = base64.b64encode(f"{self.client_id}:{self.client_secret}".encode()).decode()
             headers["Authorization"] = f"Basic {basic}"
 
-        async with httpx.AsyncClient(timeout=self.timeout_s) as client:
-            r = await client.post(self.token_endpoint, data=form, headers=headers)
+        r = await self._client.post(self.token_endpoint, data=form, headers=headers, timeout=self.timeout_s)
         r.raise_for_status()
         data = r.json()
 
@@ -103,8 +108,7 @@ class HexIAMOIDCClient(OIDCClientPort):
             basic = base64.b64encode(f"{self.client_id}:{self.client_secret}".encode()).decode()
             headers["Authorization"] = f"Basic {basic}"
 
-        async with httpx.AsyncClient(timeout=self.timeout_s) as client:
-            r = await client.post(self.token_endpoint, data=form, headers=headers)
+        r = await self._client.post(self.token_endpoint, data=form, headers=headers, timeout=self.timeout_s)
         r.raise_for_status()
         data = r.json()
 
@@ -116,4 +120,8 @@ class HexIAMOIDCClient(OIDCClientPort):
             token_type=data.get("token_type") or "Bearer",
             scope=data.get("scope"),
             raw=data,
-        )
\ No newline at end of file
+        )
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self._client.aclose()
@@ -11,11 +11,13 @@ from __future__ import annotations
 
 from collections import defaultdict
 from datetime import datetime
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
 
-from app.domain import Document, ShareLink, VisitorSession, ViewEvent
+from msgspec import structs
+
+from app.domain import Document, EventType, ShareLink, VisitorSession, ViewEvent
 from app.infra.factories import StorageFactory
-from app.ports.storage_port import StoragePort
+from app.ports.storage_port import DocumentNotFound, StoragePort
 
 
 class MemoryStorage(StoragePort):
@@ -37,15 +39,28 @@ class MemoryStorage(StoragePort):
     async def get_document(self, *, tenant_id: str, document_id: str) -> Optional[Document]:
         return self._documents.get(tenant_id, {}).get(document_id)
 
-    async def list_documents(self, *, tenant_id: str) -> Iterable[Document]:
+    async def get_documents_bulk(self, *, tenant_id: str, document_ids: Sequence[str]) -> Dict[str, Document]:
+        documents = self._documents.get(tenant_id, {})
+        return {doc_id: documents[doc_id] for doc_id in document_ids if doc_id in documents}
+
+    async def list_documents(self, *, tenant_id: str) -> list[Document]:
         return list(self._documents.get(tenant_id, {}).values())
 
     async def save_share_link(self, link: ShareLink) -> None:
         self._share_links[link.tenant_id][link.id] = link
 
+    async def save_share_link_if_document_exists(self, link: ShareLink) -> None:
+        if link.document_id not in self._documents.get(link.tenant_id, {}):
+            raise DocumentNotFound(link.document_id)
+        self._share_links[link.tenant_id][link.id] = link
+
     async def get_share_link(self, *, tenant_id: str, link_id: str) -> Optional[ShareLink]:
         return self._share_links.get(tenant_id, {}).get(link_id)
 
+    async def get_share_links_bulk(self, *, tenant_id: str, link_ids: Sequence[str]) -> Dict[str, ShareLink]:
+        links = self._share_links.get(tenant_id, {})
+        return {link_id: links[link_id] for link_id in link_ids if link_id in links}
+
     async def list_share_links(
         self, *, tenant_id: str, document_id: Optional[str] = None
     ) -> Iterable[ShareLink]:
@@ -59,8 +74,8 @@ class MemoryStorage(StoragePort):
     ) -> None:
         link = self._share_links.get(tenant_id, {}).get(link_id)
         if link:
-            # update link (replace with new instance to avoid side effects)
-            link.revoked_at = revoked_at
+            # links are immutable; store an updated copy
+            self._share_links[tenant_id][link_id] = structs.replace(link, revoked_at=revoked_at)
 
     async def save_visitor_session(self, session: VisitorSession) -> None:
         self._visitor_sessions[session.tenant_id][session.id] = session
@@ -68,11 +83,22 @@ class MemoryStorage(StoragePort):
     async def save_view_event(self, event: ViewEvent) -> None:
         self._view_events[event.tenant_id].append(event)
 
+    async def save_view_events(self, events: Sequence[ViewEvent]) -> None:
+        for event in events:
+            self._view_events[event.tenant_id].append(event)
+
     async def list_view_events(
         self, *, tenant_id: str, document_id: str
     ) -> Iterable[ViewEvent]:
         return [e for e in self._view_events.get(tenant_id, []) if e.document_id == document_id]
 
+    async def get_document_metrics(self, *, tenant_id: str, document_id: str) -> Dict[str, int]:
+        events = await self.list_view_events(tenant_id=tenant_id, document_id=document_id)
+        return {
+            "unique_visitors": len({e.visitor_session_id for e in events}),
+            "total_views": sum(1 for e in events if e.event_type == EventType.PAGE_VIEW),
+        }
+
 
 @StorageFactory.register("memory")
 def create_memory_storage(**_) -> StoragePort:
@@ -23,13 +23,15 @@ for the expected structure.
 """
 from __future__ import annotations
 
+import uuid
+
 import asyncpg  # type: ignore
 from datetime import datetime
-from typing import Iterable, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence
 
-from app.domain import Document, ShareLink, VisitorSession, ViewEvent
+from app.domain import Document, EventType, ShareLink, VisitorSession, ViewEvent
 from app.infra.factories import StorageFactory
-from app.ports.storage_port import StoragePort
+from app.ports.storage_port import DOCUMENT_COLUMNS, DocumentNotFound, StoragePort
 
 
 class PostgresStorage(StoragePort):
@@ -37,11 +39,9 @@ class PostgresStorage(StoragePort):
         self._pool = pool
 
     def generate_id(self, prefix: str) -> str:
-        # For PostgreSQL we may use sequences instead.  Here we
-        # generate a UUID-like string for demonstration.
-        import uuid
-
-        return f"{prefix}_{uuid.uuid4().hex}"
+        # UUIDv7 is time-ordered, so new rows append to the primary-key
+        # B-tree instead of splitting random pages the way uuid4 does.
+        return f"{prefix}_{uuid.uuid7().hex}"
 
     async def save_document(self, document: Document) -> None:
         sql = """
@@ -82,28 +82,57 @@ class PostgresStorage(StoragePort):
                 )
             return None
 
-    async def list_documents(self, *, tenant_id: str) -> Iterable[Document]:
+    async def get_documents_bulk(self, *, tenant_id: str, document_ids: Sequence[str]) -> Dict[str, Document]:
+        if not document_ids:
+            return {}
         sql = """
+        SELECT id, tenant_id, name, mime_type, size, storage_key, created_at, created_by
+        FROM documents
+        WHERE tenant_id = $1 AND id = ANY($2::text[])
+        """
+        async with self._pool.acquire() as con:
+            rows = await con.fetch(sql, tenant_id, list(document_ids))
+        return {row["id"]: self._document_from_row(row) for row in rows}
+
+    _LIST_DOCUMENTS_SQL = """
         SELECT id, tenant_id, name, mime_type, size, storage_key, created_at, created_by
         FROM documents
         WHERE tenant_id = $1
         ORDER BY created_at DESC
         """
+
+    @staticmethod
+    def _document_from_row(row: asyncpg.Record) -> Document:
+        return Document(
+            id=row["id"],
+            tenant_id=row["tenant_id"],
+            name=row["name"],
+            mime_type=row["mime_type"],
+            size=row["size"],
+            storage_key=row["storage_key"],
+            created_at=row["created_at"],
+            created_by=row["created_by"],
+        )
+
+    async def list_documents(self, *, tenant_id: str) -> list[Document]:
         async with self._pool.acquire() as con:
-            rows = await con.fetch(sql, tenant_id)
-        return [
-            Document(
-                id=row["id"],
-                tenant_id=row["tenant_id"],
-                name=row["name"],
-                mime_type=row["mime_type"],
-                size=row["size"],
-                storage_key=row["storage_key"],
-                created_at=row["created_at"],
-                created_by=row["created_by"],
-            )
-            for row in rows
-        ]
+            rows = await con.fetch(self._LIST_DOCUMENTS_SQL, tenant_id)
+        return [self._document_from_row(row) for row in rows]
+
+    async def list_documents_columns(self, *, tenant_id: str) -> Dict[str, List[Any]]:
+        async with self._pool.acquire() as con:
+            rows = await con.fetch(self._LIST_DOCUMENTS_SQL, tenant_id)
+        # _LIST_DOCUMENTS_SQL selects exactly DOCUMENT_COLUMNS, in order
+        columns = zip(*rows) if rows else ((),) * len(DOCUMENT_COLUMNS)
+        return {name: list(column) for name, column in zip(DOCUMENT_COLUMNS, columns)}
+
+    async def iter_documents(self, *, tenant_id: str) -> AsyncIterator[Document]:
+        # Server-side cursor: rows arrive in batches of 500 instead of the
+        # whole result set being buffered in memory.
+        async with self._pool.acquire() as con:
+            async with con.transaction():
+                async for row in con.cursor(self._LIST_DOCUMENTS_SQL, tenant_id, prefetch=500):
+                    yield self._document_from_row(row)
 
     # --- ShareLink operations -----------------------------------------
     async def save_share_link(self, link: ShareLink) -> None:
@@ -111,11 +140,11 @@ class PostgresStorage(StoragePort):
         INSERT INTO share_links (
             id, tenant_id, document_id, jti, expires_at,
             can_download, can_print, require_email, allowed_emails,
-            revoked_at, created_at, created_by
+            token_version, revocation_index, revoked_at, created_at, created_by
         ) VALUES (
             $1, $2, $3, $4, $5,
             $6, $7, $8, $9,
-            $10, $11, $12
+            $10, $11, $12, $13, $14
         )
         """
         async with self._pool.acquire() as con:
@@ -129,12 +158,70 @@ class PostgresStorage(StoragePort):
                 link.can_download,
                 link.can_print,
                 link.require_email,
-                link.allowed_emails,
+                sorted(link.allowed_emails),
+                link.token_version,
+                link.revocation_index,
                 link.revoked_at,
                 link.created_at,
                 link.created_by,
             )
 
+    async def save_share_link_if_document_exists(self, link: ShareLink) -> None:
+        # Existence check and insert in one statement / round-trip
+        sql = """
+        INSERT INTO share_links (
+            id, tenant_id, document_id, jti, expires_at,
+            can_download, can_print, require_email, allowed_emails,
+            token_version, revocation_index, revoked_at, created_at, created_by
+        )
+        SELECT
+            $1, $2, $3, $4, $5,
+            $6, $7, $8, $9,
+            $10, $11, $12, $13, $14
+        WHERE EXISTS (
+            SELECT 1 FROM documents WHERE tenant_id = $2 AND id = $3
+        )
+        """
+        async with self._pool.acquire() as con:
+            status = await con.execute(
+                sql,
+                link.id,
+                link.tenant_id,
+                link.document_id,
+                link.jti,
+                link.expires_at,
+                link.can_download,
+                link.can_print,
+                link.require_email,
+                sorted(link.allowed_emails),
+                link.token_version,
+                link.revocation_index,
+                link.revoked_at,
+                link.created_at,
+                link.created_by,
+            )
+        if status == "INSERT 0 0":
+            raise DocumentNotFound(link.document_id)
+
+    @staticmethod
+    def _share_link_from_row(row: asyncpg.Record) -> ShareLink:
+        return ShareLink(
+            id=row["id"],
+            tenant_id=row["tenant_id"],
+            document_id=row["document_id"],
+            jti=row["jti"],
+            expires_at=row["expires_at"],
+            can_download=row["can_download"],
+            can_print=row["can_print"],
+            require_email=row["require_email"],
+            allowed_emails=row["allowed_emails"],
+            token_version=row["token_version"],
+            revocation_index=row["revocation_index"],
+            revoked_at=row["revoked_at"],
+            created_at=row["created_at"],
+            created_by=row["created_by"],
+        )
+
     async def get_share_link(self, *, tenant_id: str, link_id: str) -> Optional[ShareLink]:
         sql = """
         SELECT * FROM share_links
@@ -144,20 +231,18 @@ class PostgresStorage(StoragePort):
             row = await con.fetchrow(sql, tenant_id, link_id)
             if not row:
                 return None
-            return ShareLink(
-                id=row["id"],
-                tenant_id=row["tenant_id"],
-                document_id=row["document_id"],
-                jti=row["jti"],
-                expires_at=row["expires_at"],
-                can_download=row["can_download"],
-                can_print=row["can_print"],
-                require_email=row["require_email"],
-                allowed_emails=row["allowed_emails"] or [],
-                revoked_at=row["revoked_at"],
-                created_at=row["created_at"],
-                created_by=row["created_by"],
-            )
+            return self._share_link_from_row(row)
+
+    async def get_share_links_bulk(self, *, tenant_id: str, link_ids: Sequence[str]) -> Dict[str, ShareLink]:
+        if not link_ids:
+            return {}
+        sql = """
+        SELECT * FROM share_links
+        WHERE tenant_id = $1 AND id = ANY($2::text[])
+        """
+        async with self._pool.acquire() as con:
+            rows = await con.fetch(sql, tenant_id, list(link_ids))
+        return {row["id"]: self._share_link_from_row(row) for row in rows}
 
     async def list_share_links(
         self, *, tenant_id: str, document_id: Optional[str] = None
@@ -172,23 +257,7 @@ class PostgresStorage(StoragePort):
             params.append(document_id)
         async with self._pool.acquire() as con:
             rows = await con.fetch(sql, *params)
-        return [
-            ShareLink(
-                id=row["id"],
-                tenant_id=row["tenant_id"],
-                document_id=row["document_id"],
-                jti=row["jti"],
-                expires_at=row["expires_at"],
-                can_download=row["can_download"],
-                can_print=row["can_print"],
-                require_email=row["require_email"],
-                allowed_emails=row["allowed_emails"] or [],
-                revoked_at=row["revoked_at"],
-                created_at=row["created_at"],
-                created_by=row["created_by"],
-            )
-            for row in rows
-        ]
+        return [self._share_link_from_row(row) for row in rows]
 
     async def revoke_share_link(
         self, *, tenant_id: str, link_id: str, revoked_at: Optional[datetime]
@@ -248,6 +317,34 @@ class PostgresStorage(StoragePort):
                 event.timestamp,
             )
 
+    async def save_view_events(self, events: Sequence[ViewEvent]) -> None:
+        if not events:
+            return
+        # One statement for the whole batch: each column goes over as an array
+        sql = """
+        INSERT INTO view_events (
+            id, tenant_id, document_id, share_link_id,
+            visitor_session_id, event_type, page_number, duration_ms, timestamp
+        )
+        SELECT * FROM unnest(
+            $1::text[], $2::text[], $3::text[], $4::text[],
+            $5::text[], $6::text[], $7::int[], $8::int[], $9::timestamp[]
+        )
+        """
+        async with self._pool.acquire() as con:
+            await con.execute(
+                sql,
+                [e.id for e in events],
+                [e.tenant_id for e in events],
+                [e.document_id for e in events],
+                [e.share_link_id for e in events],
+                [e.visitor_session_id for e in events],
+                [e.event_type.value for e in events],
+                [e.page_number for e in events],
+                [e.duration_ms for e in events],
+                [e.timestamp for e in events],
+            )
+
     async def list_view_events(
         self, *, tenant_id: str, document_id: str
     ) -> Iterable[ViewEvent]:
@@ -265,7 +362,7 @@ class PostgresStorage(StoragePort):
                 document_id=row["document_id"],
                 share_link_id=row["share_link_id"],
                 visitor_session_id=row["visitor_session_id"],
-                event_type=row["event_type"],
+                event_type=EventType(row["event_type"]),
                 page_number=row["page_number"],
                 duration_ms=row["duration_ms"],
                 timestamp=row["timestamp"],
@@ -273,6 +370,21 @@ class PostgresStorage(StoragePort):
             for row in rows
         ]
 
+    async def get_document_metrics(self, *, tenant_id: str, document_id: str) -> Dict[str, int]:
+        sql = """
+        SELECT
+            COUNT(DISTINCT visitor_session_id) AS unique_visitors,
+            COUNT(*) FILTER (WHERE event_type = $3) AS total_views
+        FROM view_events
+        WHERE tenant_id = $1 AND document_id = $2
+        """
+        async with self._pool.acquire() as con:
+            row = await con.fetchrow(sql, tenant_id, document_id, EventType.PAGE_VIEW.value)
+        return {
+            "unique_visitors": row["unique_visitors"],
+            "total_views": row["total_views"],
+        }
+
 
 @StorageFactory.register("postgres")
 def create_postgres_storage(*, pool, **_) -> StoragePort:
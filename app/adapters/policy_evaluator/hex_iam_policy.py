@@ -1,21 +1,70 @@
-from typing import Any, Mapping
-from app.core.authz import HEXIAMAction
+import logging
+from typing import Any, Iterable, Mapping
+
+from app.core.authz import evaluate_batch, hex_iam_permission_bits
 from app.infra.factories import PolicyEvaluatorRegistry
-from app.ports.policy_evaluator import PolicyEvaluatorPort
+from app.ports.policy_evaluator import CompiledPolicy, PolicyEvaluatorPort
+
+logger = logging.getLogger(__name__)
+
+
+def _required_bit(action: str) -> int:
+    return hex_iam_permission_bits.get(action) or hex_iam_permission_bits.get(action.lower()) or 0
+
+
+def _required_mask(actions: Iterable[str]) -> int | None:
+    # Merge the whole set into one required mask; None if any action is unknown
+    required = 0
+    for action in actions:
+        bit = _required_bit(action)
+        if not bit:
+            return None
+        required |= bit
+    return required
+
+
+class CompiledBitmaskPolicy:
+    """A HexIAM policy with every resource's grant already parsed to an int."""
+
+    __slots__ = ("_grants",)
+
+    def __init__(self, policy: Mapping[str, Any]) -> None:
+        self._grants: dict[str, int] = {}
+        for resource, mask in policy.items():
+            try:
+                self._grants[resource] = int(mask or 0)
+            except (TypeError, ValueError):
+                # A bad grant only denies its own resource
+                logger.warning("Ignoring malformed policy grant for %r: %r", resource, mask)
+
+    def evaluate(self, action: str, resource: str, context=None) -> bool:
+        required = _required_bit(action)
+        return bool(required) and evaluate_batch(self._grants.get(resource, 0), required)
+
+    def evaluate_all(self, actions: Iterable[str], resource: str, context=None) -> bool:
+        required = _required_mask(actions)
+        return required is not None and evaluate_batch(self._grants.get(resource, 0), required)
 
 
 class HexIamBitmaskEvaluator(PolicyEvaluatorPort):
     def evaluate(self, *, policy: Mapping[str, Any], action: str, resource: str, context=None) -> bool:
+        required = _required_bit(action)
+        if not required:
+            return False
+
         bitmask = int(policy.get(resource, 0) or 0)
-        key = action.upper()
+        return (bitmask & required) == required
 
-        if key not in HEXIAMAction.__members__:
+    def evaluate_all(self, *, policy: Mapping[str, Any], actions: Iterable[str], resource: str, context=None) -> bool:
+        required = _required_mask(actions)
+        if required is None:
             return False
+        return evaluate_batch(int(policy.get(resource, 0) or 0), required)
 
-        required = HEXIAMAction[key].value
-        return (bitmask & required) == required
+    def compile(self, policy: Mapping[str, Any]) -> CompiledPolicy:
+        return CompiledBitmaskPolicy(policy)
 
 
 @PolicyEvaluatorRegistry.register("hexiam_bitmask")
 def _build_hexiam_evaluator(**_) -> PolicyEvaluatorPort:
-    return HexIamBitmaskEvaluator()
\ No newline at end of file
+    return HexIamBitmaskEvaluator()
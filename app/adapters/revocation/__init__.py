@@ -0,0 +1,9 @@
+from .memory import MemoryRevocationStore
+from .redis_store import RedisRevocationStore
+from .postgres_store import PostgresRevocationStore
+
+__all__ = [
+    "MemoryRevocationStore",
+    "RedisRevocationStore",
+    "PostgresRevocationStore",
+]
@@ -0,0 +1,29 @@
+"""
+Bitstring revocation list.
+
+Each share link is allocated an index in its tenant's list when it is
+minted; revoking the link sets that bit and checking a token reads it,
+so one list of 8M links fits in 1 MiB and a lookup is a single bit test.
+Bits are ordered like Redis ``SETBIT``/``GETBIT`` (bit 0 is the most
+significant bit of the first byte), so a list can be loaded straight from
+the bytes of a Redis string.
+"""
+from __future__ import annotations
+
+
+class RevocationList:
+    __slots__ = ("_bits",)
+
+    def __init__(self, data: bytes = b"") -> None:
+        self._bits = bytearray(data)
+
+    def set(self, index: int) -> None:
+        byte = index >> 3
+        if byte >= len(self._bits):
+            # Grow to the highest index seen, as Redis does
+            self._bits.extend(bytes(byte + 1 - len(self._bits)))
+        self._bits[byte] |= 0x80 >> (index & 7)
+
+    def __getitem__(self, index: int) -> bool:
+        byte = index >> 3
+        return byte < len(self._bits) and bool(self._bits[byte] & (0x80 >> (index & 7)))
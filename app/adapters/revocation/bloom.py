@@ -0,0 +1,41 @@
+"""
+Bloom filter over revoked JTIs.
+
+A compact, in-process membership test used in front of a networked
+revocation store: a negative answer is definitive (the JTI was never
+added), a positive one may be a false positive and must be confirmed
+against the authoritative store.  Entries cannot be removed; the owner
+rebuilds the filter periodically so expired revocations drop out.
+"""
+from __future__ import annotations
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001) -> None:
+        # Optimal bit count and hash count for `capacity` items at `error_rate`
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        # Kirsch-Mitzenmacher double hashing: k positions from one 128-bit digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        bits = self._bits
+        for pos in self._positions(item):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        for pos in self._positions(item):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
@@ -0,0 +1,73 @@
+"""
+In‑memory revocation store.
+
+Keeps revoked JTIs in a per‑process TLRU cache whose entries expire
+together with the revoked token.  Suitable for a single worker or as a
+local fallback; revocations are not shared across processes and are
+lost on restart.  Tenant token versions are kept in a plain dict (one
+int per tenant), next to each tenant's bitstring revocation list.  The
+store never allocates revocation-list indexes itself: a counter that
+restarts at 0 with the process would hand a new link the index of a
+link minted before the restart, so links it mints are revoked by JTI.
+"""
+from __future__ import annotations
+
+import time
+
+from cachetools import TLRUCache
+
+from app.adapters.revocation.bitstring import RevocationList
+from app.infra.factories import RevocationStoreFactory
+from app.ports.revocation_store import RevocationStorePort
+
+
+class MemoryRevocationStore(RevocationStorePort):
+    def __init__(self, maxsize: int = 1_000_000) -> None:
+        # jti -> revocation expiry (unix seconds); each entry expires with its token
+        self._revoked_jtis: TLRUCache[str, float] = TLRUCache(
+            maxsize=maxsize, ttu=lambda _jti, expiry, _now: expiry, timer=time.time
+        )
+        self._token_versions: dict[str, int] = {}
+        self._lists: dict[str, RevocationList] = {}
+
+    def record(self, jti: str, expires_at: float) -> None:
+        """Synchronous :meth:`revoke`, for callbacks that cannot await."""
+        self._revoked_jtis[jti] = expires_at
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        self.record(jti, expires_at)
+
+    async def is_revoked(self, jti: str) -> bool:
+        return jti in self._revoked_jtis
+
+    def record_token_version(self, tenant_id: str, version: int) -> None:
+        """Raises the known version of ``tenant_id``; out-of-order updates never lower it."""
+        if version > self._token_versions.get(tenant_id, 0):
+            self._token_versions[tenant_id] = version
+
+    async def token_version(self, tenant_id: str) -> int:
+        return self._token_versions.get(tenant_id, 0)
+
+    async def bump_token_version(self, tenant_id: str) -> int:
+        version = self._token_versions.get(tenant_id, 0) + 1
+        self._token_versions[tenant_id] = version
+        return version
+
+    def record_index(self, tenant_id: str, index: int) -> None:
+        """Synchronous :meth:`revoke_index`, for callbacks that cannot await."""
+        revocation_list = self._lists.get(tenant_id)
+        if revocation_list is None:
+            revocation_list = self._lists[tenant_id] = RevocationList()
+        revocation_list.set(index)
+
+    async def revoke_index(self, tenant_id: str, index: int) -> None:
+        self.record_index(tenant_id, index)
+
+    async def is_index_revoked(self, tenant_id: str, index: int) -> bool:
+        revocation_list = self._lists.get(tenant_id)
+        return revocation_list is not None and revocation_list[index]
+
+
+@RevocationStoreFactory.register("memory")
+def create_memory_revocation_store(**_) -> RevocationStorePort:
+    return MemoryRevocationStore()
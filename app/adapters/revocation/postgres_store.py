@@ -0,0 +1,162 @@
+"""
+PostgreSQL revocation store.
+
+Keeps the revoked-JTI set in process memory so ``is_revoked`` is a local
+membership test, never a database round-trip.  At startup the set is
+loaded from ``share_links`` (every revoked link whose token has not
+expired yet); afterwards workers keep each other in sync with
+``LISTEN``/``NOTIFY`` on the ``share_link_revoked`` channel, each
+notification carrying ``"<jti> <expires_at>"``.
+
+Tenant token versions live in ``share_token_versions`` (one row per
+tenant that has ever bulk-revoked) and are mirrored the same way over
+``share_token_version`` notifications carrying ``"<tenant_id> <version>"``.
+If the ``LISTEN`` connection drops, the store listens again on a new
+connection and reloads both sets, so nothing revoked meanwhile is missed.
+The table and the ``share_links.token_version`` column are created by
+``app/infra/migrations/0001_share_token_versions.sql``.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+import asyncpg
+
+from app.adapters.revocation.memory import MemoryRevocationStore
+from app.infra.factories import RevocationStoreFactory
+from app.ports.clock import epoch_seconds
+from app.ports.revocation_store import RevocationStorePort
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "share_link_revoked"
+VERSION_CHANNEL = "share_token_version"
+
+# Delay before re-listening after the LISTEN connection drops
+_RECONNECT_S = 1.0
+
+# Increment (or create) the tenant's version and broadcast it in one round-trip
+_BUMP_VERSION_SQL = """
+WITH bumped AS (
+    INSERT INTO share_token_versions (tenant_id, version) VALUES ($1, 1)
+    ON CONFLICT (tenant_id) DO UPDATE SET version = share_token_versions.version + 1
+    RETURNING version
+)
+SELECT version, pg_notify($2, $1 || ' ' || version) FROM bumped
+"""
+
+
+class PostgresRevocationStore(RevocationStorePort):
+    def __init__(self, pool: asyncpg.Pool) -> None:
+        self._pool = pool
+        self._local = MemoryRevocationStore()
+        self._listener: Optional[asyncpg.Connection] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        await self._listen()
+
+    async def _listen(self) -> None:
+        # Subscribe before loading so a revocation made in between is not missed.
+        listener = await self._pool.acquire()
+        try:
+            await listener.add_listener(CHANNEL, self._on_notify)
+            await listener.add_listener(VERSION_CHANNEL, self._on_version_notify)
+            listener.add_termination_listener(self._on_terminated)
+            await self._load(listener)
+        except BaseException:
+            # Pool resets drop notification listeners but not termination ones
+            listener.remove_termination_listener(self._on_terminated)
+            await self._pool.release(listener)
+            raise
+        self._listener = listener
+
+    async def _load(self, con: asyncpg.Connection) -> None:
+        # share_links timestamps are naive UTC
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        rows = await con.fetch(
+            "SELECT jti, expires_at FROM share_links WHERE revoked_at IS NOT NULL AND expires_at > $1", now
+        )
+        for row in rows:
+            self._local.record(row["jti"], epoch_seconds(row["expires_at"]))
+        logger.info("Loaded %d revoked share-link JTIs", len(rows))
+
+        for row in await con.fetch("SELECT tenant_id, version FROM share_token_versions"):
+            self._local.record_token_version(row["tenant_id"], row["version"])
+
+    def _on_terminated(self, con: asyncpg.Connection) -> None:
+        if con is not self._listener:
+            return
+        # Notifications sent from now on are lost; listen again and reload
+        # the full state, which covers whatever was revoked in between.
+        logger.warning("Revocation LISTEN connection lost; reconnecting")
+        self._listener = None
+        self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect(con))
+
+    async def _reconnect(self, dead: asyncpg.Connection) -> None:
+        try:
+            await self._pool.release(dead)
+        except Exception:
+            logger.debug("Releasing the dead LISTEN connection failed", exc_info=True)
+        while True:
+            await asyncio.sleep(_RECONNECT_S)
+            try:
+                await self._listen()
+                logger.info("Revocation LISTEN connection restored")
+                return
+            except (asyncpg.PostgresError, OSError, asyncio.TimeoutError):
+                logger.warning("Revocation LISTEN reconnect failed; retrying", exc_info=True)
+
+    def _on_notify(self, _conn, _pid, _channel, payload: str) -> None:
+        jti, _, expires_at = payload.partition(" ")
+        try:
+            self._local.record(jti, float(expires_at))
+        except ValueError:
+            logger.warning("Ignoring malformed %s payload: %r", CHANNEL, payload)
+
+    def _on_version_notify(self, _conn, _pid, _channel, payload: str) -> None:
+        tenant_id, _, version = payload.rpartition(" ")
+        try:
+            self._local.record_token_version(tenant_id, int(version))
+        except ValueError:
+            logger.warning("Ignoring malformed %s payload: %r", VERSION_CHANNEL, payload)
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        await self._local.revoke(jti, expires_at)
+        async with self._pool.acquire() as con:
+            await con.execute("SELECT pg_notify($1, $2)", CHANNEL, f"{jti} {expires_at}")
+
+    async def is_revoked(self, jti: str) -> bool:
+        return await self._local.is_revoked(jti)
+
+    async def token_version(self, tenant_id: str) -> int:
+        return await self._local.token_version(tenant_id)
+
+    async def bump_token_version(self, tenant_id: str) -> int:
+        async with self._pool.acquire() as con:
+            version = await con.fetchval(_BUMP_VERSION_SQL, tenant_id, VERSION_CHANNEL)
+        self._local.record_token_version(tenant_id, version)
+        return version
+
+    async def aclose(self) -> None:
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            try:
+                await self._reconnect_task
+            except asyncio.CancelledError:
+                pass
+            self._reconnect_task = None
+        if self._listener is not None:
+            self._listener.remove_termination_listener(self._on_terminated)
+            await self._listener.remove_listener(CHANNEL, self._on_notify)
+            await self._listener.remove_listener(VERSION_CHANNEL, self._on_version_notify)
+            await self._pool.release(self._listener)
+            self._listener = None
+
+
+@RevocationStoreFactory.register("postgres")
+def create_postgres_revocation_store(*, pool: asyncpg.Pool, **_) -> RevocationStorePort:
+    return PostgresRevocationStore(pool)
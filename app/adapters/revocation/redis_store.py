@@ -0,0 +1,304 @@
+"""
+Redis revocation store.
+
+Stores each revoked JTI as ``revoked:{jti}`` with an expiry matching the
+token's remaining lifetime, so Redis cleans up on its own and every API
+worker shares one revocation set.  A local in‑memory mirror answers for
+revocations made by this process and keeps decodes working if Redis is
+unreachable.
+
+An in-process Bloom filter of every revoked JTI fronts the Redis lookup:
+a JTI the filter has never seen is reported as not revoked without a
+network round-trip, and only filter hits are confirmed with ``EXISTS``.
+Workers keep their filters in sync by publishing each revocation on the
+``revoked`` channel; the filter is also rebuilt from a ``SCAN`` of the
+keyspace every ``bloom_rebuild_s`` so expired revocations drop out.  While
+the subscription is down the filter is not trusted and every lookup goes
+to Redis.
+
+Tenant token versions are counters at ``token_version:{tenant_id}``
+(``INCR`` on bump).  Versions read from Redis are cached locally and kept
+current by ``token_version`` pub/sub messages (``"<tenant_id> <version>"``);
+the cache is only used while that subscription is up.  A bump made while
+Redis is unreachable is kept in the local mirror, like a revocation.
+
+Revocation lists are Redis strings at ``revocation_list:{tenant_id}``:
+links are revoked with ``SETBIT`` and announced on ``revoked_index``
+(``"<tenant_id> <index>"``).  Each tenant's list is fetched with one
+``GET`` and then answered from a local copy, kept current by those
+messages while the subscription is up; while it is down each lookup is a
+single ``GETBIT``.  Indexes are allocated from a per-tenant counter in
+PostgreSQL (``share_link_revocation_counters``), not Redis, so they stay
+unique across restarts and a lost key; without a pool links are revoked
+by JTI.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from typing import Optional
+
+import asyncpg
+import redis.asyncio as redis
+
+from app.adapters.revocation.bitstring import RevocationList
+from app.adapters.revocation.bloom import BloomFilter
+from app.adapters.revocation.memory import MemoryRevocationStore
+from app.infra.factories import RevocationStoreFactory
+from app.ports.revocation_store import RevocationStorePort
+
+logger = logging.getLogger(__name__)
+
+# Delay before resubscribing after the pub/sub connection drops
+_RESUBSCRIBE_S = 1.0
+
+# Hand out the tenant's next revocation-list index (starting at 0)
+_ALLOCATE_INDEX_SQL = """
+INSERT INTO share_link_revocation_counters (tenant_id, next_index) VALUES ($1, 1)
+ON CONFLICT (tenant_id) DO UPDATE SET next_index = share_link_revocation_counters.next_index + 1
+RETURNING next_index - 1
+"""
+
+
+class RedisRevocationStore(RevocationStorePort):
+    def __init__(
+        self,
+        client: redis.Redis,
+        *,
+        pool: Optional[asyncpg.Pool] = None,
+        key_prefix: str = "revoked:",
+        channel: str = "revoked",
+        version_prefix: str = "token_version:",
+        version_channel: str = "token_version",
+        list_prefix: str = "revocation_list:",
+        index_channel: str = "revoked_index",
+        bloom_capacity: int = 1_000_000,
+        bloom_error_rate: float = 0.001,
+        bloom_rebuild_s: float = 300.0,
+    ) -> None:
+        self._redis = client
+        self._pool = pool
+        self._key_prefix = key_prefix
+        self._channel = channel
+        self._version_prefix = version_prefix
+        self._version_channel = version_channel
+        self._list_prefix = list_prefix
+        self._index_channel = index_channel
+        self._local = MemoryRevocationStore()
+        # tenant_id -> token version / revocation list, valid while subscribed (see _sync)
+        self._versions: dict[str, int] = {}
+        self._lists: dict[str, RevocationList] = {}
+        # Indexes announced while a tenant's list is being fetched, per fetch
+        self._pending: dict[str, list[list[int]]] = {}
+
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self.bloom_rebuild_s = bloom_rebuild_s
+        self._bloom = BloomFilter(bloom_capacity, bloom_error_rate)
+        # Filter being rebuilt; revocations seen meanwhile go into both
+        self._next_bloom: Optional[BloomFilter] = None
+        # Bloom filter, version cache and lists are only trusted while subscribed
+        # and after a complete load
+        self._bloom_ready = False
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._sync())
+
+    def _add_to_bloom(self, jti: str) -> None:
+        self._bloom.add(jti)
+        if self._next_bloom is not None:
+            self._next_bloom.add(jti)
+
+    async def _rebuild_bloom(self) -> None:
+        self._next_bloom = BloomFilter(self.bloom_capacity, self.bloom_error_rate)
+        try:
+            prefix_len = len(self._key_prefix)
+            async for key in self._redis.scan_iter(match=self._key_prefix + "*", count=1000):
+                self._next_bloom.add(key[prefix_len:].decode())
+            self._bloom = self._next_bloom
+        finally:
+            self._next_bloom = None
+
+    def _on_message(self, message: dict) -> None:
+        data = message["data"].decode()
+        channel = message["channel"].decode()
+        if channel == self._version_channel:
+            tenant_id, _, raw_version = data.rpartition(" ")
+            version = int(raw_version)
+            if version > self._versions.get(tenant_id, 0):
+                self._versions[tenant_id] = version
+        elif channel == self._index_channel:
+            tenant_id, _, raw_index = data.rpartition(" ")
+            index = int(raw_index)
+            if index < 0:
+                raise ValueError(f"negative revocation index {index}")
+            self._set_cached_bit(tenant_id, index)
+        else:
+            self._add_to_bloom(data)
+
+    def _set_cached_bit(self, tenant_id: str, index: int) -> None:
+        revocation_list = self._lists.get(tenant_id)
+        if revocation_list is not None:
+            revocation_list.set(index)
+        for pending in self._pending.get(tenant_id, ()):
+            pending.append(index)
+
+    async def _sync(self) -> None:
+        while True:
+            try:
+                async with self._redis.pubsub() as pubsub:
+                    # Subscribe before loading so a revocation made in between is not missed.
+                    await pubsub.subscribe(self._channel, self._version_channel, self._index_channel)
+                    await self._rebuild_bloom()
+                    self._bloom_ready = True
+                    rebuild_at = time.monotonic() + self.bloom_rebuild_s
+                    while True:
+                        message = await pubsub.get_message(
+                            ignore_subscribe_messages=True,
+                            timeout=max(0.0, rebuild_at - time.monotonic()),
+                        )
+                        if message is not None:
+                            try:
+                                self._on_message(message)
+                            except ValueError:
+                                # Includes UnicodeDecodeError; one bad payload must not end the sync
+                                logger.warning("Ignoring malformed revocation message %r", message, exc_info=True)
+                        elif time.monotonic() >= rebuild_at:
+                            await self._rebuild_bloom()
+                            rebuild_at = time.monotonic() + self.bloom_rebuild_s
+            except (redis.RedisError, OSError):
+                logger.warning("Redis revocation subscription lost; bypassing Bloom filter", exc_info=True)
+            finally:
+                self._bloom_ready = False
+                self._versions.clear()
+                self._lists.clear()
+            await asyncio.sleep(_RESUBSCRIBE_S)
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        await self._local.revoke(jti, expires_at)
+        self._add_to_bloom(jti)
+        ttl = max(1, int(expires_at - time.time()))
+        try:
+            await self._redis.set(self._key_prefix + jti, 1, ex=ttl)
+            await self._redis.publish(self._channel, jti)
+        except redis.RedisError:
+            logger.warning("Redis unavailable; revocation of %s recorded locally only", jti, exc_info=True)
+
+    async def is_revoked(self, jti: str) -> bool:
+        if await self._local.is_revoked(jti):
+            return True
+        if self._bloom_ready and jti not in self._bloom:
+            return False
+        try:
+            return bool(await self._redis.exists(self._key_prefix + jti))
+        except redis.RedisError:
+            logger.warning("Redis unavailable; falling back to local revocation list", exc_info=True)
+            return False
+
+    async def token_version(self, tenant_id: str) -> int:
+        # A bump made while Redis was down is only known locally
+        local_version = await self._local.token_version(tenant_id)
+        if self._bloom_ready and tenant_id in self._versions:
+            return max(self._versions[tenant_id], local_version)
+        try:
+            version = int(await self._redis.get(self._version_prefix + tenant_id) or 0)
+        except redis.RedisError:
+            logger.warning("Redis unavailable; falling back to local token versions", exc_info=True)
+            return local_version
+        if self._bloom_ready:
+            self._versions[tenant_id] = max(version, self._versions.get(tenant_id, 0))
+        return max(version, local_version)
+
+    async def bump_token_version(self, tenant_id: str) -> int:
+        try:
+            version = await self._redis.incr(self._version_prefix + tenant_id)
+        except redis.RedisError:
+            logger.warning("Redis unavailable; token version bump of %s recorded locally only",
+                           tenant_id, exc_info=True)
+            known = max(self._versions.get(tenant_id, 0), await self._local.token_version(tenant_id))
+            version = known + 1
+            self._local.record_token_version(tenant_id, version)
+            return version
+        self._local.record_token_version(tenant_id, version)
+        try:
+            await self._redis.publish(self._version_channel, f"{tenant_id} {version}")
+        except redis.RedisError:
+            logger.warning("Redis unavailable; token version %d of %s not announced",
+                           version, tenant_id, exc_info=True)
+        return version
+
+    async def allocate_revocation_index(self, tenant_id: str) -> Optional[int]:
+        if self._pool is None:
+            return None
+        try:
+            async with self._pool.acquire() as con:
+                return await con.fetchval(_ALLOCATE_INDEX_SQL, tenant_id)
+        except (asyncpg.PostgresError, OSError):
+            # The link is revoked by JTI instead
+            logger.warning("Index allocation failed; share link minted without a revocation index", exc_info=True)
+            return None
+
+    async def revoke_index(self, tenant_id: str, index: int) -> None:
+        self._local.record_index(tenant_id, index)
+        self._set_cached_bit(tenant_id, index)
+        try:
+            await self._redis.setbit(self._list_prefix + tenant_id, index, 1)
+            await self._redis.publish(self._index_channel, f"{tenant_id} {index}")
+        except redis.RedisError:
+            logger.warning("Redis unavailable; revocation of %s[%d] recorded locally only",
+                           tenant_id, index, exc_info=True)
+
+    async def _load_list(self, tenant_id: str) -> RevocationList:
+        pending: list[int] = []
+        self._pending.setdefault(tenant_id, []).append(pending)
+        try:
+            raw = await self._redis.get(self._list_prefix + tenant_id)
+        finally:
+            fetches = self._pending[tenant_id]
+            fetches.remove(pending)
+            if not fetches:
+                del self._pending[tenant_id]
+        revocation_list = RevocationList(raw or b"")
+        # Revoked after the GET was served but announced before it returned
+        for index in pending:
+            revocation_list.set(index)
+        if self._bloom_ready:
+            self._lists[tenant_id] = revocation_list
+        return revocation_list
+
+    async def is_index_revoked(self, tenant_id: str, index: int) -> bool:
+        if await self._local.is_index_revoked(tenant_id, index):
+            return True
+        try:
+            if not self._bloom_ready:
+                # No pub/sub to keep a local copy current: read just this bit
+                return bool(await self._redis.getbit(self._list_prefix + tenant_id, index))
+            revocation_list = self._lists.get(tenant_id)
+            if revocation_list is None:
+                revocation_list = await self._load_list(tenant_id)
+        except redis.RedisError:
+            logger.warning("Redis unavailable; falling back to local revocation lists", exc_info=True)
+            return False
+        return revocation_list[index]
+
+    async def aclose(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._redis.aclose()
+
+
+@RevocationStoreFactory.register("redis")
+def create_redis_revocation_store(*, pool: Optional[asyncpg.Pool] = None, **_) -> RevocationStorePort:
+    redis_url = os.getenv("REDIS_URL")
+    if not redis_url:
+        # Redis is optional: without it revocations stay per-process
+        return MemoryRevocationStore()
+    return RedisRevocationStore(redis.Redis.from_url(redis_url), pool=pool)
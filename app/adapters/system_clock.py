@@ -0,0 +1,17 @@
+"""
+System clock adapter.
+
+Implements :class:`~app.ports.clock.ClockPort` with the wall clock.
+``datetime.utcnow()`` is deprecated; the aware UTC time is taken and its
+tzinfo dropped, since persisted timestamps are naive UTC.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from app.ports.clock import ClockPort
+
+
+class SystemClock(ClockPort):
+    def now(self) -> datetime:
+        return datetime.now(timezone.utc).replace(tzinfo=None)
@@ -0,0 +1,47 @@
+"""
+Response classes for the HexShare API.
+
+FastAPI's own ``ORJSONResponse`` is deprecated in favour of response-model
+serialization; HexShare keeps an equivalent here as the app's default
+response class so plain dict/list payloads are encoded by orjson instead
+of the stdlib ``json`` module.
+
+Routes that return domain structs pre-encoded by msgspec bypass FastAPI's
+``response_model``; :func:`struct_responses` describes their body in the
+OpenAPI schema instead, from msgspec's own JSON Schema for the type.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import msgspec
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _inline_refs(schema: Any, components: dict[str, Any]) -> Any:
+    # The domain structs do not nest each other, so inlining always terminates
+    if isinstance(schema, dict):
+        ref = schema.get("$ref")
+        if ref is not None:
+            return _inline_refs(components[ref.rpartition("/")[2]], components)
+        return {key: _inline_refs(value, components) for key, value in schema.items()}
+    if isinstance(schema, list):
+        return [_inline_refs(item, components) for item in schema]
+    return schema
+
+
+def struct_responses(response_type: Any) -> dict[int | str, dict[str, Any]]:
+    """``responses=`` entry documenting a 200 JSON body of ``response_type`` (a msgspec type)."""
+    (schema,), components = msgspec.json.schema_components((response_type,))
+    return {
+        200: {
+            "description": "Successful Response",
+            "content": {"application/json": {"schema": _inline_refs(schema, components)}},
+        }
+    }
@@ -1,30 +1,43 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import AsyncIterator, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
-from app.api.dependencies.services import (get_document_service, get_link_service,
-                                           get_analytics_service, get_share_auth)
-from app.auth.tenant_auth import get_tenant_auth
-from app.domain import Document, ShareLink
+from app.api.responses import OrjsonResponse, struct_responses
+from app.auth.tenant_auth import CurrentPrincipal
+from app.domain import Document, ShareLink, json_encoder
+from app.ports.storage_port import DocumentNotFound
 from app.services import DocumentService, LinkService, AnalyticsService
-from app.auth import TenantPrincipal, ShareTokenClaims
+from app.auth import ShareTokenClaims
+
+
+def _json(value) -> Response:
+    # Domain structs are encoded by msgspec directly; FastAPI passes the
+    # pre-encoded Response through untouched.
+    return Response(content=json_encoder.encode(value), media_type="application/json")
+
+
+async def _ndjson(documents: AsyncIterator[Document]) -> AsyncIterator[bytes]:
+    async for document in documents:
+        yield json_encoder.encode(document) + b"\n"
 
 
 def api_router() -> APIRouter:
     router = APIRouter()
 
-    @router.post("/documents", response_model=Document)
+    @router.post("/documents", responses=struct_responses(Document))
     async def create_document(
+        request: Request,
+        principal: CurrentPrincipal,
         name: str = Query(..., description="Name of the document"),
         mime_type: str = Query(..., description="MIME type"),
         size: int = Query(..., description="Size in bytes"),
         storage_key: str = Query(..., description="Key in object storage"),
-        principal: TenantPrincipal = Depends(get_tenant_auth()),
-        document_service: DocumentService = Depends(get_document_service),
-    ) -> Document:
-        return await document_service.create_document(
+    ) -> Response:
+        document_service: DocumentService = request.app.state.document_service
+        doc = await document_service.create_document(
             tenant_id=principal.tenant_id,
             name=name,
             mime_type=mime_type,
@@ -32,91 +45,127 @@ def api_router() -> APIRouter:
             storage_key=storage_key,
             created_by=principal.user_id,
         )
+        return _json(doc)
 
-    @router.get("/documents", response_model=list[Document])
+    @router.get("/documents", responses=struct_responses(list[Document]))
     async def list_documents(
-            principal: TenantPrincipal = Depends(get_tenant_auth()),
-            document_service: DocumentService = Depends(get_document_service)
-    ) -> list[Document]:
+            request: Request,
+            principal: CurrentPrincipal,
+    ) -> Response:
         print(principal)
+        document_service: DocumentService = request.app.state.document_service
         docs = await document_service.list_documents(tenant_id=principal.tenant_id)
-        return list(docs)
+        return _json(docs)
 
-    @router.get("/documents/{document_id}", response_model=Document)
+    @router.get("/documents/export")
+    async def export_documents(
+            request: Request,
+            principal: CurrentPrincipal,
+    ) -> StreamingResponse:
+        """Stream every tenant document as NDJSON, one object per line."""
+        document_service: DocumentService = request.app.state.document_service
+        docs = document_service.iter_documents(tenant_id=principal.tenant_id)
+        return StreamingResponse(_ndjson(docs), media_type="application/x-ndjson")
+
+    @router.get("/documents/{document_id}", responses=struct_responses(Document))
     async def get_document(
         document_id: str,
-        principal: TenantPrincipal = Depends(get_tenant_auth()),
-        document_service: DocumentService = Depends(get_document_service),
-    ) -> Document:
+        request: Request,
+        principal: CurrentPrincipal,
+    ) -> Response:
+        document_service: DocumentService = request.app.state.document_service
         doc = await document_service.get_document(
             tenant_id=principal.tenant_id, document_id=document_id
         )
         if not doc:
             raise HTTPException(status_code=404, detail="Document not found")
-        return doc
+        return _json(doc)
 
-    @router.post("/documents/{document_id}/links", response_model=ShareLink)
+    @router.post("/documents/{document_id}/links", responses=struct_responses(ShareLink))
     async def create_link(
         document_id: str,
+        request: Request,
+        principal: CurrentPrincipal,
         expires_in: int = Query(3600, description="Seconds until link expiry"),
         can_download: bool = Query(False),
         can_print: bool = Query(False),
         require_email: bool = Query(False),
         allowed_emails: Optional[list[str]] = Query(None),
-        principal: TenantPrincipal = Depends(get_tenant_auth()),
-        document_service: DocumentService = Depends(get_document_service),
-        link_service: LinkService = Depends(get_link_service),
-    ) -> ShareLink:
-        if not await document_service.get_document(
-            tenant_id=principal.tenant_id, document_id=document_id
-        ):
+    ) -> Response:
+        link_service: LinkService = request.app.state.link_service
+        try:
+            link = await link_service.create_share_link_if_document_exists(
+                tenant_id=principal.tenant_id,
+                document_id=document_id,
+                created_by=principal.user_id,
+                expires_in_seconds=expires_in,
+                can_download=can_download,
+                can_print=can_print,
+                require_email=require_email,
+                allowed_emails=allowed_emails,
+            )
+        except DocumentNotFound:
             raise HTTPException(status_code=404, detail="Document not found")
-        link = await link_service.create_share_link(
-            tenant_id=principal.tenant_id,
-            document_id=document_id,
-            created_by=principal.user_id,
-            expires_in_seconds=expires_in,
-            can_download=can_download,
-            can_print=can_print,
-            require_email=require_email,
-            allowed_emails=allowed_emails,
-        )
-        return link
+        return _json(link)
 
     @router.post("/links/{link_id}/revoke")
     async def revoke_link(
         link_id: str,
-        principal: TenantPrincipal = Depends(get_tenant_auth),
-        link_service: LinkService = Depends(get_link_service),
+        request: Request,
+        principal: CurrentPrincipal,
     ) -> None:
+        link_service: LinkService = request.app.state.link_service
         await link_service.revoke_share_link(
             tenant_id=principal.tenant_id, link_id=link_id, revoked_by=principal.user_id
         )
         return None
 
+    @router.post("/links/revoke-all")
+    async def revoke_all_links(
+        request: Request,
+        principal: CurrentPrincipal,
+    ) -> None:
+        link_service: LinkService = request.app.state.link_service
+        await link_service.revoke_all_share_links(
+            tenant_id=principal.tenant_id, revoked_by=principal.user_id
+        )
+        return None
+
     @router.get("/documents/{document_id}/analytics")
     async def document_analytics(
         document_id: str,
-        principal: TenantPrincipal = Depends(get_tenant_auth()),
-        analytics_service: AnalyticsService = Depends(get_analytics_service),
-    ) -> dict:
+        request: Request,
+        principal: CurrentPrincipal,
+    ) -> OrjsonResponse:
+        analytics_service: AnalyticsService = request.app.state.analytics_service
         metrics = await analytics_service.get_document_metrics(
             tenant_id=principal.tenant_id, document_id=document_id
         )
-        return metrics
+        return OrjsonResponse(metrics)
 
     @router.get("/view/{token}")
-    async def view_document(claims: ShareTokenClaims = Depends(get_share_auth)) -> dict:
+    async def view_document(token: str, request: Request, email: Optional[str] = Query(None)) -> OrjsonResponse:
         """Example endpoint demonstrating share token usage.
 
         In a real application this would return an HTML/JS viewer that
         loads the document.  Here we return the claims for inspection.
+        Links that require an email are only opened for a visitor email
+        on the link's allow-list (any email when it has none).
         """
-        return {
+        claims: ShareTokenClaims = await request.app.state.share_auth(token)
+        if claims.require_email:
+            email = email or claims.email
+            if not email:
+                raise HTTPException(status_code=401, detail="Email required")
+            link_service: LinkService = request.app.state.link_service
+            link = await link_service.get_share_link(tenant_id=claims.tenant_id, link_id=claims.link_id)
+            if link is None or not link_service.email_allowed(link, email):
+                raise HTTPException(status_code=403, detail="Email not allowed for this link")
+        return OrjsonResponse({
             "tenant": claims.tenant_id,
             "document": claims.document_id,
             "link": claims.link_id,
             "permissions": claims.permissions,
-        }
+        })
 
     return router
@@ -8,12 +8,16 @@ integrate with FastAPI and can be injected into route handlers via
 interface to perform token validation and extract claims.
 """
 
-from .tenant_auth import TenantAuthDependency, TenantPrincipal
+from .tenant_auth import CurrentPrincipal, TenantAuthDependency, TenantPrincipal, get_principal
 from .share_token_auth import ShareTokenDependency, ShareTokenClaims
+from .middleware import TenantAuthMiddleware
 
 __all__ = [
     "TenantAuthDependency",
     "TenantPrincipal",
+    "TenantAuthMiddleware",
+    "get_principal",
+    "CurrentPrincipal",
     "ShareTokenDependency",
     "ShareTokenClaims",
 ]
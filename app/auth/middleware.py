@@ -0,0 +1,44 @@
+"""
+Tenant authentication middleware.
+
+Extracts the HexIAM access token once per HTTP request, before routing,
+and stores it in the request state as ``auth_token``.  Nothing is
+verified here: routes opt in to authentication with
+``Depends(get_principal)``, which verifies the token (in FastAPI's
+threadpool, since a cache miss checks a signature) only when a route
+asks for it, so routes that do not need it (share-token views, the OIDC
+flow) never pay for it.
+
+Implemented as a pure ASGI middleware rather than ``BaseHTTPMiddleware``
+so it adds no extra task or body-streaming wrapper per request.
+"""
+from __future__ import annotations
+
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.authz import AUTH_COOKIE
+
+
+class TenantAuthMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            self._extract_token(scope)
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _extract_token(scope: Scope) -> None:
+        conn = HTTPConnection(scope)
+
+        # 1) Prefer Authorization header (API clients), 2) fall back to cookie (browser)
+        token = None
+        scheme, _, credentials = conn.headers.get("authorization", "").partition(" ")
+        if scheme.lower() == "bearer" and credentials:
+            token = credentials
+        if not token:
+            token = conn.cookies.get(AUTH_COOKIE)
+        if token:
+            scope.setdefault("state", {})["auth_token"] = token
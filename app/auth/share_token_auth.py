@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import hashlib
+import time
 from dataclasses import dataclass
 
+from cachetools import TLRUCache
 from fastapi import HTTPException
 
 from app.ports.token_port import TokenPort
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ShareTokenClaims:
     tenant_id: str
     document_id: str
@@ -17,26 +20,60 @@ class ShareTokenClaims:
     permissions: dict[str, bool]
     require_email: bool
     email: str | None = None
+    token_version: int = 0
+    revocation_index: int | None = None
 
 
 class ShareTokenDependency:
     """Callable dependency that validates a share token."""
 
-    def __init__(self, token_port: TokenPort) -> None:
+    def __init__(self, token_port: TokenPort, *, cache_maxsize: int = 10_000) -> None:
         self._token_port = token_port
+        # Verified claims keyed by token digest, each kept until the token's own exp.
+        self._claims_cache: TLRUCache[bytes, ShareTokenClaims] = TLRUCache(
+            maxsize=cache_maxsize, ttu=self._cache_ttu, timer=time.time
+        )
+
+    @staticmethod
+    def _cache_ttu(_key: bytes, claims: ShareTokenClaims, _now: float) -> float:
+        return claims.expires_at
+
+    async def __call__(self, token: str) -> ShareTokenClaims:
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        claims = self._claims_cache.get(key)
+        if claims is not None:
+            # Signature and expiry were verified on first sight; revocation (of
+            # the link or the tenant's token version) can happen at any time, so
+            # it is still checked on every request.
+            if claims.revocation_index is not None:
+                revoked = await self._token_port.is_index_revoked(claims.tenant_id, claims.revocation_index)
+            else:
+                revoked = await self._token_port.is_revoked(claims.jti)
+            if revoked or claims.token_version < await self._token_port.token_version(claims.tenant_id):
+                self._claims_cache.pop(key, None)
+                raise HTTPException(status_code=401, detail="Invalid or expired share token")
+            return claims
 
-    def __call__(self, token: str) -> ShareTokenClaims:
         try:
-            claims = self._token_port.decode_share_token(token)
+            claims = self._to_claims(await self._token_port.decode_share_token(token))
         except Exception:
             raise HTTPException(status_code=401, detail="Invalid or expired share token")
+        if claims.expires_at is not None:
+            self._claims_cache[key] = claims
+        return claims
+
+    @staticmethod
+    def _to_claims(claims: dict) -> ShareTokenClaims:
+        # TokenPort.decode_share_token returns canonical keys
         return ShareTokenClaims(
-            tenant_id=claims.get("tid") or claims.get("tenant_id"),
-            document_id=claims.get("sub") or claims.get("document_id"),
-            link_id=claims.get("lid") or claims.get("link_id"),
-            jti=claims.get("jti"),
-            expires_at=claims.get("exp"),
-            permissions=claims.get("perms", {}),
-            require_email=claims.get("require_email", False),
-            email=claims.get("email"),
+            tenant_id=claims["tenant_id"],
+            document_id=claims["document_id"],
+            link_id=claims["link_id"],
+            jti=claims["jti"],
+            expires_at=claims["expires_at"],
+            permissions=claims["permissions"],
+            require_email=claims["require_email"],
+            email=claims["email"],
+            token_version=claims["token_version"],
+            revocation_index=claims["revocation_index"],
         )
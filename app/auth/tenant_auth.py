@@ -11,12 +11,11 @@ introspection endpoints to validate access tokens.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Sequence, Callable
+from typing import Annotated, Callable, Optional, Sequence
 
 from fastapi import Depends, HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from app.adapters.auth import HEXIAMAuthenticator
 from app.core.authz import AUTH_COOKIE
 from app.ports.authn import AuthenticatorPort
 from app.ports.token_port import TokenPort
@@ -25,7 +24,7 @@ from app.ports.token_port import TokenPort
 _http_bearer = HTTPBearer(auto_error=False)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TenantPrincipal:
     """Represents the authenticated tenant and user."""
     tenant_id: str
@@ -33,10 +32,28 @@ class TenantPrincipal:
     roles: Sequence[str] | None = None
 
 
+def authenticate_tenant(authenticator: AuthenticatorPort, token: str) -> TenantPrincipal:
+    """Authenticates ``token`` and maps it to a :class:`TenantPrincipal` (HTTP 401 on failure)."""
+    try:
+        payload = authenticator.authenticate(token)
+    except Exception:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+    tenant_id = payload.tenant_id
+    user_id = payload.subject or payload.user_id
+    if not tenant_id or not user_id:
+        print(payload)
+        raise HTTPException(status_code=401, detail="Token missing tenant or user claims")
+    roles = payload.roles
+    return TenantPrincipal(tenant_id=tenant_id, user_id=user_id, roles=roles)
+
+
 class TenantAuthDependency:
     """Factory for FastAPI dependency that authenticates tenant tokens."""
 
-    def __init__(self, authenticator: AuthenticatorPort = HEXIAMAuthenticator()) -> None:
+    def __init__(self, authenticator: Optional[AuthenticatorPort] = None) -> None:
+        # Without an explicit authenticator, the one wired at startup
+        # (``app.state.authenticator``) is used so every route shares a
+        # single instance and its token cache.
         self._token_port = authenticator
 
     def __call__(self) -> Callable:
@@ -54,20 +71,26 @@ class TenantAuthDependency:
             if not token:
                 raise HTTPException(status_code=401, detail="Missing auth token")
 
-            try:
-                payload = self._token_port.authenticate(token)
-            except Exception:
-                raise HTTPException(status_code=401, detail="Invalid or expired token")
-            tenant_id = payload.tenant_id
-            user_id = payload.subject or payload.user_id
-            if not tenant_id or not user_id:
-                print(payload)
-                raise HTTPException(status_code=401, detail="Token missing tenant or user claims")
-            roles = payload.roles
-            return TenantPrincipal(tenant_id=tenant_id, user_id=user_id, roles=roles)
+            return authenticate_tenant(self._token_port or request.app.state.authenticator, token)
         return verify
 
 
-def get_tenant_auth() -> TenantPrincipal:
-    return TenantAuthDependency()()
-
+def get_principal(request: Request) -> TenantPrincipal:
+    """
+    Authenticates the token extracted by :class:`~app.auth.middleware.TenantAuthMiddleware`
+    (HTTP 401 if there is none or it is invalid).  A sync dependency, so a
+    signature check on a cache miss runs in FastAPI's threadpool rather
+    than on the event loop; the principal is kept in the request state.
+    """
+    state = request.scope.get("state", {})
+    principal = state.get("principal")
+    if principal is None:
+        token = state.get("auth_token")
+        if not token:
+            raise HTTPException(status_code=401, detail="Missing auth token")
+        principal = state["principal"] = authenticate_tenant(request.app.state.authenticator, token)
+    return principal
+
+
+# Shared by every authenticated route, so all of them reuse one dependency node
+CurrentPrincipal = Annotated[TenantPrincipal, Depends(get_principal)]
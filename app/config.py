@@ -0,0 +1,85 @@
+"""
+Process-wide configuration for HexShare.
+
+Settings are read from the environment once and frozen; adapters and
+factories pull from these objects instead of calling :func:`os.getenv`
+on every construction.
+"""
+from __future__ import annotations
+
+import functools
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class HexIAMConfig:
+    """Connection and verification settings for HexIAM."""
+
+    iam_url: str
+    jwt_secret: Optional[str]
+    client_id: Optional[str]
+    client_secret: Optional[str]
+    iss_prefix: Optional[str]
+
+    # Asymmetric token verification
+    public_key: Optional[str]
+    jwks_url: Optional[str]
+    jwks_cache_ttl_s: float
+
+    # Local authentication cache
+    authn_cache_ttl_s: float
+
+    # Policy decision point
+    pdp_timeout_s: float
+    pdp_cache_ttl_s: float
+    pdp_stale_ttl_s: float
+    pdp_breaker_threshold: int
+    pdp_breaker_reset_s: float
+
+
+@functools.lru_cache(maxsize=1)
+def load_hexiam_config() -> HexIAMConfig:
+    return HexIAMConfig(
+        iam_url=os.getenv("HEXIAM_URL", "http://localhost:8000"),
+        jwt_secret=os.getenv("HEXIAM_JWT_SECRET"),
+        client_id=os.getenv("HEXSHARE_CLIENT_ID"),
+        client_secret=os.getenv("HEXIAM_CLIENT_SECRET"),
+        iss_prefix=os.getenv("HEXIAM_ISS_PREFIX"),
+        public_key=os.getenv("HEXIAM_JWT_PUBLIC_KEY"),
+        jwks_url=os.getenv("HEXIAM_JWKS_URL"),
+        jwks_cache_ttl_s=float(os.getenv("HEXIAM_JWKS_CACHE_TTL_S", 300.0)),
+        authn_cache_ttl_s=float(os.getenv("HEXIAM_AUTHN_CACHE_TTL_S", 60.0)),
+        pdp_timeout_s=float(os.getenv("HEXIAM_PDP_TIMEOUT_S", 5.0)),
+        pdp_cache_ttl_s=float(os.getenv("HEXIAM_PDP_CACHE_TTL_S", 30.0)),
+        pdp_stale_ttl_s=float(os.getenv("HEXIAM_PDP_STALE_TTL_S", 600.0)),
+        pdp_breaker_threshold=int(os.getenv("HEXIAM_PDP_BREAKER_THRESHOLD", 5)),
+        pdp_breaker_reset_s=float(os.getenv("HEXIAM_PDP_BREAKER_RESET_S", 30.0)),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class DatabaseConfig:
+    """asyncpg connection-pool settings."""
+
+    dsn: Optional[str]
+    min_size: int
+    max_size: int
+    max_inactive_connection_lifetime_s: float
+    command_timeout_s: float
+    statement_cache_size: int
+    max_cacheable_statement_size: int
+
+
+@functools.lru_cache(maxsize=1)
+def load_database_config() -> DatabaseConfig:
+    return DatabaseConfig(
+        dsn=os.getenv("DATABASE_URL"),
+        min_size=int(os.getenv("DATABASE_POOL_MIN_SIZE", 10)),
+        max_size=int(os.getenv("DATABASE_POOL_MAX_SIZE", 50)),
+        max_inactive_connection_lifetime_s=float(os.getenv("DATABASE_POOL_MAX_INACTIVE_S", 300.0)),
+        command_timeout_s=float(os.getenv("DATABASE_COMMAND_TIMEOUT_S", 10.0)),
+        statement_cache_size=int(os.getenv("DATABASE_STATEMENT_CACHE_SIZE", 1024)),
+        max_cacheable_statement_size=int(os.getenv("DATABASE_MAX_CACHEABLE_STATEMENT_SIZE", 15 * 1024)),
+    )
@@ -1,35 +1,69 @@
 from enum import IntFlag
+from typing import Iterable
 
-# Based on HEXIAM permissions
+# Based on HEXIAM permissions.  Plain int bits: mask arithmetic on the
+# authorization hot path stays C-level int ops instead of IntFlag.__or__.
+_READ     = 1 << 0   # view/query/get
+_WRITE    = 1 << 1   # create/update/modify
+_DELETE   = 1 << 2   # remove/purge
+_APPROVE  = 1 << 3   # approve/authorize/accept
+_REJECT   = 1 << 4   # reject/deny/disallow
+_EXECUTE  = 1 << 5   # run/deploy/trigger
+_ASSIGN   = 1 << 6   # grant/revoke/attach
+_MANAGE   = 1 << 7   # admin-level (settings, ownership)
+_EXPORT   = 1 << 8   # download/report/export data
+_IMPORT   = 1 << 9   # upload/import data
+_ACTIVATE = 1 << 10  # enable/disable/suspend
+_ARCHIVE  = 1 << 11  # archive/restore
+
+
+# Public flag type over the same bits
 class HEXIAMAction(IntFlag):
-    READ     = 1 << 0   # view/query/get
-    WRITE    = 1 << 1   # create/update/modify
-    DELETE   = 1 << 2   # remove/purge
-    APPROVE  = 1 << 3   # approve/authorize/accept
-    REJECT   = 1 << 4   # reject/deny/disallow
-    EXECUTE  = 1 << 5   # run/deploy/trigger
-    ASSIGN   = 1 << 6   # grant/revoke/attach
-    MANAGE   = 1 << 7   # admin-level (settings, ownership)
-    EXPORT   = 1 << 8   # download/report/export data
-    IMPORT   = 1 << 9   # upload/import data
-    ACTIVATE = 1 << 10  # enable/disable/suspend
-    ARCHIVE  = 1 << 11  # archive/restore
+    READ     = _READ
+    WRITE    = _WRITE
+    DELETE   = _DELETE
+    APPROVE  = _APPROVE
+    REJECT   = _REJECT
+    EXECUTE  = _EXECUTE
+    ASSIGN   = _ASSIGN
+    MANAGE   = _MANAGE
+    EXPORT   = _EXPORT
+    IMPORT   = _IMPORT
+    ACTIVATE = _ACTIVATE
+    ARCHIVE  = _ARCHIVE
 
 # Based on HEXIAM permissions
-hex_iam_permission_map = {
-    'read': HEXIAMAction.READ,
-    'write': HEXIAMAction.WRITE,
-    'delete': HEXIAMAction.DELETE,
-    'approve': HEXIAMAction.APPROVE,
-    'reject': HEXIAMAction.REJECT,
-    'execute': HEXIAMAction.EXECUTE,
-    'assign': HEXIAMAction.ASSIGN,
-    'manage': HEXIAMAction.MANAGE,
-    'export': HEXIAMAction.EXPORT,
-    'import': HEXIAMAction.IMPORT,
-    'activate': HEXIAMAction.ACTIVATE,
-    'archive': HEXIAMAction.ARCHIVE
+hex_iam_permission_map: dict[str, int] = {
+    'read': _READ,
+    'write': _WRITE,
+    'delete': _DELETE,
+    'approve': _APPROVE,
+    'reject': _REJECT,
+    'execute': _EXECUTE,
+    'assign': _ASSIGN,
+    'manage': _MANAGE,
+    'export': _EXPORT,
+    'import': _IMPORT,
+    'activate': _ACTIVATE,
+    'archive': _ARCHIVE
 }
 
+# Kept as a name for existing callers; the map itself now holds raw ints
+hex_iam_permission_bits: dict[str, int] = hex_iam_permission_map
+known_permissions: frozenset[str] = frozenset(hex_iam_permission_bits)
+
+
+def permission_mask(permissions: Iterable[str]) -> HEXIAMAction:
+    """Combined flag for ``permissions``; unknown names contribute nothing."""
+    mask = 0
+    for permission in permissions:
+        mask |= hex_iam_permission_bits.get(permission, 0)
+    return HEXIAMAction(mask)
+
+
+def evaluate_batch(granted: int, required: int) -> bool:
+    """Whether ``granted`` holds every bit of ``required`` (one AND for a whole set of actions)."""
+    return (granted & required) == required
+
 OIDC_TMP_COOKIE = "hexshare_oidc_tmp"
 AUTH_COOKIE = "hexshare_access_token"
\ No newline at end of file
@@ -2,8 +2,8 @@
 Domain models for HexShare.
 
 This package defines the core entities used throughout HexShare.  The
-models are built using ``pydantic``'s BaseModel for validation and
-serialisation.  They represent persisted data structures but do not
+models are frozen ``msgspec.Struct`` types, which are cheap to build and
+serialise directly to JSON.  They represent persisted data structures but do not
 contain business logic; all behaviour is implemented in services.
 
 Key entities include:
@@ -14,9 +14,13 @@ Key entities include:
 * :class:`ViewEvent` – events emitted when visitors view or interact with
   a document.
 
+Bus events (:class:`DocumentCreated`, :class:`LinkCreated`, ...) live in
+:mod:`app.domain.events`.
+
 """
 
-from .models import Document, ShareLink, VisitorSession, ViewEvent, EventType
+from .models import Document, ShareLink, VisitorSession, ViewEvent, EventType, json_encoder
+from .events import DomainEvent, DocumentCreated, LinkCreated, LinkRevoked, LinksRevokedAll, event_name
 
 __all__ = [
     "Document",
@@ -24,4 +28,11 @@ __all__ = [
     "VisitorSession",
     "ViewEvent",
     "EventType",
+    "json_encoder",
+    "DomainEvent",
+    "DocumentCreated",
+    "LinkCreated",
+    "LinkRevoked",
+    "LinksRevokedAll",
+    "event_name",
 ]
@@ -0,0 +1,53 @@
+"""
+Domain events published by HexShare services.
+
+Each event is a frozen ``msgspec.Struct`` tagged with its dot-separated
+name (e.g. ``document.created``).  Bus adapters serialise events with
+:data:`~app.domain.models.json_encoder`, which writes the name into an
+``event`` field ahead of the payload, and consumers can decode any of
+them back into the right type with :data:`event_decoder`.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional, Union
+
+import msgspec
+
+
+class DomainEvent(msgspec.Struct, frozen=True, kw_only=True, gc=False, tag_field="event"):
+    """Base class for bus events; the struct tag is the event name."""
+
+
+class DocumentCreated(DomainEvent, tag="document.created"):
+    document_id: str
+    name: str
+    mime_type: str
+    size: int
+    created_by: str
+
+
+class LinkCreated(DomainEvent, tag="link.created"):
+    link_id: str
+    document_id: str
+    created_by: str
+    expires_at: datetime
+
+
+class LinkRevoked(DomainEvent, tag="link.revoked"):
+    link_id: str
+    revoked_by: Optional[str]
+
+
+class LinksRevokedAll(DomainEvent, tag="links.revoked_all"):
+    token_version: int
+    revoked_by: Optional[str]
+
+
+def event_name(event: DomainEvent) -> str:
+    """The dot-separated name ``event`` is published under."""
+    return type(event).__struct_config__.tag
+
+
+#: Decodes any published event back into its struct.
+event_decoder = msgspec.json.Decoder(Union[DocumentCreated, LinkCreated, LinkRevoked, LinksRevokedAll])
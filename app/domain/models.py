@@ -1,22 +1,25 @@
 """
-Pydantic domain models for HexShare.
+Domain models for HexShare.
 
 These classes represent persisted entities in the HexShare system.  They
-use Pydantic's BaseModel for type validation and (de)serialisation.  The
-models here intentionally avoid any business logic; they are simple
-containers for data.  Business rules live in services and domain logic.
-
-If your environment doesn't include Pydantic, install it with
-``pip install pydantic``.  HexShare's domain models can be converted to
-and from dictionaries for storage or network transport.
+are frozen ``msgspec.Struct`` types: construction is a plain C-level
+slot fill, and :data:`json_encoder` serialises them straight to JSON
+bytes.  The models here intentionally avoid any business logic; they are
+simple containers for data.  Business rules live in services and domain
+logic.
+
+Structs are immutable; use :func:`msgspec.structs.replace` to derive an
+updated copy.  :func:`msgspec.structs.asdict` converts one to a
+dictionary for storage or network transport.
 """
 from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import FrozenSet, Iterable, Optional
 
-from pydantic import BaseModel, Field, validator
+import msgspec
+from msgspec.structs import force_setattr
 
 
 class EventType(str, Enum):
@@ -50,7 +53,7 @@ class EventType(str, Enum):
     BLOCKED = "blocked"
 
 
-class Document(BaseModel):
+class Document(msgspec.Struct, frozen=True, kw_only=True, gc=False):
     """Metadata about an uploaded document.
 
     Attributes
@@ -85,7 +88,7 @@ class Document(BaseModel):
     created_by: str
 
 
-class ShareLink(BaseModel):
+class ShareLink(msgspec.Struct, frozen=True, kw_only=True, gc=False):
     """Represents a shareable link to a document.
 
     Attributes
@@ -110,8 +113,16 @@ class ShareLink(BaseModel):
         If ``True``, visitors must provide an email address before
         viewing.
     allowed_emails:
-        Optional list of emails allowed to access the document; empty
-        means any email can access.
+        Emails allowed to access the document, stripped and lowercased
+        into a frozenset for O(1) membership checks; empty means any
+        email can access.
+    token_version:
+        The tenant's share-token version when the link was created;
+        bumping the tenant version revokes the link.
+    revocation_index:
+        The link's bit in its tenant's revocation list, when the
+        revocation store allocates one; ``None`` means the link is
+        revoked by JTI instead.
     revoked_at:
         When the link was revoked.  ``None`` if still active.
     created_at:
@@ -128,17 +139,23 @@ class ShareLink(BaseModel):
     can_download: bool = False
     can_print: bool = False
     require_email: bool = False
-    allowed_emails: Optional[List[str]] = None
+    allowed_emails: Optional[FrozenSet[str]] = None
+    token_version: int = 0
+    revocation_index: Optional[int] = None
     revoked_at: Optional[datetime] = None
     created_at: datetime
     created_by: str
 
-    @validator("allowed_emails", pre=True, always=True)
-    def default_allowed_emails(cls, v):  # type: ignore[override]
-        return v or []
+    def __post_init__(self) -> None:
+        force_setattr(self, "allowed_emails", normalize_emails(self.allowed_emails))
+
+
+def normalize_emails(emails: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """Strips and lowercases ``emails`` into the set stored on a :class:`ShareLink`."""
+    return frozenset(e.strip().lower() for e in emails or ())
 
 
-class VisitorSession(BaseModel):
+class VisitorSession(msgspec.Struct, frozen=True, kw_only=True, gc=False):
     """Represents a visitor's session on a share link.
 
     The visitor may be anonymous or identified by email depending on the
@@ -156,7 +173,7 @@ class VisitorSession(BaseModel):
     ended_at: Optional[datetime] = None
 
 
-class ViewEvent(BaseModel):
+class ViewEvent(msgspec.Struct, frozen=True, kw_only=True, gc=False):
     """Event emitted when a visitor interacts with a document.
 
     ``event_type`` describes the interaction and is backed by the
@@ -174,9 +191,10 @@ class ViewEvent(BaseModel):
     duration_ms: Optional[int] = None
     timestamp: datetime
 
-    @validator("page_number", always=True)
-    def validate_page_number(cls, v, values):  # type: ignore[override]
-        event_type = values.get("event_type")
-        if event_type == EventType.PAGE_VIEW and v is None:
+    def __post_init__(self) -> None:
+        if self.event_type == EventType.PAGE_VIEW and self.page_number is None:
             raise ValueError("page_number is required for page_view events")
-        return v
+
+
+#: Shared encoder for responses built from domain structs.
+json_encoder = msgspec.json.Encoder()
@@ -1,5 +1,10 @@
 from app.adapters import (
     JWTTokenAdapter, NoopEventBus, HEXIAMAuthenticator, HybridAccessControl,
     HexIamBitmaskEvaluator, PostgresStorage, MemoryStorage, ClaimsAuthorizer,
-    EdgeAccessControl, PDPAccessControl
-)
\ No newline at end of file
+    EdgeAccessControl, PDPAccessControl, MemoryRevocationStore, RedisRevocationStore,
+    PostgresRevocationStore
+)
+from app.infra.factories import freeze_registries
+
+# Every adapter has registered itself by now
+freeze_registries()
@@ -0,0 +1,77 @@
+"""
+PostgreSQL connection pool.
+
+Builds the application's asyncpg pool from :class:`~app.config.DatabaseConfig`.
+Connections keep a per-connection prepared-statement cache so repeated
+storage queries skip the server-side parse/plan step, and each new
+connection is initialised once with the session settings and codecs the
+storage adapters rely on.
+
+Schema changes ship as numbered SQL files in ``app/infra/migrations``;
+:func:`apply_migrations` runs the ones a database has not seen yet, in
+order, and records each in ``schema_migrations``.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import asyncpg
+import orjson
+
+from app.config import DatabaseConfig, load_database_config
+
+# Short OLTP queries never benefit from JIT compilation; it only adds latency.
+_SERVER_SETTINGS = {"application_name": "hexshare", "jit": "off"}
+
+_MIGRATIONS_DIR = Path(__file__).with_name("migrations")
+# Serializes workers that start at the same time; any constant shared by all of them works
+_MIGRATION_LOCK_ID = 0x4845585348415245
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=lambda value: orjson.dumps(value).decode(),
+        decoder=orjson.loads,
+        schema="pg_catalog",
+        format="text",
+    )
+
+
+async def create_db_pool(config: Optional[DatabaseConfig] = None) -> asyncpg.Pool:
+    config = config or load_database_config()
+    return await asyncpg.create_pool(
+        dsn=config.dsn,
+        min_size=config.min_size,
+        max_size=config.max_size,
+        max_inactive_connection_lifetime=config.max_inactive_connection_lifetime_s,
+        command_timeout=config.command_timeout_s,
+        statement_cache_size=config.statement_cache_size,
+        max_cacheable_statement_size=config.max_cacheable_statement_size,
+        server_settings=_SERVER_SETTINGS,
+        init=_init_connection,
+    )
+
+
+async def apply_migrations(pool: asyncpg.Pool) -> list[str]:
+    """Apply pending migrations, each in its own transaction; returns the names applied."""
+    applied: list[str] = []
+    async with pool.acquire() as con:
+        await con.execute("SELECT pg_advisory_lock($1)", _MIGRATION_LOCK_ID)
+        try:
+            await con.execute(
+                "CREATE TABLE IF NOT EXISTS schema_migrations ("
+                "name text PRIMARY KEY, applied_at timestamptz NOT NULL DEFAULT now())"
+            )
+            done = {row["name"] for row in await con.fetch("SELECT name FROM schema_migrations")}
+            for path in sorted(_MIGRATIONS_DIR.glob("*.sql")):
+                if path.name in done:
+                    continue
+                async with con.transaction():
+                    await con.execute(path.read_text())
+                    await con.execute("INSERT INTO schema_migrations (name) VALUES ($1)", path.name)
+                applied.append(path.name)
+        finally:
+            await con.execute("SELECT pg_advisory_unlock($1)", _MIGRATION_LOCK_ID)
+    return applied
@@ -1,78 +1,54 @@
-from typing import Callable, Dict
+from types import MappingProxyType
+from typing import Callable, Dict, Generic, TypeVar
 
 from app.ports import StoragePort
 from app.ports.access_control import AccessControlPort
 from app.ports.authn import AuthenticatorPort
 from app.ports.policy_evaluator import PolicyEvaluatorPort
+from app.ports.revocation_store import RevocationStorePort
 
+T = TypeVar("T")
 
-class StorageFactory:
-    _registry: Dict[str, Callable[..., StoragePort]] = {}
 
-    @classmethod
-    def register(cls, name: str):
-        def deco(builder: Callable[..., StoragePort]):
-            cls._registry[name] = builder
-            return builder
-        return deco
-
-    @classmethod
-    def create(cls, name: str, **kwargs) -> StoragePort:
-        try:
-            return cls._registry[name](**kwargs)
-        except KeyError:
-            raise ValueError(f"Unknown storage adapter: {name}")
+class Registry(Generic[T]):
+    """
+    Name -> builder registry for one port.  Adapters register their builders
+    at import time (see :mod:`app.infra.bootstrap`); once every adapter is
+    imported the registry is frozen into a read-only mapping.
+    """
 
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self._registry: Dict[str, Callable[..., T]] = {}
 
-class PolicyEvaluatorRegistry:
-    _registry: Dict[str, Callable[..., PolicyEvaluatorPort]] = {}
-
-    @classmethod
-    def register(cls, name: str):
-        def deco(builder: Callable[..., PolicyEvaluatorPort]):
-            cls._registry[name] = builder
+    def register(self, name: str):
+        def deco(builder: Callable[..., T]):
+            if isinstance(self._registry, MappingProxyType):
+                raise RuntimeError(f"Cannot register {self.kind} {name!r}: registry is frozen")
+            self._registry[name] = builder
             return builder
         return deco
 
-    @classmethod
-    def create(cls, name: str, **kwargs) -> PolicyEvaluatorPort:
+    def create(self, name: str, **kwargs) -> T:
         try:
-            return cls._registry[name](**kwargs)
+            builder = self._registry[name]
         except KeyError:
-            raise ValueError(f"Unknown policy evaluator: {name}")
+            raise ValueError(f"Unknown {self.kind}: {name}")
+        return builder(**kwargs)
 
+    def freeze(self) -> None:
+        if not isinstance(self._registry, MappingProxyType):
+            self._registry = MappingProxyType(self._registry)
 
-class AccessControlFactory:
-    _registry: Dict[str, Callable[..., AccessControlPort]] = {}
 
-    @classmethod
-    def register(cls, name: str):
-        def deco(builder: Callable[..., AccessControlPort]):
-            cls._registry[name] = builder
-            return builder
-        return deco
+StorageFactory: Registry[StoragePort] = Registry("storage adapter")
+PolicyEvaluatorRegistry: Registry[PolicyEvaluatorPort] = Registry("policy evaluator")
+AccessControlFactory: Registry[AccessControlPort] = Registry("access control adapter")
+AuthenticatorFactory: Registry[AuthenticatorPort] = Registry("authenticator adapter")
+RevocationStoreFactory: Registry[RevocationStorePort] = Registry("revocation store adapter")
 
-    @classmethod
-    def create(cls, name: str, **kwargs) -> AccessControlPort:
-        try:
-            return cls._registry[name](**kwargs)
-        except KeyError:
-            raise ValueError(f"Unknown access control adapter: {name}")
-
-
-class AuthenticatorFactory:
-    _registry: Dict[str, Callable[..., AuthenticatorPort]] = {}
-
-    @classmethod
-    def register(cls, name: str):
-        def deco(builder: Callable[..., AuthenticatorPort]):
-            cls._registry[name] = builder
-            return builder
-        return deco
 
-    @classmethod
-    def create(cls, name: str, **kwargs) -> AuthenticatorPort:
-        try:
-            return cls._registry[name](**kwargs)
-        except KeyError:
-            raise ValueError(f"Unknown authenticator adapter: {name}")
\ No newline at end of file
+def freeze_registries() -> None:
+    for registry in (StorageFactory, PolicyEvaluatorRegistry, AccessControlFactory,
+                     AuthenticatorFactory, RevocationStoreFactory):
+        registry.freeze()
@@ -0,0 +1,8 @@
+-- Per-tenant share-token versions: bumping a tenant's version revokes
+-- every share token minted under an older one.
+ALTER TABLE share_links ADD COLUMN IF NOT EXISTS token_version bigint NOT NULL DEFAULT 0;
+
+CREATE TABLE IF NOT EXISTS share_token_versions (
+    tenant_id text PRIMARY KEY,
+    version bigint NOT NULL
+);
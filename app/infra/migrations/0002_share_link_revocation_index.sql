@@ -0,0 +1,18 @@
+-- Per-tenant revocation lists: each link gets a bit index, carried in its
+-- token as the "rli" claim, and revoking the link sets that bit.
+ALTER TABLE share_links ADD COLUMN IF NOT EXISTS revocation_index bigint;
+
+-- Indexes are allocated here, durably, so one is never handed out twice
+CREATE TABLE IF NOT EXISTS share_link_revocation_counters (
+    tenant_id text PRIMARY KEY,
+    next_index bigint NOT NULL
+);
+
+-- Start past every index already stored on a link
+INSERT INTO share_link_revocation_counters (tenant_id, next_index)
+SELECT tenant_id, max(revocation_index) + 1
+FROM share_links
+WHERE revocation_index IS NOT NULL
+GROUP BY tenant_id
+ON CONFLICT (tenant_id) DO UPDATE
+SET next_index = greatest(share_link_revocation_counters.next_index, excluded.next_index);
@@ -21,19 +21,27 @@ from __future__ import annotations
 import os
 from contextlib import asynccontextmanager
 
-import asyncpg
+import httpx
 from fastapi import FastAPI
 
-from app.adapters import NoopEventBus, JWTTokenAdapter
+from app.adapters import BufferedEventBus, NoopEventBus, JWTTokenAdapter, SystemClock
+from app.adapters.access_control import CachingAccessControl
+from app.adapters.access_control.decision_cache import create_decision_cache
+from app.adapters.access_control.shared_cache import create_redis_decision_store
 from app.adapters.authz.claims import ClaimsAuthorizer
 from app.adapters.flow_state.signed_jwt import SignedJWTFlowState
 from app.adapters.oidc.hexiam_client import HexIAMOIDCClient
+from app.api.responses import OrjsonResponse
 from app.api.router import api_router
 from app.api.auth_oidc import router as auth_oidc_router
 from app.api.user import router as user_router
+from app.auth.middleware import TenantAuthMiddleware
 from app.auth.tenant_auth import TenantAuthDependency
 from app.auth.share_token_auth import ShareTokenDependency
-from app.infra.factories import StorageFactory, AccessControlFactory, PolicyEvaluatorRegistry, AuthenticatorFactory
+from app.config import load_hexiam_config
+from app.infra.database import apply_migrations, create_db_pool
+from app.infra.factories import (StorageFactory, AccessControlFactory, PolicyEvaluatorRegistry, AuthenticatorFactory,
+                                 RevocationStoreFactory)
 from app.services import DocumentService
 from app.services import LinkService
 from app.services import AnalyticsService
@@ -42,20 +50,31 @@ from app.services.oidc_service import OIDCFlowService
 
 @asynccontextmanager
 async def lifespan(fastapi_app: FastAPI):
-    dp_pool = await asyncpg.create_pool(dsn=os.getenv("DATABASE_URL"))
+    dp_pool = await create_db_pool()
+    await apply_migrations(dp_pool)
 
     evaluator_name = os.getenv("HEXSHARE_POLICY_EVAL", "hexiam_bitmask")
     preferred_storage = os.getenv("HEXSHARE_STORAGE", "postgres")
     preferred_access_control = os.getenv("HEXSHARE_ACCESS_CONTROL", "hybrid")
     preferred_authenticator = os.getenv("HEXSHARE_AUTHENTICATOR", "hexiam")
+    preferred_revocation_store = os.getenv("HEXSHARE_REVOCATION_STORE", "redis")
     import app.infra.bootstrap
 
+    # One keep-alive HTTP/2 client for every call to HexIAM (PDP, OIDC token endpoint, JWKS)
+    iam_http = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        timeout=httpx.Timeout(load_hexiam_config().pdp_timeout_s),
+    )
+
     evaluator = PolicyEvaluatorRegistry.create(evaluator_name)
     authorizer = ClaimsAuthorizer(evaluator=evaluator)
-    authenticator = AuthenticatorFactory.create(preferred_authenticator)
+    authenticator = AuthenticatorFactory.create(preferred_authenticator, http_client=iam_http)
+    await authenticator.start()
 
     persistence_layer = StorageFactory.create(preferred_storage, pool=dp_pool)
 
+    decision_cache = create_decision_cache()
     access_control = AccessControlFactory.create(
         preferred_access_control,
         authorizer=authorizer,
@@ -63,32 +82,61 @@ async def lifespan(fastapi_app: FastAPI):
         iam_url=os.getenv("HEXIAM_URL", "http://localhost:8000"),
         client_id=os.getenv("HEXSHARE_PDP_CLIENT_ID", ""),
         client_secret=os.getenv("HEXSHARE_PDP_CLIENT_SECRET", ""),
+        decision_cache=decision_cache,
+        http_client=iam_http,
     )
+    if preferred_access_control != "pdp":
+        # The PDP adapter caches its own decisions; edge/hybrid get the whole
+        # verify + evaluate (+ fallback) result memoized in the same cache,
+        # backed by Redis when REDIS_URL is set so workers share decisions.
+        access_control = CachingAccessControl(
+            access_control, decision_cache, create_redis_decision_store(ttl_s=decision_cache.ttl_s)
+        )
 
-    token_adapter = JWTTokenAdapter()
-    event_bus = NoopEventBus()
+    revocation_store = RevocationStoreFactory.create(preferred_revocation_store, pool=dp_pool)
+    await revocation_store.start()
+    token_adapter = JWTTokenAdapter(
+        revocation_store=revocation_store,
+        revocation_hooks=[decision_cache.invalidate_jti, authenticator.invalidate],
+    )
+    # Request handlers only enqueue; events reach the broker in per-tenant batches
+    event_bus = BufferedEventBus(NoopEventBus())
+    await event_bus.start()
 
     fastapi_app.state.pool = dp_pool
+    fastapi_app.state.iam_http = iam_http
     fastapi_app.state.storage = persistence_layer
     fastapi_app.state.token_adapter = token_adapter
     fastapi_app.state.event_bus = event_bus
-    fastapi_app.state.document_service = DocumentService(persistence_layer, event_bus)
-    fastapi_app.state.link_service = LinkService(persistence_layer, token_adapter, event_bus)
+    clock = SystemClock()
+    fastapi_app.state.document_service = DocumentService(persistence_layer, event_bus, clock)
+    fastapi_app.state.link_service = LinkService(persistence_layer, token_adapter, event_bus, clock)
     fastapi_app.state.analytics_service = AnalyticsService(persistence_layer)
     fastapi_app.state.access_control = access_control
+    fastapi_app.state.authenticator = authenticator
     fastapi_app.state.tenant_auth = TenantAuthDependency(authenticator=authenticator)
     fastapi_app.state.share_auth = ShareTokenDependency(token_port=token_adapter)
     fastapi_app.state.oidc_clients = {
         "hexiam": HexIAMOIDCClient(
             iam_url=os.getenv("HEXIAM_URL", "http://localhost:8000"),
             client_id=os.getenv("HEXSHARE_PDP_CLIENT_ID", ""),
-            client_secret=os.getenv("HEXSHARE_PDP_CLIENT_SECRET", "")
+            client_secret=os.getenv("HEXSHARE_PDP_CLIENT_SECRET", ""),
+            http_client=iam_http,
         )
     }
     fastapi_app.state.flow_state = SignedJWTFlowState(secret=os.getenv("HEXSHARE_SESSION_SECRET", ""))
 
+    # Route matchers and dependency graphs are built when routes are added; the
+    # OpenAPI schema is the one piece FastAPI builds lazily on first request.
+    fastapi_app.openapi()
+
     yield
 
+    await event_bus.aclose()
+    await access_control.aclose()
+    await authenticator.aclose()
+    await iam_http.aclose()
+    await revocation_store.aclose()
     await dp_pool.close()
 
 
@@ -103,7 +151,8 @@ def create_app(
     FastAPI
         A configured application ready to run.
     """
-    app = FastAPI(title="HexShare", version="0.1.0", lifespan=lifespan)
+    app = FastAPI(title="HexShare", version="0.1.0", lifespan=lifespan, default_response_class=OrjsonResponse)
+    app.add_middleware(TenantAuthMiddleware)
 
     app.include_router(
         api_router(),
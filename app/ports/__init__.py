@@ -13,9 +13,11 @@ Concrete implementations of these ports can be found in the
 from .storage_port import StoragePort
 from .token_port import TokenPort
 from .event_bus_port import EventBusPort
+from .clock import ClockPort
 
 __all__ = [
     "StoragePort",
     "TokenPort",
     "EventBusPort",
+    "ClockPort",
 ]
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Mapping, Optional
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping, Optional
 
 from app.ports.authn import Principal
 
@@ -11,11 +11,45 @@ class AccessDenied(Exception):
     pass
 
 
-@dataclass(frozen=True)
+def _freeze(value: Any) -> Any:
+    # Hashable stand-in for nested attribute values (dicts, lists, sets)
+    if isinstance(value, Mapping):
+        return frozenset((name, _freeze(item)) for name, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True, slots=True)
 class ResourceCtx:
+    """
+    The resource an action targets.  ``attrs`` is a key-sorted tuple of
+    ``(name, value)`` pairs.  Values may be nested dicts, lists or sets:
+    they are hashed through a frozen copy, computed once at construction,
+    so the instance can be used directly as (part of) a cache key.
+    """
     type: str
     id: Optional[str] = None
-    attrs: Mapping[str, Any] = None
+    attrs: tuple[tuple[str, Any], ...] = ()
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((self.type, self.id, _freeze(self.attrs))))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    @classmethod
+    def from_dict(cls, type: str, id: Optional[str] = None,
+                  attrs: Optional[Mapping[str, Any]] = None) -> ResourceCtx:
+        """Builds a ResourceCtx from an attribute mapping (list values become tuples)."""
+        pairs = tuple(sorted(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in (attrs or {}).items()
+        ))
+        return cls(type=type, id=id, attrs=pairs)
 
 
 class AccessControlPort(ABC):
@@ -32,4 +66,35 @@ class AccessControlPort(ABC):
         Returns Principal if allowed, raises AccessDenied otherwise.
         Encapsulates authn/authz strategy (edge vs pdp).
         """
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def try_authorize_cached(
+        self,
+        *,
+        bearer_token: str,
+        action: str,
+        resource: Optional[ResourceCtx] = None,
+        context: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[Principal]:
+        """
+        Returns the cached allowed Principal for exactly this request, or None.
+        Synchronous, so a hit costs no coroutine; callers await only on a miss:
+
+            principal = port.try_authorize_cached(...) or await port.authorize(...)
+
+        Adapters without a decision cache always miss.
+        """
+        return None
+
+    async def preheat(self, tokens: Iterable[str], actions: Iterable[str], *, concurrency: int = 8) -> None:
+        """
+        Primes cached decisions for known-active tokens (e.g. at startup).
+        Adapters without a decision cache have nothing to warm.
+        """
+        return None
+
+    async def aclose(self) -> None:
+        """
+        Releases any network resources held by the adapter (called on shutdown).
+        """
+        return None
@@ -1,10 +1,12 @@
 from __future__ import annotations
+import functools
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Optional, Mapping
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Principal:
     # Identity
     tenant_id: str
@@ -27,7 +29,79 @@ class Principal:
 
     claims: Optional[Mapping[str, Any]]
 
+    @classmethod
+    def from_claims(cls, claims: Mapping[str, Any], *, raw_claims: Optional[Mapping[str, Any]] = None) -> Principal:
+        """
+        Builds a Principal from verified HexIAM claims.  Bounded-cardinality
+        strings (tenant, client, roles, scopes, issuer, audience) are interned
+        so every principal of a tenant shares one copy of each.
+        """
+        roles = claims.get("roles")
+        if isinstance(roles, str):
+            # A single role sent as a bare string, not a list of characters
+            roles = [roles]
+        if roles:
+            roles = tuple(intern_claim(role) for role in roles)
+        elif claims.get("role"):
+            roles = (intern_claim(claims["role"]),)
+        else:
+            roles = ()
+        return cls(
+            tenant_id=intern_claim(claims.get("tenant_id")),
+            subject=claims.get("sub"),
+            user_id=claims.get("user_id"),
+            client_id=intern_claim(claims.get("client_id")),
+            token_use=claims.get("token_use"),
+            roles=roles,
+            scopes=split_scopes(claims.get("scope") or ""),
+            policy=claims.get("policy") or {},
+            jti=claims.get("jti"),
+            issued_at=numeric_date(claims.get("iat")),
+            expires_at=numeric_date(claims.get("exp")),
+            issuer=intern_claim(claims.get("iss")),
+            audience=intern_claim(claims.get("aud")),
+            claims=claims if raw_claims is None else raw_claims,
+        )
+
+
+@functools.lru_cache(maxsize=4096)
+def split_scopes(scope: str) -> tuple[str, ...]:
+    """Splits a space-delimited ``scope`` claim into interned scope names."""
+    return tuple(sys.intern(s) for s in scope.split())
+
+
+def numeric_date(value: Any) -> Optional[int]:
+    """Coerces an ``iat``/``exp`` claim to unix seconds; None if absent or not a number."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(float(value))
+        except ValueError:
+            return None
+    return None
+
+
+def intern_claim(value: Any) -> Any:
+    """Interns bounded-cardinality string claims (tenant, client, issuer, ...)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class AuthenticatorPort(ABC):
     @abstractmethod
     def authenticate(self, bearer_token: str) -> Principal:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def invalidate(self, jti: str) -> None:
+        """Drops any cached principal for the token with ``jti``."""
+        return None
+
+    async def start(self) -> None:
+        """Loads verification keys / starts background refresh (called once at startup)."""
+        return None
+
+    async def aclose(self) -> None:
+        """Stops background work and releases network resources (called on shutdown)."""
+        return None
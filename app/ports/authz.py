@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterable
 
 from app.ports.authn import Principal
 
@@ -15,4 +15,16 @@ class AuthorizerPort(ABC):
         *,
         resource_id: str | None = None,
         context: dict[str, Any] | None = None,
-    ) -> None: ...
\ No newline at end of file
+    ) -> None: ...
+
+    async def authorize_all(
+        self,
+        principal: Principal,
+        actions: Iterable[str],
+        *,
+        resource_id: str | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> None:
+        """Raises :class:`AuthorizationError` unless every one of ``actions`` is allowed."""
+        for action in actions:
+            await self.authorize(principal, action, resource_id=resource_id, context=context)
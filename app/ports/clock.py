@@ -0,0 +1,29 @@
+"""
+Clock port interface.
+
+Services take the current time from a :class:`ClockPort` instead of
+calling :mod:`datetime` directly, so one timestamp can anchor every
+field derived from "now" in an operation and tests can pin time.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+
+
+class ClockPort(ABC):
+    """Abstract source of the current time."""
+
+    @abstractmethod
+    def now(self) -> datetime:
+        """Return the current time as a naive UTC datetime (the storage convention)."""
+
+
+def epoch_seconds(moment: datetime) -> float:
+    """
+    Unix timestamp for ``moment``.  Aware datetimes convert as-is; naive ones
+    are taken to be UTC (the :class:`ClockPort` and storage convention).
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
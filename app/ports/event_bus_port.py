@@ -11,23 +11,42 @@ allow future expansion without breaking implementers.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Sequence
+
+from app.domain.events import DomainEvent
 
 
 class EventBusPort(ABC):
     """Abstract base class for publishing events."""
 
     @abstractmethod
-    async def publish_event(self, tenant_id: str, event_name: str, payload: Dict[str, Any]) -> None:
+    async def publish_event(self, tenant_id: str, event: DomainEvent) -> None:
         """Publish an event to the bus.
 
         Parameters
         ----------
         tenant_id:
             The tenant/workspace ID associated with the event.
-        event_name:
-            A dot‑separated name describing the event (e.g. ``document.created``).
-        payload:
-            JSON‑serialisable dictionary containing event data.
+        event:
+            A typed event from :mod:`app.domain.events`.  Its name (e.g.
+            ``document.created``) is given by :func:`~app.domain.events.event_name`;
+            adapters serialise it with ``json_encoder.encode(event)``.
         """
         ...
+
+    async def publish_batch(self, tenant_id: str, events: Sequence[DomainEvent]) -> None:
+        """Publish several events of one tenant.
+
+        Brokers with a batched produce call should override this; the
+        default publishes the events one by one, in order.
+        """
+        for event in events:
+            await self.publish_event(tenant_id, event)
+
+    async def start(self) -> None:
+        """Starts any background delivery (called once at startup)."""
+        return None
+
+    async def aclose(self) -> None:
+        """Delivers anything still pending and releases resources (called on shutdown)."""
+        return None
@@ -1,5 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping, Protocol
+
+
+class CompiledPolicy(Protocol):
+    """A policy prepared once by :meth:`PolicyEvaluatorPort.compile` and then evaluated many times."""
+
+    def evaluate(self, action: str, resource: str, context: Mapping[str, Any] | None = None) -> bool: ...
+
+    def evaluate_all(self, actions: Iterable[str], resource: str,
+                     context: Mapping[str, Any] | None = None) -> bool: ...
+
 
 class PolicyEvaluatorPort(ABC):
     @abstractmethod
@@ -11,4 +21,42 @@ class PolicyEvaluatorPort(ABC):
         resource: str,
         context: Mapping[str, Any] | None = None,
     ) -> bool:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def evaluate_all(
+        self,
+        *,
+        policy: Mapping[str, Any],
+        actions: Iterable[str],
+        resource: str,
+        context: Mapping[str, Any] | None = None,
+    ) -> bool:
+        """Whether every one of ``actions`` is allowed on ``resource``."""
+        return all(
+            self.evaluate(policy=policy, action=action, resource=resource, context=context)
+            for action in actions
+        )
+
+    def compile(self, policy: Mapping[str, Any]) -> CompiledPolicy:
+        """
+        Prepares ``policy`` for repeated evaluation.  Evaluators that can do
+        their parsing/normalisation up front override this; the default just
+        binds the policy to :meth:`evaluate`.
+        """
+        return _BoundPolicy(self, policy)
+
+
+class _BoundPolicy:
+    __slots__ = ("_evaluator", "_policy")
+
+    def __init__(self, evaluator: PolicyEvaluatorPort, policy: Mapping[str, Any]) -> None:
+        self._evaluator = evaluator
+        self._policy = policy
+
+    def evaluate(self, action: str, resource: str, context: Mapping[str, Any] | None = None) -> bool:
+        return self._evaluator.evaluate(policy=self._policy, action=action, resource=resource, context=context)
+
+    def evaluate_all(self, actions: Iterable[str], resource: str,
+                     context: Mapping[str, Any] | None = None) -> bool:
+        return self._evaluator.evaluate_all(policy=self._policy, actions=actions, resource=resource,
+                                            context=context)
@@ -0,0 +1,64 @@
+"""
+Revocation store port interface.
+
+A revocation store records revoked token identifiers (JTIs) until the
+token they belong to would have expired anyway.  It also keeps a
+per-tenant share-token *version*: tokens are minted with the current
+version, and bumping it revokes every older token of the tenant at once
+without storing their JTIs.  Stores may also keep a per-tenant
+*revocation list* bitstring: each link is allocated an index when it is
+minted and revoking it sets that one bit.  Indexes must come from a
+durable allocator: links outlive the process, so an index handed out
+twice would let revoking one link revoke another.  The token adapter
+consults it on every decode, so lookups must be cheap.  Implementations
+may keep the set in process memory (single worker), in a shared store
+such as Redis, or in process memory kept in sync across workers via
+PostgreSQL ``LISTEN``/``NOTIFY``.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class RevocationStorePort(ABC):
+    """Abstract base class for JTI revocation storage."""
+
+    @abstractmethod
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        """Mark ``jti`` as revoked until ``expires_at`` (unix seconds)."""
+
+    @abstractmethod
+    async def is_revoked(self, jti: str) -> bool:
+        """Return ``True`` if ``jti`` has been revoked and not yet expired."""
+
+    @abstractmethod
+    async def token_version(self, tenant_id: str) -> int:
+        """Current share-token version of ``tenant_id`` (``0`` if never bumped)."""
+
+    @abstractmethod
+    async def bump_token_version(self, tenant_id: str) -> int:
+        """Advance ``tenant_id``'s token version, revoking all older tokens; returns the new version."""
+
+    async def allocate_revocation_index(self, tenant_id: str) -> Optional[int]:
+        """
+        Allocates the next index in ``tenant_id``'s revocation list, or
+        ``None`` if this store keeps no lists (links are then revoked by JTI).
+        """
+        return None
+
+    async def revoke_index(self, tenant_id: str, index: int) -> None:
+        """Sets bit ``index`` of ``tenant_id``'s revocation list."""
+        raise NotImplementedError
+
+    async def is_index_revoked(self, tenant_id: str, index: int) -> bool:
+        """Return ``True`` if bit ``index`` of ``tenant_id``'s revocation list is set."""
+        raise NotImplementedError
+
+    async def start(self) -> None:
+        """Load initial state / open subscriptions (called once at startup)."""
+        return None
+
+    async def aclose(self) -> None:
+        """Release any connections held by the store."""
+        return None
@@ -10,13 +10,21 @@ objects rather than raw database rows.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence
 
 from datetime import datetime
 
 from app.domain import Document, ShareLink, VisitorSession, ViewEvent
 
 
+class DocumentNotFound(LookupError):
+    """The document a write depends on does not exist for the tenant."""
+
+
+#: Column order of :meth:`StoragePort.list_documents_columns`.
+DOCUMENT_COLUMNS = ("id", "tenant_id", "name", "mime_type", "size", "storage_key", "created_at", "created_by")
+
+
 class StoragePort(ABC):
     """Abstract base class for document and link persistence."""
 
@@ -25,8 +33,9 @@ class StoragePort(ABC):
         """Generate a new unique identifier for a given entity prefix.
 
         Implementations may use UUIDs, database sequences or other
-        mechanisms.  The prefix is provided to assist in debugging and
-        log inspection.
+        mechanisms; prefer time-ordered ones (UUIDv7) over random UUIDv4
+        so inserts stay append-only in the primary-key index.  The prefix
+        is provided to assist in debugging and log inspection.
         """
 
     @abstractmethod
@@ -38,17 +47,59 @@ class StoragePort(ABC):
         """Retrieve a document by ID if it exists and belongs to the tenant."""
 
     @abstractmethod
-    async def list_documents(self, *, tenant_id: str) -> Iterable[Document]:
+    async def get_documents_bulk(self, *, tenant_id: str, document_ids: Sequence[str]) -> Dict[str, Document]:
+        """Fetch several of a tenant's documents in one call, keyed by ID.
+
+        IDs that do not exist (or belong to another tenant) are simply
+        absent from the result.
+        """
+
+    @abstractmethod
+    async def list_documents(self, *, tenant_id: str) -> list[Document]:
         """List all documents for a tenant."""
 
+    async def list_documents_columns(self, *, tenant_id: str) -> Dict[str, List[Any]]:
+        """A tenant's documents column-wise: one list per field of :data:`DOCUMENT_COLUMNS`.
+
+        For aggregate/analytics consumers that touch a few fields of many
+        documents (and can hand the columns to NumPy/pyarrow as-is).
+        The default transposes :meth:`list_documents`; SQL backends build
+        the columns straight from the result rows without hydrating
+        :class:`~app.domain.Document` objects.
+        """
+        documents = await self.list_documents(tenant_id=tenant_id)
+        return {name: [getattr(doc, name) for doc in documents] for name in DOCUMENT_COLUMNS}
+
+    async def iter_documents(self, *, tenant_id: str) -> AsyncIterator[Document]:
+        """Yield a tenant's documents one at a time (for bulk export).
+
+        The default materialises :meth:`list_documents`; SQL backends
+        override it to stream rows through a server-side cursor.
+        """
+        for document in await self.list_documents(tenant_id=tenant_id):
+            yield document
+
     @abstractmethod
     async def save_share_link(self, link: ShareLink) -> None:
         """Persist a share link."""
 
+    @abstractmethod
+    async def save_share_link_if_document_exists(self, link: ShareLink) -> None:
+        """Persist a share link only if its document exists for the tenant.
+
+        The existence check and the insert happen atomically (a single
+        statement for SQL backends).  Raises :class:`DocumentNotFound`
+        when the document is missing.
+        """
+
     @abstractmethod
     async def get_share_link(self, *, tenant_id: str, link_id: str) -> Optional[ShareLink]:
         """Return a share link by ID if it exists and belongs to the tenant."""
 
+    @abstractmethod
+    async def get_share_links_bulk(self, *, tenant_id: str, link_ids: Sequence[str]) -> Dict[str, ShareLink]:
+        """Fetch several of a tenant's share links in one call, keyed by ID."""
+
     @abstractmethod
     async def list_share_links(
         self, *, tenant_id: str, document_id: Optional[str] = None
@@ -69,8 +120,26 @@ class StoragePort(ABC):
     async def save_view_event(self, event: ViewEvent) -> None:
         """Persist a view event."""
 
+    async def save_view_events(self, events: Sequence[ViewEvent]) -> None:
+        """Persist several view events.
+
+        SQL backends should override this with a single multi-row
+        insert; the default saves the events one by one.
+        """
+        for event in events:
+            await self.save_view_event(event)
+
     @abstractmethod
     async def list_view_events(
         self, *, tenant_id: str, document_id: str
     ) -> Iterable[ViewEvent]:
         """List view events for a specific document."""
+
+    @abstractmethod
+    async def get_document_metrics(self, *, tenant_id: str, document_id: str) -> Dict[str, int]:
+        """Aggregate a document's view events.
+
+        Returns ``unique_visitors`` (distinct visitor sessions) and
+        ``total_views`` (``page_view`` events).  SQL backends compute
+        both in the database instead of loading every event.
+        """
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
 class TokenPort(ABC):
@@ -21,6 +21,14 @@ class TokenPort(ABC):
     def generate_jti(self) -> str:
         """Generate a new unique JTI (JWT ID) for a share token."""
 
+    @abstractmethod
+    async def allocate_revocation_index(self, tenant_id: str) -> Optional[int]:
+        """Allocate a new link's bit in the tenant's revocation list.
+
+        Returns ``None`` when no revocation list is kept; such links are
+        revoked by JTI.
+        """
+
     @abstractmethod
     def encode_share_token(
         self,
@@ -32,28 +40,70 @@ class TokenPort(ABC):
         expires_at: datetime,
         permissions: Dict[str, bool],
         require_email: bool,
+        token_version: int = 0,
+        revocation_index: Optional[int] = None,
     ) -> str:
         """Create a JWT string representing a share link.
 
         The claims should include the tenant, document, link ID, JTI,
-        expiry and any additional permissions required by the viewer.
+        expiry, the tenant token version the link was minted under, its
+        revocation list index (if any) and any additional permissions
+        required by the viewer.
         """
 
     @abstractmethod
-    def decode_share_token(self, token: str) -> Dict[str, Any]:
+    async def decode_share_token(self, token: str) -> Dict[str, Any]:
         """Decode and validate a share token.
 
-        This method should verify the signature, expiry and ensure the
-        JTI has not been revoked.  It returns a dictionary of claims
-        extracted from the token.  An exception may be raised if the
-        token is invalid or expired.
+        This method should verify the signature, expiry and ensure
+        neither the link (by revocation index, else by JTI) nor the
+        token's version has been revoked.  It
+        returns the claims under canonical keys, whatever names the
+        token itself uses: ``tenant_id``, ``document_id``, ``link_id``,
+        ``jti``, ``expires_at``, ``permissions``, ``require_email``,
+        ``email`` (``None`` when absent), ``token_version`` and
+        ``revocation_index`` (``None`` when absent).  An exception may be
+        raised if the token is invalid or expired.
+        """
+
+    @abstractmethod
+    async def is_revoked(self, jti: str) -> bool:
+        """Return ``True`` if ``jti`` has been revoked.
+
+        Lets callers that cache decoded claims re-check revocation
+        without verifying the token again.
         """
 
     @abstractmethod
-    async def revoke_jti(self, jti: str, expires_at: datetime) -> None:
+    async def is_index_revoked(self, tenant_id: str, index: int) -> bool:
+        """Return ``True`` if bit ``index`` of the tenant's revocation list is set."""
+
+    @abstractmethod
+    async def revoke_jti(
+        self,
+        jti: str,
+        expires_at: datetime,
+        *,
+        tenant_id: Optional[str] = None,
+        revocation_index: Optional[int] = None,
+    ) -> None:
         """Mark a JTI as revoked until ``expires_at``.
 
         Revoking a JTI will cause calls to :meth:`decode_share_token`
-        with a token containing this JTI to fail.  Implementations
-        typically store the revoked JTI in a Bloom filter or set.
+        with a token containing this JTI to fail.  When the link has a
+        ``revocation_index`` only that bit of the tenant's revocation
+        list is set; otherwise implementations typically store the
+        revoked JTI in a Bloom filter or set.
+        """
+
+    @abstractmethod
+    async def token_version(self, tenant_id: str) -> int:
+        """Current share-token version of a tenant; tokens minted under an older one are revoked."""
+
+    @abstractmethod
+    async def bump_token_version(self, tenant_id: str) -> int:
+        """Revoke every share token of a tenant at once by advancing its version.
+
+        Costs one counter per tenant instead of one entry per revoked
+        JTI.  Returns the new version, which new links are minted with.
         """
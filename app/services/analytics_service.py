@@ -9,9 +9,8 @@ average time on page and other insights.
 """
 from __future__ import annotations
 
-from typing import Dict, Iterable
+from typing import Dict
 
-from app.domain import ViewEvent
 from app.ports.storage_port import StoragePort
 
 
@@ -24,16 +23,9 @@ class AnalyticsService:
     async def get_document_metrics(self, *, tenant_id: str, document_id: str) -> Dict[str, int]:
         """Return simple metrics for a document.
 
-        Currently returns ``unique_visitors`` and ``total_views``.  Uses
-        the storage port to query persisted events.  Additional metrics
+        Currently returns ``unique_visitors`` and ``total_views``.  The
+        aggregation is delegated to the storage port so SQL backends
+        return two counts instead of every event.  Additional metrics
         can be added as needed.
         """
-        events: Iterable[ViewEvent] = await self._storage.list_view_events(
-            tenant_id=tenant_id, document_id=document_id
-        )
-        unique_visitors = {e.visitor_session_id for e in events}
-        total_views = sum(1 for e in events if e.event_type == e.event_type.PAGE_VIEW)
-        return {
-            "unique_visitors": len(unique_visitors),
-            "total_views": total_views,
-        }
+        return await self._storage.get_document_metrics(tenant_id=tenant_id, document_id=document_id)
@@ -10,20 +10,20 @@ uploaded file and stores metadata about it.
 """
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Iterable
+from typing import Any, AsyncIterator, Dict, List, Sequence
 
-from app.domain import Document
+from app.domain import Document, DocumentCreated
 from app.ports.storage_port import StoragePort
-from app.ports import EventBusPort
+from app.ports import ClockPort, EventBusPort
 
 
 class DocumentService:
     """Service responsible for document lifecycle operations."""
 
-    def __init__(self, storage: StoragePort, event_bus: EventBusPort) -> None:
+    def __init__(self, storage: StoragePort, event_bus: EventBusPort, clock: ClockPort) -> None:
         self._storage = storage
         self._event_bus = event_bus
+        self._clock = clock
 
     async def create_document(
         self,
@@ -70,20 +70,19 @@ class DocumentService:
             mime_type=mime_type,
             size=size,
             storage_key=storage_key,
-            created_at=datetime.utcnow(),
+            created_at=self._clock.now(),
             created_by=created_by,
         )
         await self._storage.save_document(document)
         await self._event_bus.publish_event(
             tenant_id,
-            "document.created",
-            {
-                "document_id": doc_id,
-                "name": name,
-                "mime_type": mime_type,
-                "size": size,
-                "created_by": created_by,
-            },
+            DocumentCreated(
+                document_id=doc_id,
+                name=name,
+                mime_type=mime_type,
+                size=size,
+                created_by=created_by,
+            ),
         )
         return document
 
@@ -95,6 +94,21 @@ class DocumentService:
         """
         return await self._storage.get_document(tenant_id=tenant_id, document_id=document_id)
 
-    async def list_documents(self, *, tenant_id: str) -> Iterable[Document]:
+    async def get_documents(self, *, tenant_id: str, document_ids: Sequence[str]) -> Dict[str, Document]:
+        """Retrieve several documents in one storage round-trip, keyed by ID.
+
+        Missing IDs (or those of another tenant) are absent from the result.
+        """
+        return await self._storage.get_documents_bulk(tenant_id=tenant_id, document_ids=document_ids)
+
+    async def list_documents(self, *, tenant_id: str) -> list[Document]:
         """List all documents belonging to a tenant."""
         return await self._storage.list_documents(tenant_id=tenant_id)
+
+    async def list_documents_columns(self, *, tenant_id: str) -> Dict[str, List[Any]]:
+        """List a tenant's documents column-wise (one list per field), for aggregate consumers."""
+        return await self._storage.list_documents_columns(tenant_id=tenant_id)
+
+    def iter_documents(self, *, tenant_id: str) -> AsyncIterator[Document]:
+        """Stream a tenant's documents without materialising the full list."""
+        return self._storage.iter_documents(tenant_id=tenant_id)
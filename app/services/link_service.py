@@ -8,22 +8,37 @@ determine how a document can be accessed by external visitors.
 """
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Iterable, Optional
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from typing import Dict, Iterable, Optional, Sequence
 
-from app.domain import ShareLink
+from cachetools import TLRUCache
+
+from app.domain import LinkCreated, LinkRevoked, LinksRevokedAll, ShareLink
 from app.ports.storage_port import StoragePort
 from app.ports.token_port import TokenPort
-from app.ports import EventBusPort
+from app.ports import ClockPort, EventBusPort
+from app.ports.clock import epoch_seconds
+
+logger = logging.getLogger(__name__)
 
 
 class LinkService:
     """Business logic for share link lifecycle."""
 
-    def __init__(self, storage: StoragePort, token_port: TokenPort, event_bus: EventBusPort) -> None:
+    def __init__(self, storage: StoragePort, token_port: TokenPort, event_bus: EventBusPort,
+                 clock: ClockPort) -> None:
         self._storage = storage
         self._token_port = token_port
         self._event_bus = event_bus
+        self._clock = clock
+        # Signed tokens keyed by (tenant, link, jti); a link's claims never change,
+        # so its token is signed once and kept until the link expires or is revoked.
+        self._tokens: TLRUCache[tuple, tuple[str, float]] = TLRUCache(
+            maxsize=10_000, ttu=lambda _key, value, _now: value[1], timer=time.time
+        )
 
     async def create_share_link(
         self,
@@ -44,10 +59,73 @@ class LinkService:
         expected to use the :meth:`generate_share_token` method to
         obtain the actual token string.
         """
+        share_link = await self._new_share_link(
+            tenant_id=tenant_id,
+            document_id=document_id,
+            created_by=created_by,
+            expires_in_seconds=expires_in_seconds,
+            can_download=can_download,
+            can_print=can_print,
+            require_email=require_email,
+            allowed_emails=allowed_emails,
+        )
+        await self._storage.save_share_link(share_link)
+        await self._publish_created(share_link)
+        return share_link
+
+    async def create_share_link_if_document_exists(
+        self,
+        *,
+        tenant_id: str,
+        document_id: str,
+        created_by: str,
+        expires_in_seconds: int,
+        can_download: bool = False,
+        can_print: bool = False,
+        require_email: bool = False,
+        allowed_emails: Optional[list[str]] = None,
+    ) -> ShareLink:
+        """Like :meth:`create_share_link`, but checks the document exists in the same storage call.
+
+        Raises :class:`~app.ports.storage_port.DocumentNotFound` if the
+        document does not exist for the tenant.
+        """
+        share_link = await self._new_share_link(
+            tenant_id=tenant_id,
+            document_id=document_id,
+            created_by=created_by,
+            expires_in_seconds=expires_in_seconds,
+            can_download=can_download,
+            can_print=can_print,
+            require_email=require_email,
+            allowed_emails=allowed_emails,
+        )
+        await self._storage.save_share_link_if_document_exists(share_link)
+        await self._publish_created(share_link)
+        return share_link
+
+    async def _new_share_link(
+        self,
+        *,
+        tenant_id: str,
+        document_id: str,
+        created_by: str,
+        expires_in_seconds: int,
+        can_download: bool,
+        can_print: bool,
+        require_email: bool,
+        allowed_emails: Optional[list[str]],
+    ) -> ShareLink:
         link_id = self._storage.generate_id("link")
         jti = self._token_port.generate_jti()
-        expires_at = datetime.utcnow() + timedelta(seconds=expires_in_seconds)
-        share_link = ShareLink(
+        # One reading anchors both created_at and the expiry
+        now = self._clock.now()
+        expires_at = now + timedelta(seconds=expires_in_seconds)
+        token_version, revocation_index = await asyncio.gather(
+            self._token_port.token_version(tenant_id),
+            self._token_port.allocate_revocation_index(tenant_id),
+        )
+        return ShareLink(
             id=link_id,
             tenant_id=tenant_id,
             document_id=document_id,
@@ -55,28 +133,34 @@ class LinkService:
             expires_at=expires_at,
             can_download=can_download,
             can_print=can_print,
-            require_email=require_email,
-            allowed_emails=allowed_emails or [],
+            # An allow-list is only enforced on links that ask for an email
+            require_email=require_email or bool(allowed_emails),
+            allowed_emails=allowed_emails,
+            token_version=token_version,
+            revocation_index=revocation_index,
             revoked_at=None,
-            created_at=datetime.utcnow(),
+            created_at=now,
             created_by=created_by,
         )
-        await self._storage.save_share_link(share_link)
+
+    async def _publish_created(self, share_link: ShareLink) -> None:
         await self._event_bus.publish_event(
-            tenant_id,
-            "link.created",
-            {
-                "link_id": link_id,
-                "document_id": document_id,
-                "created_by": created_by,
-                "expires_at": expires_at.isoformat(),
-            },
+            share_link.tenant_id,
+            LinkCreated(
+                link_id=share_link.id,
+                document_id=share_link.document_id,
+                created_by=share_link.created_by,
+                expires_at=share_link.expires_at,
+            ),
         )
-        return share_link
 
     async def generate_share_token(self, link: ShareLink) -> str:
-        """Generate a signed JWT string for a share link."""
-        return self._token_port.encode_share_token(
+        """Generate a signed JWT string for a share link (signed once per link, then cached)."""
+        key = (link.tenant_id, link.id, link.jti)
+        cached = self._tokens.get(key)
+        if cached is not None:
+            return cached[0]
+        token = self._token_port.encode_share_token(
             tenant_id=link.tenant_id,
             document_id=link.document_id,
             link_id=link.id,
@@ -87,36 +171,73 @@ class LinkService:
                 "print": link.can_print,
             },
             require_email=link.require_email,
+            token_version=link.token_version,
+            revocation_index=link.revocation_index,
         )
+        self._tokens[key] = (token, epoch_seconds(link.expires_at))
+        return token
 
     async def revoke_share_link(self, *, tenant_id: str, link_id: str, revoked_by: str) -> None:
         """Revoke an existing share link.
 
-        Revoking a link sets ``revoked_at`` on the record and adds the
-        link's JTI to the revocation list via the token port.  Visitors
+        Revoking a link sets ``revoked_at`` on the record and, via the
+        token port, sets the link's bit in the tenant's revocation list
+        (or records its JTI when it has no index).  Visitors
         with the old token will be blocked immediately.
         """
         link = await self._storage.get_share_link(tenant_id=tenant_id, link_id=link_id)
         if link is None:
             return
-        now = datetime.utcnow()
-        # Persist revocation on the link record
-        await self._storage.revoke_share_link(tenant_id=tenant_id, link_id=link_id, revoked_at=now)
-        # Record the JTI in the revocation set so tokens are invalidated
-        await self._token_port.revoke_jti(link.jti, expires_at=link.expires_at)
+        now = self._clock.now()
+        self._tokens.pop((tenant_id, link_id, link.jti), None)
+        # Persist revocation on the link record and in the revocation
+        # store; the two are independent, so they run concurrently.
+        results = await asyncio.gather(
+            self._storage.revoke_share_link(tenant_id=tenant_id, link_id=link_id, revoked_at=now),
+            self._token_port.revoke_jti(
+                link.jti,
+                expires_at=link.expires_at,
+                tenant_id=tenant_id,
+                revocation_index=link.revocation_index,
+            ),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        for error in errors:
+            logger.error("Revoking share link %s partially failed", link_id, exc_info=error)
+        if errors:
+            raise errors[0]
         await self._event_bus.publish_event(
             tenant_id,
-            "link.revoked",
-            {
-                "link_id": link_id,
-                "revoked_by": revoked_by,
-            },
+            LinkRevoked(link_id=link_id, revoked_by=revoked_by),
+        )
+
+    @staticmethod
+    def email_allowed(link: ShareLink, email: str) -> bool:
+        """Whether ``email`` may open ``link`` (any email when the link has no allow-list)."""
+        return not link.allowed_emails or email.strip().lower() in link.allowed_emails
+
+    async def revoke_all_share_links(self, *, tenant_id: str, revoked_by: str) -> None:
+        """Revoke every share link of a tenant in one step.
+
+        Bumps the tenant's token version instead of recording each JTI:
+        every token minted before the bump stops decoding, whatever
+        link it belongs to.  Links created afterwards are unaffected.
+        """
+        version = await self._token_port.bump_token_version(tenant_id)
+        await self._event_bus.publish_event(
+            tenant_id,
+            LinksRevokedAll(token_version=version, revoked_by=revoked_by),
         )
 
     async def get_share_link(self, *, tenant_id: str, link_id: str) -> ShareLink | None:
         """Fetch a share link by ID."""
         return await self._storage.get_share_link(tenant_id=tenant_id, link_id=link_id)
 
+    async def get_share_links(self, *, tenant_id: str, link_ids: Sequence[str]) -> Dict[str, ShareLink]:
+        """Fetch several share links in one storage round-trip, keyed by ID."""
+        return await self._storage.get_share_links_bulk(tenant_id=tenant_id, link_ids=link_ids)
+
     async def list_share_links(self, *, tenant_id: str, document_id: Optional[str] = None) -> Iterable[ShareLink]:
         """List share links for a tenant, optionally filtered by document."""
         return await self._storage.list_share_links(tenant_id=tenant_id, document_id=document_id)
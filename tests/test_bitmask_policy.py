@@ -0,0 +1,9 @@
+from app.adapters.policy_evaluator.hex_iam_policy import HexIamBitmaskEvaluator
+
+
+def test_malformed_grant_only_denies_its_own_resource():
+    policy = HexIamBitmaskEvaluator().compile({"doc:1": "not-a-mask", "doc:2": 3, "doc:3": None})
+
+    assert not policy.evaluate("read", "doc:1")
+    assert policy.evaluate_all(["read", "write"], "doc:2")
+    assert not policy.evaluate("read", "doc:3")
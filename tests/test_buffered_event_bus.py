@@ -0,0 +1,11 @@
+from app.adapters import BufferedEventBus, NoopEventBus
+from app.domain.events import LinkRevoked
+
+
+async def test_full_buffer_drops_instead_of_failing_the_caller():
+    bus = BufferedEventBus(NoopEventBus(), maxsize=1)
+
+    await bus.publish_event("t1", LinkRevoked(link_id="a", revoked_by="u1"))
+    await bus.publish_event("t1", LinkRevoked(link_id="b", revoked_by="u1"))
+
+    assert bus.dropped == 1
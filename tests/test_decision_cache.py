@@ -0,0 +1,141 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.adapters.access_control.decision_cache import DecisionCache, decision_key
+from app.adapters.access_control.pdp import PDPAccessControl
+from app.ports.access_control import ResourceCtx
+from app.ports.authn import Principal
+
+DOC = ResourceCtx(type="document", id="doc")
+
+
+def _principal(**claims) -> Principal:
+    return Principal.from_claims({"tenant_id": "t1", "sub": "u1", "exp": int(time.time()) + 3600, **claims})
+
+
+async def test_concurrent_misses_share_one_load():
+    cache = DecisionCache(ttl_s=30)
+    calls = 0
+    release = asyncio.Event()
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return _principal()
+
+    key = decision_key("token", "read", DOC, None)
+    waiters = [asyncio.create_task(cache.get_or_load(key, loader)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    principals = await asyncio.gather(*waiters)
+
+    assert calls == 1
+    assert all(p is principals[0] for p in principals)
+    assert cache.get(key) is principals[0]
+
+
+async def test_concurrent_misses_share_the_failure_and_it_is_not_cached():
+    cache = DecisionCache(ttl_s=30)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        raise RuntimeError("pdp down")
+
+    key = decision_key("token", "read", DOC, None)
+    results = await asyncio.gather(*(cache.get_or_load(key, loader) for _ in range(3)), return_exceptions=True)
+
+    assert calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cache.get(key) is None
+
+
+async def test_cancelled_caller_does_not_cancel_the_shared_load():
+    cache = DecisionCache(ttl_s=30)
+    release = asyncio.Event()
+
+    async def loader():
+        await release.wait()
+        return _principal()
+
+    key = decision_key("token", "read", DOC, None)
+    first = asyncio.create_task(cache.get_or_load(key, loader))
+    second = asyncio.create_task(cache.get_or_load(key, loader))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert (await second).subject == "u1"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+async def test_stale_decision_is_only_served_by_get_stale():
+    cache = DecisionCache(ttl_s=0.01, stale_ttl_s=60)
+    key = decision_key("token", "read", DOC, None)
+
+    async def loader():
+        return _principal()
+
+    principal = await cache.get_or_load(key, loader)
+    await asyncio.sleep(0.02)
+
+    assert cache.get(key) is None
+    assert cache.get_stale(key) is principal
+
+
+async def test_pdp_serves_stale_decision_when_hexiam_is_unreachable():
+    reachable = True
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if not reachable:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"allow": True, "principal": {"tenant_id": "t1", "sub": "u1"}})
+
+    cache = DecisionCache(ttl_s=0.01, stale_ttl_s=60)
+    pdp = PDPAccessControl(
+        iam_url="http://iam", client_id="", client_secret="", cache=cache,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    assert (await pdp.authorize(bearer_token="token", action="read")).subject == "u1"
+    reachable = False
+    await asyncio.sleep(0.02)
+
+    assert (await pdp.authorize(bearer_token="token", action="read")).subject == "u1"
+    with pytest.raises(httpx.ConnectError):
+        await pdp.authorize(bearer_token="other-token", action="read")
+
+
+async def test_pdp_cache_key_covers_resource_type_attrs_and_context():
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json={"allow": True, "principal": {"tenant_id": "t1", "sub": "u1"}})
+
+    pdp = PDPAccessControl(
+        iam_url="http://iam", client_id="", client_secret="", cache=DecisionCache(ttl_s=30),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    await pdp.authorize(bearer_token="token", action="read", resource=DOC)
+    assert pdp.try_authorize_cached(bearer_token="token", action="read", resource=DOC) is not None
+
+    for resource, context in (
+        (ResourceCtx(type="folder", id="doc"), None),
+        (ResourceCtx.from_dict("document", "doc", {"owner": "u2"}), None),
+        (DOC, {"ip": "10.0.0.1"}),
+    ):
+        assert pdp.try_authorize_cached(bearer_token="token", action="read", resource=resource,
+                                        context=context) is None
+        await pdp.authorize(bearer_token="token", action="read", resource=resource, context=context)
+
+    assert calls == 4
@@ -0,0 +1,20 @@
+from app.adapters.auth.hex_iam import HEXIAMAuthenticator
+
+SECRET = "hexshare-test-secret-" * 4
+
+
+def test_principals_without_a_numeric_exp_are_cached_for_the_ttl(monkeypatch):
+    authenticator = HEXIAMAuthenticator(jwt_secret=SECRET, expected_aud="hexshare", cache_ttl_s=60)
+    decoded = []
+
+    def decode(token):
+        decoded.append(token)
+        return {"tenant_id": "t1", "sub": "u1", "exp": "never" if token == "string-exp" else None}
+
+    monkeypatch.setattr(authenticator, "_decode_token", decode)
+
+    for token in ("string-exp", "no-exp"):
+        assert authenticator.authenticate(token).expires_at is None
+        assert authenticator.authenticate(token).subject == "u1"
+
+    assert decoded == ["string-exp", "no-exp"]
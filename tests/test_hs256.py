@@ -0,0 +1,64 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+
+from app.adapters.hs256 import HS256Verifier
+from app.adapters.jwt_token import JWTTokenAdapter
+
+SECRET = "hexshare-test-secret-" * 4
+
+
+def test_tokens_round_trip_and_interoperate_with_pyjwt():
+    verifier = HS256Verifier(SECRET)
+    payload = {"sub": "doc", "exp": int(time.time()) + 60, "perms": {"download": True}}
+
+    token = verifier.encode(payload)
+
+    assert verifier.decode(token) == payload
+    assert jwt.decode(token, SECRET, algorithms=["HS256"]) == payload
+    assert verifier.decode(jwt.encode(payload, SECRET, algorithm="HS256")) == payload
+
+
+def test_wrong_secret_tampered_payload_and_expiry_are_rejected():
+    exp = int(time.time()) + 60
+    token = HS256Verifier(SECRET).encode({"sub": "doc", "exp": exp})
+    forged = HS256Verifier("forger").encode({"sub": "other-doc", "exp": exp})
+    header, _, signature = token.split(".")
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        HS256Verifier("other").decode(token)
+    with pytest.raises(jwt.InvalidSignatureError):
+        HS256Verifier(SECRET).decode(f"{header}.{forged.split('.')[1]}.{signature}")
+    with pytest.raises(jwt.ExpiredSignatureError):
+        HS256Verifier(SECRET).decode(HS256Verifier(SECRET).encode({"exp": int(time.time()) - 1}))
+
+
+def test_other_algorithms_are_refused():
+    token = jwt.encode({"sub": "doc"}, SECRET, algorithm="HS512")
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        HS256Verifier(SECRET).decode(token)
+
+
+async def test_share_token_claims_round_trip():
+    adapter = JWTTokenAdapter(SECRET)
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    token = adapter.encode_share_token(
+        tenant_id="t1", document_id="doc", link_id="link", jti="jti-1", expires_at=expires_at,
+        permissions={"download": True, "print": False}, require_email=True, token_version=2,
+        revocation_index=7,
+    )
+
+    assert await adapter.decode_share_token(token) == {
+        "tenant_id": "t1",
+        "document_id": "doc",
+        "link_id": "link",
+        "jti": "jti-1",
+        "expires_at": int(expires_at.timestamp()),
+        "permissions": {"download": True, "print": False},
+        "require_email": True,
+        "email": None,
+        "token_version": 2,
+        "revocation_index": 7,
+    }
@@ -0,0 +1,28 @@
+from datetime import datetime, timedelta, timezone
+
+from app.adapters.jwt_token import JWTTokenAdapter
+from app.domain import ShareLink
+from app.ports.clock import epoch_seconds
+from app.services import LinkService
+
+
+def test_epoch_seconds_keeps_aware_offsets_and_reads_naive_as_utc():
+    moment = datetime(2030, 1, 1, 12, 0, tzinfo=timezone.utc)
+    assert epoch_seconds(moment.astimezone(timezone(timedelta(hours=5)))) == moment.timestamp()
+    assert epoch_seconds(moment.replace(tzinfo=None)) == moment.timestamp()
+
+
+async def test_share_token_is_cached_until_an_aware_non_utc_expiry():
+    tokens = JWTTokenAdapter("secret")
+    service = LinkService(None, tokens, None, None)
+    expires_at = datetime.now(timezone(timedelta(hours=-8))) + timedelta(hours=1)
+    link = ShareLink(
+        id="link", tenant_id="t1", document_id="doc", jti="jti-1", expires_at=expires_at,
+        created_at=expires_at - timedelta(hours=1), created_by="u1",
+    )
+
+    token = await service.generate_share_token(link)
+
+    assert await service.generate_share_token(link) == token
+    assert service._tokens[("t1", "link", "jti-1")][1] == expires_at.timestamp()
+    assert (await tokens.decode_share_token(token))["expires_at"] == int(expires_at.timestamp())
@@ -0,0 +1,19 @@
+from app.main import create_app
+
+
+def _response_schema(spec, path, method):
+    return spec["paths"][path][method]["responses"]["200"]["content"]["application/json"]["schema"]
+
+
+def test_struct_routes_document_their_response_bodies():
+    spec = create_app().openapi()
+
+    document = _response_schema(spec, "/api/v1/documents/{document_id}", "get")
+    assert document["title"] == "Document"
+    assert "storage_key" in document["properties"]
+
+    listing = _response_schema(spec, "/api/v1/documents", "get")
+    assert listing["type"] == "array" and listing["items"]["title"] == "Document"
+
+    link = _response_schema(spec, "/api/v1/documents/{document_id}/links", "post")
+    assert link["title"] == "ShareLink" and "revocation_index" in link["properties"]
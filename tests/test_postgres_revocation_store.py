@@ -0,0 +1,92 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.adapters.revocation import postgres_store
+from app.adapters.revocation.postgres_store import CHANNEL, PostgresRevocationStore
+
+
+class _FakeConnection:
+    def __init__(self, revoked: list[dict]) -> None:
+        self.revoked = revoked
+        self.listeners: dict[str, object] = {}
+        self.termination_listeners: set = set()
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    async def remove_listener(self, channel, _callback):
+        self.listeners.pop(channel, None)
+
+    def add_termination_listener(self, callback):
+        self.termination_listeners.add(callback)
+
+    def remove_termination_listener(self, callback):
+        self.termination_listeners.discard(callback)
+
+    async def fetch(self, sql, *args):
+        if "share_links" in sql:
+            return [row for row in self.revoked if row["expires_at"] > args[0]]
+        return []
+
+    def terminate(self):
+        for callback in list(self.termination_listeners):
+            callback(self)
+
+
+class _FakePool:
+    def __init__(self) -> None:
+        self.revoked: list[dict] = []
+        self.connections: list[_FakeConnection] = []
+
+    async def acquire(self):
+        con = _FakeConnection(self.revoked)
+        self.connections.append(con)
+        return con
+
+    async def release(self, _con):
+        return None
+
+
+def _naive_utc(delta: timedelta) -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None) + delta
+
+
+async def test_start_loads_only_unexpired_revocations():
+    pool = _FakePool()
+    pool.revoked += [
+        {"jti": "live", "expires_at": _naive_utc(timedelta(hours=1))},
+        {"jti": "expired", "expires_at": _naive_utc(-timedelta(hours=1))},
+    ]
+    store = PostgresRevocationStore(pool)
+    await store.start()
+
+    assert await store.is_revoked("live")
+    assert not await store.is_revoked("expired")
+
+
+async def test_notifications_reach_the_local_set():
+    pool = _FakePool()
+    store = PostgresRevocationStore(pool)
+    await store.start()
+
+    pool.connections[-1].listeners[CHANNEL](None, 0, CHANNEL, f"jti-1 {time.time() + 60}")
+
+    assert await store.is_revoked("jti-1")
+
+
+async def test_lost_listen_connection_reconnects_and_reloads(monkeypatch):
+    monkeypatch.setattr(postgres_store, "_RECONNECT_S", 0)
+    pool = _FakePool()
+    store = PostgresRevocationStore(pool)
+    await store.start()
+
+    pool.connections[-1].terminate()
+    # Revoked while no worker was listening
+    pool.revoked.append({"jti": "missed", "expires_at": _naive_utc(timedelta(hours=1))})
+    await asyncio.sleep(0.01)
+
+    assert len(pool.connections) == 2
+    assert CHANNEL in pool.connections[-1].listeners
+    assert await store.is_revoked("missed")
+    await store.aclose()
@@ -0,0 +1,20 @@
+from app.ports.authn import Principal
+
+
+def test_string_roles_claim_is_one_role():
+    assert Principal.from_claims({"tenant_id": "t1", "sub": "u1", "roles": "admin"}).roles == ("admin",)
+
+
+def test_roles_list_and_single_role_claim():
+    assert Principal.from_claims({"roles": ["admin", "viewer"]}).roles == ("admin", "viewer")
+    assert Principal.from_claims({"role": "viewer"}).roles == ("viewer",)
+    assert Principal.from_claims({}).roles == ()
+
+
+def test_numeric_date_claims_are_coerced():
+    principal = Principal.from_claims({"iat": "1700000000", "exp": 1700003600.5})
+
+    assert (principal.issued_at, principal.expires_at) == (1700000000, 1700003600)
+    assert Principal.from_claims({"exp": "soon"}).expires_at is None
+    assert Principal.from_claims({"exp": True}).expires_at is None
+    assert Principal.from_claims({}).expires_at is None
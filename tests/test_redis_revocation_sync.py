@@ -0,0 +1,64 @@
+import asyncio
+
+from app.adapters.revocation import RedisRevocationStore
+
+
+class _PubSub:
+    def __init__(self, messages: list[tuple[bytes, bytes]]) -> None:
+        self.messages = messages
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def subscribe(self, *channels):
+        pass
+
+    async def get_message(self, *, ignore_subscribe_messages, timeout):
+        if self.messages:
+            channel, data = self.messages.pop(0)
+            return {"type": "message", "channel": channel, "data": data}
+        await asyncio.sleep(min(timeout, 0.01))
+        return None
+
+
+class _FakeRedis:
+    def __init__(self, messages: list[tuple[bytes, bytes]]) -> None:
+        self._pubsub = _PubSub(messages)
+
+    def pubsub(self):
+        return self._pubsub
+
+    async def aclose(self):
+        pass
+
+    async def scan_iter(self, *, match, count):
+        for key in ():
+            yield key
+
+
+async def test_malformed_messages_do_not_stop_the_sync():
+    client = _FakeRedis([
+        (b"token_version", b"t1 not-a-number"),
+        (b"revoked_index", b"t1 -3"),
+        (b"revoked", b"\xff\xfe"),
+        (b"token_version", b"t1 4"),
+        (b"revoked", b"jti-1"),
+    ])
+    store = RedisRevocationStore(client)
+    await store.start()
+    try:
+        for _ in range(100):
+            if not client.pubsub().messages:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.01)
+
+        assert not store._task.done()
+        assert store._bloom_ready
+        assert await store.token_version("t1") == 4
+        assert "jti-1" in store._bloom
+    finally:
+        await store.aclose()
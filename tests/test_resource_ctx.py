@@ -0,0 +1,19 @@
+from app.ports.access_control import ResourceCtx
+
+
+def test_nested_attributes_are_hashable():
+    attrs = {"owner": {"id": "u1", "groups": ["a", "b"]}, "tags": {"x", "y"}, "size": 3}
+
+    first = ResourceCtx.from_dict("document", "d1", attrs)
+    second = ResourceCtx.from_dict("document", "d1", dict(reversed(list(attrs.items()))))
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert {first: "allow"}[second] == "allow"
+
+
+def test_attributes_change_the_key():
+    base = ResourceCtx.from_dict("document", "d1", {"owner": {"id": "u1"}})
+
+    assert base != ResourceCtx.from_dict("document", "d1", {"owner": {"id": "u2"}})
+    assert base != ResourceCtx.from_dict("folder", "d1", {"owner": {"id": "u1"}})
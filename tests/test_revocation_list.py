@@ -0,0 +1,133 @@
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+
+from app.adapters.jwt_token import JWTTokenAdapter
+from app.adapters.revocation import MemoryRevocationStore, RedisRevocationStore
+from app.adapters.revocation.bitstring import RevocationList
+
+
+class _FakeRedis:
+    """The handful of Redis string commands the store uses, held in a dict."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytearray] = {}
+        self.gets = 0
+
+    async def get(self, key):
+        self.gets += 1
+        value = self.data.get(key)
+        return None if value is None else bytes(value)
+
+    async def setbit(self, key, index, value):
+        bits = RevocationList(self.data.get(key, b""))
+        bits.set(index)
+        self.data[key] = bits._bits
+
+    async def getbit(self, key, index):
+        return int(RevocationList(self.data.get(key, b""))[index])
+
+    async def publish(self, _channel, _message):
+        return 0
+
+
+class _CounterPool:
+    """Stands in for the Postgres pool: one durable counter per tenant."""
+
+    def __init__(self) -> None:
+        self.next_index: dict[str, int] = {}
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self
+
+    async def fetchval(self, _sql, tenant_id):
+        index = self.next_index.get(tenant_id, 0)
+        self.next_index[tenant_id] = index + 1
+        return index
+
+
+def _encode(adapter: JWTTokenAdapter, *, jti: str, revocation_index) -> str:
+    return adapter.encode_share_token(
+        tenant_id="t1",
+        document_id="doc",
+        link_id=jti,
+        jti=jti,
+        expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+        permissions={},
+        require_email=False,
+        revocation_index=revocation_index,
+    )
+
+
+def test_revocation_list_bits_match_redis_order():
+    bits = RevocationList()
+    bits.set(0)
+    bits.set(9)
+    assert bytes(bits._bits) == b"\x80\x40"
+    assert bits[0] and bits[9]
+    assert not bits[1] and not bits[1000]
+
+
+async def test_memory_store_does_not_allocate_indexes():
+    # A per-process counter restarts at 0 and would reuse indexes of stored links
+    assert await MemoryRevocationStore().allocate_revocation_index("t1") is None
+
+
+async def test_links_without_index_are_revoked_by_jti():
+    adapter = JWTTokenAdapter("secret", revocation_store=MemoryRevocationStore())
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    revoked = _encode(adapter, jti="a", revocation_index=None)
+    kept = _encode(adapter, jti="b", revocation_index=None)
+
+    await adapter.revoke_jti("a", expires_at, tenant_id="t1", revocation_index=None)
+
+    with pytest.raises(jwt.InvalidTokenError):
+        await adapter.decode_share_token(revoked)
+    assert (await adapter.decode_share_token(kept))["jti"] == "b"
+
+
+async def test_indexes_stay_unique_across_store_restarts():
+    pool = _CounterPool()
+    before = RedisRevocationStore(_FakeRedis(), pool=pool)
+    after = RedisRevocationStore(_FakeRedis(), pool=pool)
+
+    assert [await before.allocate_revocation_index("t1") for _ in range(2)] == [0, 1]
+    assert await after.allocate_revocation_index("t1") == 2
+    assert await after.allocate_revocation_index("t2") == 0
+
+
+async def test_redis_store_without_pool_falls_back_to_jti():
+    assert await RedisRevocationStore(_FakeRedis()).allocate_revocation_index("t1") is None
+
+
+async def test_revoking_by_index_only_revokes_that_link():
+    client = _FakeRedis()
+    store = RedisRevocationStore(client, pool=_CounterPool())
+    adapter = JWTTokenAdapter("secret", revocation_store=store)
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    first, second = (
+        await adapter.allocate_revocation_index("t1"),
+        await adapter.allocate_revocation_index("t1"),
+    )
+    revoked = _encode(adapter, jti="a", revocation_index=second)
+    kept = _encode(adapter, jti="b", revocation_index=first)
+
+    await adapter.revoke_jti("a", expires_at, tenant_id="t1", revocation_index=second)
+
+    with pytest.raises(jwt.InvalidTokenError):
+        await adapter.decode_share_token(revoked)
+    assert (await adapter.decode_share_token(kept))["revocation_index"] == first
+
+
+async def test_index_lookup_reads_one_bit_while_unsubscribed():
+    client = _FakeRedis()
+    await client.setbit("revocation_list:t1", 5, 1)
+    store = RedisRevocationStore(client)
+
+    assert await store.is_index_revoked("t1", 5)
+    assert not await store.is_index_revoked("t1", 6)
+    # No full-list GET without the subscription that would keep a copy current
+    assert client.gets == 0
@@ -0,0 +1,61 @@
+import itertools
+
+import httpx
+from fastapi import FastAPI
+
+from app.adapters.jwt_token import JWTTokenAdapter
+from app.adapters.noop_event_bus import NoopEventBus
+from app.adapters.persistence.memory_storage import MemoryStorage
+from app.adapters.system_clock import SystemClock
+from app.api.router import api_router
+from app.auth import ShareTokenDependency
+from app.services import LinkService
+
+SECRET = "hexshare-test-secret-" * 4
+
+
+class _TokenAdapter(JWTTokenAdapter):
+    _jtis = itertools.count()
+
+    def generate_jti(self) -> str:
+        return f"jti-{next(self._jtis)}"
+
+
+async def _setup() -> tuple[httpx.AsyncClient, LinkService]:
+    tokens = _TokenAdapter(SECRET)
+    app = FastAPI()
+    app.include_router(api_router())
+    app.state.link_service = service = LinkService(MemoryStorage(), tokens, NoopEventBus(), SystemClock())
+    app.state.share_auth = ShareTokenDependency(token_port=tokens)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test"), service
+
+
+async def _token(service: LinkService, **options) -> str:
+    link = await service.create_share_link(
+        tenant_id="t1", document_id="doc", created_by="u1", expires_in_seconds=3600, **options
+    )
+    return await service.generate_share_token(link)
+
+
+async def test_allow_list_is_matched_case_insensitively():
+    client, service = await _setup()
+    token = await _token(service, allowed_emails=[" Alice@Example.com "])
+
+    async with client:
+        allowed = await client.get(f"/view/{token}", params={"email": "ALICE@example.COM"})
+        other = await client.get(f"/view/{token}", params={"email": "bob@example.com"})
+        missing = await client.get(f"/view/{token}")
+
+    assert allowed.status_code == 200
+    assert (other.status_code, other.json()["detail"]) == (403, "Email not allowed for this link")
+    assert (missing.status_code, missing.json()["detail"]) == (401, "Email required")
+
+
+async def test_links_without_an_email_gate_open_for_anyone():
+    client, service = await _setup()
+    open_token = await _token(service)
+    any_email_token = await _token(service, require_email=True)
+
+    async with client:
+        assert (await client.get(f"/view/{open_token}")).status_code == 200
+        assert (await client.get(f"/view/{any_email_token}", params={"email": "bob@example.com"})).status_code == 200
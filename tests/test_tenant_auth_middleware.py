@@ -0,0 +1,87 @@
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.auth.middleware import TenantAuthMiddleware
+from app.auth.tenant_auth import CurrentPrincipal
+from app.core.authz import AUTH_COOKIE
+from app.ports.authn import Principal
+
+
+class _Authenticator:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.on_event_loop = False
+
+    def authenticate(self, token: str) -> Principal:
+        self.calls += 1
+        try:
+            asyncio.get_running_loop()
+            self.on_event_loop = True
+        except RuntimeError:
+            pass
+        if token == "good":
+            return Principal.from_claims({"tenant_id": "t1", "sub": "u1", "roles": ["admin"]})
+        if token == "no-tenant":
+            return Principal.from_claims({"sub": "u1"})
+        raise ValueError("bad token")
+
+
+def _client() -> tuple[TestClient, _Authenticator]:
+    app = FastAPI()
+    app.add_middleware(TenantAuthMiddleware)
+    app.state.authenticator = authenticator = _Authenticator()
+
+    @app.get("/me")
+    async def me(principal: CurrentPrincipal):
+        return {"tenant": principal.tenant_id, "user": principal.user_id, "roles": list(principal.roles)}
+
+    @app.get("/public")
+    async def public():
+        return {"ok": True}
+
+    return TestClient(app), authenticator
+
+
+def test_bearer_token_resolves_the_principal_once():
+    client, authenticator = _client()
+
+    response = client.get("/me", headers={"Authorization": "Bearer good"})
+
+    assert response.status_code == 200
+    assert response.json() == {"tenant": "t1", "user": "u1", "roles": ["admin"]}
+    assert authenticator.calls == 1
+
+
+def test_cookie_is_the_fallback():
+    client, _ = _client()
+    client.cookies.set(AUTH_COOKIE, "good")
+
+    assert client.get("/me").json()["tenant"] == "t1"
+
+
+def test_failures_are_401s_with_their_own_detail():
+    client, _ = _client()
+
+    missing = client.get("/me")
+    invalid = client.get("/me", headers={"Authorization": "Bearer bad"})
+    no_tenant = client.get("/me", headers={"Authorization": "Bearer no-tenant"})
+
+    assert (missing.status_code, missing.json()["detail"]) == (401, "Missing auth token")
+    assert (invalid.status_code, invalid.json()["detail"]) == (401, "Invalid or expired token")
+    assert (no_tenant.status_code, no_tenant.json()["detail"]) == (401, "Token missing tenant or user claims")
+
+
+def test_unauthenticated_routes_do_not_verify_the_token():
+    client, authenticator = _client()
+
+    assert client.get("/public", headers={"Authorization": "Bearer bad"}).status_code == 200
+    assert authenticator.calls == 0
+
+
+def test_verification_runs_off_the_event_loop():
+    client, authenticator = _client()
+
+    assert client.get("/me", headers={"Authorization": "Bearer good"}).status_code == 200
+    assert authenticator.calls == 1 and not authenticator.on_event_loop
@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+import redis.asyncio as redis
+
+from app.adapters.jwt_token import JWTTokenAdapter
+from app.adapters.revocation import MemoryRevocationStore, RedisRevocationStore
+
+
+def _encode(adapter: JWTTokenAdapter, *, token_version: int) -> str:
+    return adapter.encode_share_token(
+        tenant_id="t1",
+        document_id="doc",
+        link_id="link",
+        jti="jti-1",
+        expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+        permissions={"download": True, "print": False},
+        require_email=False,
+        token_version=token_version,
+    )
+
+
+class _UnreachableRedis:
+    """Stands in for a Redis client whose server is down."""
+
+    async def get(self, *_args, **_kwargs):
+        raise redis.ConnectionError("down")
+
+    incr = publish = get
+
+
+async def test_bump_revokes_tokens_minted_under_older_version():
+    adapter = JWTTokenAdapter("secret", revocation_store=MemoryRevocationStore())
+    old = _encode(adapter, token_version=await adapter.token_version("t1"))
+
+    assert await adapter.bump_token_version("t1") == 1
+
+    with pytest.raises(jwt.InvalidTokenError):
+        await adapter.decode_share_token(old)
+    new = _encode(adapter, token_version=await adapter.token_version("t1"))
+    assert (await adapter.decode_share_token(new))["token_version"] == 1
+
+
+async def test_bump_is_per_tenant():
+    store = MemoryRevocationStore()
+    await store.bump_token_version("t1")
+    assert await store.token_version("t1") == 1
+    assert await store.token_version("t2") == 0
+
+
+async def test_redis_bump_falls_back_to_local_version_when_redis_is_down():
+    store = RedisRevocationStore(_UnreachableRedis())
+
+    assert await store.bump_token_version("t1") == 1
+    assert await store.bump_token_version("t1") == 2
+    assert await store.token_version("t1") == 2